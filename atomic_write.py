@@ -0,0 +1,49 @@
+"""
+결과 파일을 임시 파일에 쓴 뒤 rename으로 한 번에 게시
+
+대상 경로에 직접 쓰다가 중간에 실패하면 반쯤 쓰인 파일이 업로드 디렉토리에 남는다.
+atomic_output은 같은 디렉토리의 임시 파일에 쓰고, 정상 종료 시 fsync 후 os.replace로
+대상 경로를 교체하며, 예외가 나면 임시 파일만 지운다. 따라서 대상 경로에는 항상
+이전 파일 또는 완성된 새 파일만 존재한다.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator
+
+
+def _default_file_mode() -> int:
+    """일반 open()으로 만든 파일과 같은 권한 (0666 & ~umask)"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+@contextmanager
+def atomic_output(target_path: str) -> Iterator[BinaryIO]:
+    """
+    대상 경로를 원자적으로 교체하는 쓰기용 파일 객체
+
+    Args:
+        target_path: 최종 파일 경로 (디렉토리가 없으면 생성)
+
+    Yields:
+        BinaryIO: 같은 디렉토리의 임시 파일
+    """
+    target_dir = os.path.dirname(os.path.abspath(target_path))
+    os.makedirs(target_dir, exist_ok=True)
+    descriptor, temp_path = tempfile.mkstemp(
+        dir=target_dir, prefix="." + os.path.basename(target_path) + ".", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(descriptor, "wb") as output:
+            yield output
+            output.flush()
+            os.fsync(output.fileno())
+        os.chmod(temp_path, _default_file_mode())
+        os.replace(temp_path, target_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
@@ -0,0 +1,143 @@
+"""
+Excel 날짜 값 변환 공용 모듈
+
+파서들이 공통으로 사용하는 날짜 변환 함수. 셀 하나를 변환하는 format_date와
+컬럼 전체를 한 번에 변환하는 format_date_column을 제공한다.
+
+- Excel 시리얼 번호는 1900 날짜 체계(1899-12-30 기준, 존재하지 않는
+  1900-02-29 이전 값은 하루 보정) 또는 1904 날짜 체계(1904-01-01 기준)로 변환
+- datetime / pandas Timestamp는 날짜 부분만 사용
+- 문자열은 YYYY-MM-DD면 그대로, 그 외 형식은 pandas로 해석
+- 단일 값 변환 결과는 캐시하여 반복되는 날짜는 한 번만 계산
+- 변환 결과는 항상 YYYY-MM-DD 문자열이며 빈 값은 ""
+
+numpy/pandas는 컬럼 변환과 비표준 문자열 해석에서만 필요하므로 해당 함수
+안에서 import한다 (셀 단위 파싱 경로의 기동 시간 단축).
+"""
+
+import math
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, List, Sequence
+
+PY_EPOCH_1900 = datetime(1899, 12, 30)
+PY_EPOCH_1904 = datetime(1904, 1, 1)
+NUMPY_EPOCH_1900 = "1899-12-30"
+NUMPY_EPOCH_1904 = "1904-01-01"
+
+# 발주일/납기일은 업로드 안에서 같은 값이 반복되므로 변환 결과를 캐시
+DATE_CACHE_SIZE = 4096
+
+
+def format_date(date_value: Any, date1904: bool = False) -> str:
+    """
+    날짜 값을 YYYY-MM-DD 형식으로 변환
+
+    Args:
+        date_value: Excel에서 읽은 날짜 값 (datetime, 시리얼 번호, 문자열 등)
+        date1904: 워크북이 1904 날짜 체계를 사용하는지 여부
+
+    Returns:
+        str: YYYY-MM-DD 형식의 날짜 문자열 (빈 값은 "")
+    """
+    # None, NaN, pandas NaT (NaN/NaT는 자기 자신과 같지 않음)
+    if date_value is None or date_value != date_value:
+        return ""
+
+    # numpy 스칼라(np.int64, np.float64 등)는 파이썬 값으로 변환
+    if type(date_value).__module__ == "numpy":
+        date_value = date_value.item()
+
+    if isinstance(date_value, (str, int, float, datetime, date)) and not isinstance(date_value, bool):
+        return _format_date_cached(date_value, date1904)
+
+    return str(date_value)
+
+
+def format_date_column(values: Sequence[Any], date1904: bool = False) -> List[str]:
+    """
+    날짜 값 컬럼 전체를 YYYY-MM-DD 문자열 리스트로 변환
+
+    고유값만 한 번씩 변환한 뒤 인덱스로 펼치며, 시리얼 번호는 numpy 배열 연산으로
+    한 번에 변환한다.
+
+    Args:
+        values: 날짜 값 시퀀스 (list, numpy 배열, pandas Series)
+        date1904: 워크북이 1904 날짜 체계를 사용하는지 여부
+
+    Returns:
+        List[str]: 입력과 같은 길이의 YYYY-MM-DD 문자열 리스트
+    """
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(values, pd.Series) and pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime("%Y-%m-%d").fillna("").tolist()
+
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    if len(uniques) == 0:
+        return [""] * len(codes)
+
+    unique_values = uniques.tolist()
+    converted = np.empty(len(unique_values) + 1, dtype=object)
+    converted[-1] = ""  # 결측값(코드 -1)
+
+    serial_positions = []
+    for position, value in enumerate(unique_values):
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and -1e6 < value < 3e6:
+            serial_positions.append(position)
+        else:
+            converted[position] = format_date(value, date1904)
+
+    if serial_positions:
+        serials = np.array([unique_values[p] for p in serial_positions], dtype=np.float64)
+        converted[serial_positions] = _format_serials(serials, date1904)
+
+    return converted[codes].tolist()
+
+
+def _format_serials(serials: "np.ndarray", date1904: bool) -> "np.ndarray":
+    """Excel 시리얼 번호 배열을 YYYY-MM-DD 문자열 배열로 변환"""
+    import numpy as np
+
+    days = np.floor(serials).astype(np.int64)
+    if date1904:
+        dates = np.datetime64(NUMPY_EPOCH_1904, "D") + days.astype("timedelta64[D]")
+    else:
+        # 1900-02-29(시리얼 60) 이전 값은 Excel의 윤년 버그만큼 하루 보정
+        days = days + ((serials > 0) & (serials < 60))
+        dates = np.datetime64(NUMPY_EPOCH_1900, "D") + days.astype("timedelta64[D]")
+    return np.datetime_as_string(dates, unit="D").astype(object)
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _format_date_cached(date_value: Any, date1904: bool) -> str:
+    """단일 값 변환 (결과 캐시)"""
+    if isinstance(date_value, (datetime, date)):
+        return date_value.strftime("%Y-%m-%d")
+
+    if isinstance(date_value, (int, float)):
+        try:
+            days = math.floor(date_value)
+            if date1904:
+                return (PY_EPOCH_1904 + timedelta(days=days)).strftime("%Y-%m-%d")
+            if 0 < date_value < 60:
+                days += 1
+            return (PY_EPOCH_1900 + timedelta(days=days)).strftime("%Y-%m-%d")
+        except (OverflowError, ValueError):
+            # 날짜 범위를 벗어난 숫자는 원래 값 그대로 반환
+            return str(date_value)
+
+    # 이미 YYYY-MM-DD 형식인지 확인
+    if len(date_value) == 10 and date_value.count("-") == 2:
+        return date_value
+
+    if not date_value.strip():
+        return ""
+
+    import pandas as pd
+
+    try:
+        return pd.to_datetime(date_value).strftime("%Y-%m-%d")
+    except (ValueError, TypeError, OverflowError):
+        return date_value
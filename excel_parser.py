@@ -1,56 +1,89 @@
-import pandas as pd
 import json
-from datetime import datetime
-from openpyxl import load_workbook
-from typing import List, Dict, Any, Optional
+import sys
+from typing import List, Dict, Any, Union
+from xlsx_reader import iter_sheet_rows, is_date1904
+from po_columnar import ColumnarTable, PURCHASE_ORDER_SCHEMA
+from po_schema_registry import get_row_converter
 
-def parse_excel_to_purchase_orders(file_path: str) -> List[Dict[str, Any]]:
+# purchase_orders 키 → 헤더 등록부 필드 (PURCHASE_ORDER_SCHEMA 순서)
+RECORD_FIELDS = {
+    "order_number": "orderNumber",
+    "order_date": "orderDate",
+    "item_name": "itemName",
+    "specification": "specification",
+    "quantity": "quantity",
+    "unit_price": "unitPrice",
+    "supply_amount": "supplyAmount",
+    "tax": "taxAmount",
+    "total_amount": "totalAmount",
+    "due_date": "dueDate",
+    "vendor_name": "vendorName",
+    "delivery_name": "deliveryName",
+    "note": "notes",
+}
+
+def parse_excel_to_purchase_orders(file_path: str, engine: str = "openpyxl",
+                                   columnar: bool = False) -> Union[List[Dict[str, Any]], ColumnarTable]:
     """
     Excel 파일의 "Input Sheet"를 파싱하여 purchase_orders 테이블 구조에 맞는 JSON 리스트로 반환
     
     Args:
         file_path: Excel 파일 경로
+        engine: 행 소스 ("openpyxl" 또는 시트 XML을 직접 읽는 "xml")
+        columnar: True면 dict 리스트 대신 컬럼형 테이블(ColumnarTable) 반환.
+                  to_records()로 같은 JSON 리스트를 만들 수 있음
         
     Returns:
         List[Dict]: purchase_orders 테이블 구조에 맞는 JSON 리스트
     """
     try:
-        # openpyxl을 사용하여 Excel 파일 로드
-        workbook = load_workbook(file_path, data_only=True)
-        
-        # "Input Sheet" 시트 선택
-        if "Input Sheet" not in workbook.sheetnames:
-            raise ValueError("'Input Sheet' 시트를 찾을 수 없습니다.")
-        
-        worksheet = workbook["Input Sheet"]
-        
-        # A열부터 M열까지, 2행부터 시작하는 모든 행 읽기
-        purchase_orders = []
+        # 워크북의 날짜 체계 (1900 / 1904)
+        date1904 = is_date1904(file_path)
+        
+        if engine == "xml":
+            # 시트 XML을 직접 읽어 1행(헤더)부터 읽기
+            rows = iter_sheet_rows(file_path, "Input Sheet")
+        elif engine == "openpyxl":
+            from openpyxl import load_workbook
+
+            # openpyxl을 사용하여 Excel 파일 로드
+            workbook = load_workbook(file_path, data_only=True)
+            
+            # "Input Sheet" 시트 선택
+            if "Input Sheet" not in workbook.sheetnames:
+                raise ValueError("'Input Sheet' 시트를 찾을 수 없습니다.")
+            
+            worksheet = workbook["Input Sheet"]
+            
+            # 1행(헤더)부터 모든 행 읽기
+            rows = worksheet.iter_rows(values_only=True)
+        else:
+            raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
+        
+        purchase_orders = ColumnarTable(PURCHASE_ORDER_SCHEMA) if columnar else []
+        
+        # 헤더 행으로 컬럼 위치를 정한 행 변환 함수 (모든 셀이 빈 행은 None)
+        rows = iter(rows)
+        header_row = next(rows, None)
+        if header_row is None:
+            return purchase_orders
+        convert = get_row_converter(header_row, fields=list(RECORD_FIELDS.values()),
+                                    number=safe_int, key_field=None).convert
+        keys = list(RECORD_FIELDS)
         
         # 행 순회 (2행부터 시작)
-        for row in worksheet.iter_rows(min_row=2, min_col=1, max_col=13, values_only=True):
-            # 빈 행 건너뛰기 (모든 셀이 비어있는 경우)
-            if all(cell is None or cell == "" for cell in row):
+        for row in rows:
+            values = convert(row, date1904)
+            if values is None:
                 continue
             
             # 각 행을 purchase_orders 구조에 매핑
-            order_data = {
-                "order_number": str(row[0]) if row[0] is not None else "",
-                "order_date": format_date(row[1]),
-                "item_name": str(row[2]) if row[2] is not None else "",
-                "specification": str(row[3]) if row[3] is not None else "",
-                "quantity": safe_int(row[4]),
-                "unit_price": safe_int(row[5]),
-                "supply_amount": safe_int(row[6]),
-                "tax": safe_int(row[7]),
-                "total_amount": safe_int(row[8]),
-                "due_date": format_date(row[9]),
-                "vendor_name": str(row[10]) if row[10] is not None else "",
-                "delivery_name": str(row[11]) if row[11] is not None else "",
-                "note": str(row[12]) if row[12] is not None else ""
-            }
+            order_data = dict(zip(keys, values))
             
-            purchase_orders.append(order_data)
+            if columnar:
+                purchase_orders.append_record(order_data)
+            else:
+                purchase_orders.append(order_data)
         
         return purchase_orders
         
@@ -58,52 +91,6 @@ def parse_excel_to_purchase_orders(file_path: str) -> List[Dict[str, Any]]:
         print(f"Excel 파싱 중 오류 발생: {str(e)}")
         return []
 
-def format_date(date_value: Any) -> str:
-    """
-    날짜 값을 YYYY-MM-DD 형식의 문자열로 변환
-    
-    Args:
-        date_value: Excel에서 읽은 날짜 값 (datetime, float, str 등)
-        
-    Returns:
-        str: YYYY-MM-DD 형식의 날짜 문자열
-    """
-    if date_value is None:
-        return ""
-    
-    try:
-        # datetime 객체인 경우
-        if isinstance(date_value, datetime):
-            return date_value.strftime("%Y-%m-%d")
-        
-        # Excel 시리얼 번호인 경우 (float)
-        if isinstance(date_value, (int, float)):
-            # Excel 시리얼 번호를 datetime으로 변환
-            # Excel의 1900년 1월 1일을 기준으로 계산
-            excel_epoch = datetime(1900, 1, 1)
-            # Excel은 1900-01-01을 1로 계산하므로 2를 빼야 함
-            converted_date = excel_epoch + pd.Timedelta(days=date_value - 2)
-            return converted_date.strftime("%Y-%m-%d")
-        
-        # 문자열인 경우
-        if isinstance(date_value, str):
-            # 이미 YYYY-MM-DD 형식인지 확인
-            if len(date_value) == 10 and date_value.count('-') == 2:
-                return date_value
-            
-            # 다른 형식의 날짜 문자열 파싱 시도
-            try:
-                parsed_date = pd.to_datetime(date_value)
-                return parsed_date.strftime("%Y-%m-%d")
-            except:
-                return str(date_value)
-        
-        return str(date_value)
-        
-    except Exception as e:
-        print(f"날짜 변환 중 오류 발생: {date_value} -> {str(e)}")
-        return str(date_value) if date_value is not None else ""
-
 def safe_int(value: Any) -> int:
     """
     값을 안전하게 정수로 변환
@@ -139,7 +126,7 @@ def safe_int(value: Any) -> int:
         return 0
         
     except Exception as e:
-        print(f"숫자 변환 중 오류 발생: {value} -> {str(e)}")
+        print(f"숫자 변환 중 오류 발생: {value} -> {str(e)}", file=sys.stderr)
         return 0
 
 def parse_excel_with_pandas(file_path: str) -> List[Dict[str, Any]]:
@@ -152,43 +139,35 @@ def parse_excel_with_pandas(file_path: str) -> List[Dict[str, Any]]:
     Returns:
         List[Dict]: purchase_orders 테이블 구조에 맞는 JSON 리스트
     """
+    import pandas as pd
+    from excel_vectorized import to_int_column, to_str_column, to_date_column, frame_to_records
+
     try:
-        # pandas로 Excel 파일 읽기
-        df = pd.read_excel(file_path, sheet_name="Input Sheet", header=None, skiprows=1)
-        
-        # 컬럼명 설정 (A열부터 M열까지)
-        column_names = [
-            "order_number", "order_date", "item_name", "specification",
-            "quantity", "unit_price", "supply_amount", "tax", "total_amount",
-            "due_date", "vendor_name", "delivery_name", "note"
-        ]
-        
-        # 13개 컬럼만 선택
-        df = df.iloc[:, :13]
-        df.columns = column_names
+        # pandas로 Excel 파일 읽기 (헤더는 1행)
+        df = pd.read_excel(file_path, sheet_name="Input Sheet", header=0)
         
         # 빈 행 제거
         df = df.dropna(how='all')
         
-        # 데이터 타입 변환
-        purchase_orders = []
-        for _, row in df.iterrows():
-            order_data = {
-                "order_number": str(row["order_number"]) if pd.notna(row["order_number"]) else "",
-                "order_date": format_date(row["order_date"]),
-                "item_name": str(row["item_name"]) if pd.notna(row["item_name"]) else "",
-                "specification": str(row["specification"]) if pd.notna(row["specification"]) else "",
-                "quantity": safe_int(row["quantity"]),
-                "unit_price": safe_int(row["unit_price"]),
-                "supply_amount": safe_int(row["supply_amount"]),
-                "tax": safe_int(row["tax"]),
-                "total_amount": safe_int(row["total_amount"]),
-                "due_date": format_date(row["due_date"]),
-                "vendor_name": str(row["vendor_name"]) if pd.notna(row["vendor_name"]) else "",
-                "delivery_name": str(row["delivery_name"]) if pd.notna(row["delivery_name"]) else "",
-                "note": str(row["note"]) if pd.notna(row["note"]) else ""
-            }
-            purchase_orders.append(order_data)
+        # openpyxl/xml 경로와 같은 헤더 레이아웃으로 컬럼 위치를 정함 (없는 컬럼은 빈 값)
+        header_row = [None if str(name).startswith("Unnamed:") else name for name in df.columns]
+        converter = get_row_converter(header_row, fields=list(RECORD_FIELDS.values()),
+                                      number=safe_int, key_field=None)
+        keys = {field: key for key, field in RECORD_FIELDS.items()}
+        column_names = list(RECORD_FIELDS)
+        selected = {keys[field]: df.iloc[:, index] for index, field, _ in converter.columns if field in keys}
+        df = pd.DataFrame({column: selected.get(column) for column in column_names}, index=df.index)
+        
+        # 컬럼 단위로 데이터 타입 일괄 변환
+        date1904 = is_date1904(file_path)
+        for column in ["order_number", "item_name", "specification", "vendor_name", "delivery_name", "note"]:
+            df[column] = to_str_column(df[column])
+        for column in ["quantity", "unit_price", "supply_amount", "tax", "total_amount"]:
+            df[column] = to_int_column(df[column])
+        for column in ["order_date", "due_date"]:
+            df[column] = to_date_column(df[column], date1904)
+        
+        purchase_orders = frame_to_records(df, column_names)
         
         return purchase_orders
         
@@ -0,0 +1,60 @@
+"""
+pandas DataFrame 컬럼 단위 변환 함수
+
+parse_excel_with_pandas 계열 파서에서 행마다 safe_int/format_date를 호출하는 대신
+컬럼 전체를 한 번에 변환하기 위해 사용한다. 결과는 행 단위 변환 함수와 같은 값
+(정수는 소수점 버림, 결측값은 0 또는 빈 문자열)을 낸다.
+"""
+
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from excel_dates import format_date_column
+
+
+def to_int_column(series: pd.Series) -> pd.Series:
+    """
+    숫자 컬럼을 정수로 일괄 변환 (safe_int의 컬럼 버전)
+
+    쉼표가 포함된 문자열은 쉼표를 제거한 뒤 변환하고, 변환할 수 없는 값과
+    결측값은 0으로 채운다. 실수는 소수점 이하를 버린다.
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return series.fillna(False).astype(np.int64)
+
+    if pd.api.types.is_numeric_dtype(series):
+        numbers = series.astype(np.float64)
+    else:
+        is_text = series.map(type).eq(str)
+        numbers = pd.to_numeric(series.where(~is_text), errors="coerce")
+        if is_text.any():
+            cleaned = series[is_text].str.replace(",", "", regex=False).str.strip()
+            numbers[is_text] = pd.to_numeric(cleaned, errors="coerce")
+        numbers = numbers.astype(np.float64)
+
+    numbers = numbers.where(np.isfinite(numbers), 0.0)
+    return np.trunc(numbers).astype(np.int64)
+
+
+def to_str_column(series: pd.Series) -> pd.Series:
+    """문자열 컬럼 일괄 변환: 결측값은 빈 문자열, 나머지는 str()"""
+    return series.astype(object).where(series.notna(), "").astype(str)
+
+
+def to_date_column(series: pd.Series, date1904: bool = False) -> pd.Series:
+    """
+    날짜 컬럼을 YYYY-MM-DD 문자열로 일괄 변환
+
+    excel_dates.format_date_column을 사용하여 고유값만 한 번씩 변환하고,
+    Excel 시리얼 번호는 배열 연산으로 처리한다.
+    """
+    return pd.Series(format_date_column(series, date1904), index=series.index, dtype=object)
+
+
+def frame_to_records(df: pd.DataFrame, columns: List[str]) -> List[Dict[str, Any]]:
+    """변환이 끝난 DataFrame을 지정한 컬럼 순서의 dict 리스트로 변환"""
+    if df.empty:
+        return []
+    return df[columns].to_dict(orient="records")
@@ -0,0 +1,269 @@
+"""
+워크북 내용 기반 파싱 결과 캐시 (SQLite)
+
+같은 워크북이 미리보기 → 저장 → 시트 추출 순서로 여러 번 올라오므로, 파싱 결과를
+워크북 바이트의 SHA-256 + 파서 버전 + 옵션을 키로 디스크에 저장해 두고 재사용한다.
+
+- 파서 버전은 파서와 의존 모듈 소스의 해시로 정하므로 코드가 바뀌면 이전 결과는 쓰지 않는다
+- 결과는 JSON을 zlib으로 압축해 저장하며, 전체 크기가 max_bytes를 넘으면
+  가장 오래 사용하지 않은 항목부터 삭제(LRU)
+- 적중/미스/삭제 횟수는 DB에 누적되어 여러 워커 프로세스의 통계를 함께 본다
+- 성공한 결과만 저장하고, columnar=True처럼 JSON으로 저장할 수 없는 결과나
+  output_path로 파일을 만드는 호출은 캐시하지 않는다
+
+사용 예:
+    from parse_cache import cached_parse
+    result = cached_parse("po_template", "upload.xlsx", engine="xml")
+"""
+
+import hashlib
+import importlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import zlib
+from typing import Any, Dict, Optional
+
+# 저장 형식이 바뀌면 올림
+CACHE_FORMAT_VERSION = 1
+
+DEFAULT_CACHE_PATH = os.path.join(tempfile.gettempdir(), "po_parse_cache.sqlite3")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# 캐시 가능한 파서: 이름 → (모듈, 함수, 결과에 영향을 주는 모듈 파일)
+PARSERS = {
+    "po_template": (
+        "po_template_parser", "parse_po_template_input",
+        ["po_template_parser.py", "po_schema_registry.py", "po_records.py", "po_category_trie.py",
+         "xlsx_reader.py", "excel_dates.py"]
+    ),
+    "purchase_orders": (
+        "excel_parser", "parse_excel_to_purchase_orders",
+        ["excel_parser.py", "po_schema_registry.py", "xlsx_reader.py", "excel_dates.py"]
+    ),
+    "purchase_orders_pandas": (
+        "excel_parser", "parse_excel_with_pandas",
+        ["excel_parser.py", "po_schema_registry.py", "excel_vectorized.py", "excel_dates.py"]
+    ),
+    "categories": (
+        "excel_parser_with_categories", "parse_excel_with_categories",
+        ["excel_parser_with_categories.py", "po_schema_registry.py", "xlsx_reader.py", "excel_dates.py"]
+    ),
+    "categories_pandas": (
+        "excel_parser_with_categories", "parse_excel_with_pandas",
+        ["excel_parser_with_categories.py", "excel_vectorized.py", "excel_dates.py"]
+    ),
+    "email_sheets": (
+        "po_template_parser", "extract_sheets_for_email",
+        ["po_template_parser.py", "xlsx_reader.py"]
+    ),
+}
+
+_parser_versions: Dict[str, str] = {}
+
+
+def file_sha256(file_path: str) -> str:
+    """파일 내용의 SHA-256 (hex)"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def parser_version(parser: str) -> str:
+    """파서와 의존 모듈 소스 해시로 만든 버전 문자열 (프로세스당 한 번 계산)"""
+    version = _parser_versions.get(parser)
+    if version is None:
+        digest = hashlib.sha256(f"{CACHE_FORMAT_VERSION}:{parser}".encode())
+        for file_name in PARSERS[parser][2]:
+            with open(os.path.join(REPO_ROOT, file_name), "rb") as f:
+                digest.update(f.read())
+        version = _parser_versions[parser] = digest.hexdigest()[:16]
+    return version
+
+
+def make_cache_key(file_hash: str, parser: str, options: Dict[str, Any]) -> str:
+    """워크북 해시 + 파서 버전 + 옵션으로 캐시 키 생성"""
+    options_json = json.dumps(options, sort_keys=True, ensure_ascii=False, default=str)
+    material = f"{file_hash}|{parser}|{parser_version(parser)}|{options_json}"
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ParseCache:
+    """
+    SQLite 기반 파싱 결과 캐시
+
+    Args:
+        db_path: 캐시 DB 경로 (기본: PO_PARSE_CACHE_PATH 환경변수 또는 임시 디렉토리)
+        max_bytes: 저장 결과 총 크기 상한 (기본: PO_PARSE_CACHE_MAX_BYTES 또는 256MB)
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.db_path = db_path or os.environ.get("PO_PARSE_CACHE_PATH") or DEFAULT_CACHE_PATH
+        self.max_bytes = max_bytes or int(os.environ.get("PO_PARSE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))
+        self.connection = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, parser TEXT NOT NULL, file_hash TEXT NOT NULL,"
+            " payload BLOB NOT NULL, size INTEGER NOT NULL,"
+            " created_at REAL NOT NULL, last_access REAL NOT NULL, hits INTEGER NOT NULL DEFAULT 0)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 결과 반환 (없으면 None). 적중/미스 통계와 최근 사용 시각을 갱신"""
+        row = self.connection.execute("SELECT payload FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self._count("misses")
+            return None
+
+        self.connection.execute(
+            "UPDATE entries SET last_access = ?, hits = hits + 1 WHERE key = ?", (time.time(), key)
+        )
+        self._count("hits")
+        return json.loads(zlib.decompress(row[0]))
+
+    def put(self, key: str, parser: str, file_hash: str, result: Any) -> None:
+        """결과 저장 후 크기 상한을 넘으면 LRU 삭제"""
+        payload = zlib.compress(
+            json.dumps(result, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 1
+        )
+        if len(payload) > self.max_bytes:
+            return
+
+        now = time.time()
+        self.connection.execute(
+            "INSERT OR REPLACE INTO entries (key, parser, file_hash, payload, size, created_at, last_access)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (key, parser, file_hash, payload, len(payload), now, now)
+        )
+        self._evict()
+
+    def _evict(self) -> None:
+        total = self.connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        rows = self.connection.execute("SELECT key, size FROM entries ORDER BY last_access").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        self._count("evictions", evicted)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        self.connection.execute(
+            "INSERT INTO stats (name, value) VALUES (?, ?)"
+            " ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """적중/미스/삭제 횟수, 항목 수, 저장 크기"""
+        counters = dict(self.connection.execute("SELECT name, value FROM stats").fetchall())
+        entries, total_bytes = self.connection.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hitRate": round(hits / (hits + misses), 3) if hits + misses else None,
+            "evictions": counters.get("evictions", 0),
+            "entries": entries,
+            "totalBytes": total_bytes,
+            "maxBytes": self.max_bytes,
+            "path": self.db_path
+        }
+
+    def clear(self) -> None:
+        """모든 항목과 통계 삭제"""
+        self.connection.execute("DELETE FROM entries")
+        self.connection.execute("DELETE FROM stats")
+
+
+_default_cache: Optional[ParseCache] = None
+
+
+def get_parse_cache() -> ParseCache:
+    """프로세스에서 공유하는 기본 캐시"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ParseCache()
+    return _default_cache
+
+
+def _is_cacheable(result: Any) -> bool:
+    # 리스트 파서는 실패 시 빈 리스트를 반환하므로 빈 결과는 저장하지 않음
+    if isinstance(result, list):
+        return len(result) > 0
+    return isinstance(result, dict) and result.get("success") is True
+
+
+def cached_parse(parser: str, file_path: str, cache: Optional[ParseCache] = None,
+                 **options: Any) -> Any:
+    """
+    캐시를 거쳐 파서 실행
+
+    Args:
+        parser: PARSERS의 파서 이름 (예: "po_template")
+        file_path: 워크북 경로
+        cache: 사용할 ParseCache (기본: get_parse_cache())
+        **options: 파서 함수에 그대로 넘기는 옵션 (캐시 키에 포함)
+
+    Returns:
+        파서 함수의 결과 (캐시 적중 시 저장된 결과)
+    """
+    if parser not in PARSERS:
+        raise ValueError(f"지원하지 않는 파서입니다: {parser}")
+
+    module_name, function_name, _ = PARSERS[parser]
+    parse = getattr(importlib.import_module(module_name), function_name)
+
+    # 컬럼형 테이블은 JSON으로 저장할 수 없고, 파일을 만드는 호출은 매번 실행해야 하므로
+    # 캐시를 거치지 않음
+    if options.get("columnar") or options.get("output_path"):
+        return parse(file_path, **options)
+
+    try:
+        file_hash = file_sha256(file_path)
+    except OSError:
+        # 파일 오류는 파서가 원래 형태의 실패 결과로 돌려주도록 그대로 넘김
+        return parse(file_path, **options)
+
+    cache = cache or get_parse_cache()
+    key = make_cache_key(file_hash, parser, options)
+
+    result = cache.get(key)
+    if result is not None:
+        return result
+
+    result = parse(file_path, **options)
+    if _is_cacheable(result):
+        cache.put(key, parser, file_hash, result)
+    return result
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+여러 PO Template 워크북을 프로세스 풀로 병렬 파싱
+
+파일 목록 또는 디렉토리를 받아 parse_po_template_input을 CPU 코어 수만큼의
+워커 프로세스에서 실행하고, 끝나는 순서대로 파일별 결과를 내보낸다.
+한 파일의 실패(예외, 워커 비정상 종료)는 해당 파일 결과에만 기록된다.
+
+사용법:
+    python po_batch.py <파일 또는 디렉토리>... [--workers N] [--engine xml|openpyxl]
+
+출력 (JSON Lines):
+    파일마다 {"file": ..., "success": ..., "totalOrders": ..., "orders": [...], "elapsedMs": ...}
+    마지막 줄에 {"summary": {...}}
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from po_template_parser import parse_po_template_input
+
+WORKBOOK_EXTENSIONS = (".xlsx", ".xlsm")
+
+
+def collect_workbook_paths(inputs: Iterable[str]) -> List[str]:
+    """
+    파일/디렉토리 목록을 워크북 파일 경로 목록으로 펼침
+
+    디렉토리는 바로 아래의 .xlsx/.xlsm 파일만 이름순으로 포함하며,
+    Excel 잠금 파일(~$로 시작)은 제외한다.
+    """
+    paths = []
+    for input_path in inputs:
+        if os.path.isdir(input_path):
+            for name in sorted(os.listdir(input_path)):
+                if name.lower().endswith(WORKBOOK_EXTENSIONS) and not name.startswith("~$"):
+                    paths.append(os.path.join(input_path, name))
+        else:
+            paths.append(input_path)
+    return paths
+
+
+def _parse_one(file_path: str, engine: str) -> Dict[str, Any]:
+    """워커 프로세스에서 실행되는 파일 하나 파싱"""
+    started = time.perf_counter()
+    result = parse_po_template_input(file_path, engine=engine)
+    result["elapsedMs"] = round((time.perf_counter() - started) * 1000, 1)
+    return result
+
+
+def iter_batch_results(file_paths: List[str], max_workers: Optional[int] = None,
+                       engine: str = "xml") -> Iterator[Dict[str, Any]]:
+    """
+    워크북들을 프로세스 풀에서 파싱하고 완료 순서대로 결과를 yield
+
+    Args:
+        file_paths: 파싱할 워크북 경로 목록
+        max_workers: 워커 프로세스 수 (기본: CPU 코어 수, 파일 수보다 많지 않게)
+        engine: parse_po_template_input의 행 소스
+
+    Yields:
+        Dict: parse_po_template_input 결과에 "file"과 "elapsedMs"를 추가한 dict
+    """
+    if not file_paths:
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(file_paths)))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_parse_one, path, engine): path for path in file_paths}
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # 워커 프로세스가 비정상 종료된 경우 등 파싱 함수 밖의 실패
+                result = {"success": False, "error": f"워커 처리 실패: {str(e)}", "orders": []}
+            yield {"file": file_path, **result}
+
+
+def parse_workbooks(file_paths: List[str], max_workers: Optional[int] = None,
+                    engine: str = "xml") -> Dict[str, Any]:
+    """
+    워크북들을 병렬 파싱하여 파일별 결과와 요약을 한 번에 반환
+
+    Returns:
+        Dict: {"results": [...입력 순서...], "summary": {...}}
+    """
+    started = time.perf_counter()
+    results_by_file = {}
+    for result in iter_batch_results(file_paths, max_workers=max_workers, engine=engine):
+        results_by_file[result["file"]] = result
+    results = [results_by_file[path] for path in file_paths]
+    return {
+        "results": results,
+        "summary": _summarize(results, time.perf_counter() - started)
+    }
+
+
+def _summarize(results: List[Dict[str, Any]], elapsed_seconds: float) -> Dict[str, Any]:
+    succeeded = [result for result in results if result.get("success")]
+    return {
+        "totalFiles": len(results),
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "totalOrders": sum(result.get("totalOrders", 0) for result in succeeded),
+        "totalItems": sum(result.get("totalItems", 0) for result in succeeded),
+        "elapsedSeconds": round(elapsed_seconds, 3),
+        "filesPerSecond": round(len(results) / elapsed_seconds, 2) if elapsed_seconds > 0 else None
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="PO Template 워크북 일괄 병렬 파싱")
+    parser.add_argument("inputs", nargs="+", help="워크북 파일 또는 디렉토리")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--engine", choices=["xml", "openpyxl"], default="xml", help="Input 시트 읽기 엔진")
+    parser.add_argument("--summary-only", action="store_true", help="파일별 orders 없이 건수만 출력")
+    args = parser.parse_args()
+
+    file_paths = collect_workbook_paths(args.inputs)
+    if not file_paths:
+        print("❌ 처리할 워크북이 없습니다.", file=sys.stderr)
+        return 1
+
+    print(f"📋 {len(file_paths)}개 워크북 병렬 파싱 시작", file=sys.stderr)
+    started = time.perf_counter()
+    results = []
+    for result in iter_batch_results(file_paths, max_workers=args.workers, engine=args.engine):
+        results.append(result)
+        if args.summary_only:
+            result = {key: value for key, value in result.items() if key != "orders"}
+        print(json.dumps(result, ensure_ascii=False), flush=True)
+
+    summary = _summarize(results, time.perf_counter() - started)
+    print(json.dumps({"summary": summary}, ensure_ascii=False), flush=True)
+    print(f"✅ 완료: 성공 {summary['succeeded']} / 실패 {summary['failed']}", file=sys.stderr)
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,245 @@
+"""
+발주 아이템 분류(대분류/중분류/소분류) 트리 색인
+
+UI의 분류 트리/노드별 건수/금액을 아이템 목록을 다시 훑지 않고 답하기 위해, 파싱 중
+행을 읽는 김에 분류 경로를 트리에 누적한다 (parse_po_template_input(category_tree=True)).
+
+- 노드는 생성 순서의 정수 ID이며 부모/깊이/라벨 번호/통계를 array로 보관한다
+  (라벨 문자열은 한 번만 저장해 번호로 참조)
+- 아이템을 넣을 때 루트부터 경로의 모든 노드에 건수/금액을 더하므로, 노드의 통계는
+  곧 하위 트리 전체의 합계이다 → 경로 조회 O(깊이), 하위 트리 합계 O(1)
+- 라벨 접두어 검색은 (라벨, 노드) 정렬 목록에서 bisect로 찾는다 (O(log n) + 결과 수)
+- to_dict/from_dict로 JSON 직렬화하고, merge로 다른 업로드의 트리를 노드별로 더한다
+
+빈 분류 단계에서 경로가 끝난다 (대분류가 비면 루트에만 집계).
+
+사용 예:
+    trie = CategoryTrie.from_dict(result["categoryTree"])
+    trie.stats(["원자재", "ALUM.Sheet"])
+    trie.search_prefix("알루")
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 직렬화 형식이 바뀌면 올림
+CATEGORY_TREE_VERSION = 1
+
+CATEGORY_LEVEL_FIELDS = ["categoryLv1", "categoryLv2", "categoryLv3"]
+CATEGORY_VALUE_FIELDS = ["quantity", "supplyAmount", "taxAmount", "totalAmount"]
+CATEGORY_NODE_COLUMNS = ["id", "parent", "label", "depth", "itemCount"] + CATEGORY_VALUE_FIELDS
+
+ROOT = 0
+
+
+class CategoryTrie:
+    """
+    분류 경로 트리
+
+    노드 0은 루트(전체 합계)이며, 각 노드의 통계는 하위 트리 전체 아이템의 합이다.
+    """
+
+    __slots__ = ("labels", "label_ids", "parents", "depths", "node_labels", "item_counts",
+                 "totals", "children", "child_lists", "_label_index")
+
+    def __init__(self):
+        self.labels: List[str] = [""]
+        self.label_ids: Dict[str, int] = {"": 0}
+        self.parents = array("i", [-1])
+        self.depths = array("b", [0])
+        self.node_labels = array("i", [0])
+        self.item_counts = array("q", [0])
+        self.totals = [array("d", [0.0]) for _ in CATEGORY_VALUE_FIELDS]
+        # (부모 노드, 라벨 번호) → 자식 노드
+        self.children: Dict[Tuple[int, int], int] = {}
+        self.child_lists: List[List[int]] = [[]]
+        self._label_index: Optional[List[Tuple[str, int]]] = None
+
+    def __len__(self) -> int:
+        """루트를 뺀 노드 수"""
+        return len(self.parents) - 1
+
+    def _intern(self, label: str) -> int:
+        label_id = self.label_ids.get(label)
+        if label_id is None:
+            label_id = self.label_ids[label] = len(self.labels)
+            self.labels.append(label)
+        return label_id
+
+    def _child(self, parent: int, label: str) -> int:
+        """부모 아래 라벨 노드 (없으면 생성)"""
+        label_id = self._intern(label)
+        node = self.children.get((parent, label_id))
+        if node is None:
+            node = self.children[(parent, label_id)] = len(self.parents)
+            self.parents.append(parent)
+            self.depths.append(self.depths[parent] + 1)
+            self.node_labels.append(label_id)
+            self.item_counts.append(0)
+            for column in self.totals:
+                column.append(0.0)
+            self.child_lists.append([])
+            self.child_lists[parent].append(node)
+            self._label_index = None
+        return node
+
+    def add(self, path: Sequence[str], values: Sequence[float], count: int = 1) -> int:
+        """
+        분류 경로에 아이템 추가 (루트부터 경로의 모든 노드에 누적)
+
+        Args:
+            path: 대분류부터의 라벨 (첫 빈 라벨에서 끝남)
+            values: CATEGORY_VALUE_FIELDS 순서의 값
+            count: 아이템 수
+
+        Returns:
+            int: 경로 마지막 노드 ID
+        """
+        node = ROOT
+        self._accumulate(node, values, count)
+        for label in path:
+            if not label:
+                break
+            node = self._child(node, label)
+            self._accumulate(node, values, count)
+        return node
+
+    def _accumulate(self, node: int, values: Sequence[float], count: int) -> None:
+        self.item_counts[node] += count
+        for column, value in zip(self.totals, values):
+            column[node] += value
+
+    def add_item(self, item: Any) -> int:
+        """POItemRecord 한 건 추가"""
+        return self.add(
+            (item.category_lv1, item.category_lv2, item.category_lv3),
+            (item.quantity, item.supply_amount, item.tax_amount, item.total_amount)
+        )
+
+    def find(self, path: Sequence[str]) -> Optional[int]:
+        """경로의 노드 ID (없으면 None, 빈 경로는 루트)"""
+        node = ROOT
+        for label in path:
+            label_id = self.label_ids.get(label)
+            node = self.children.get((node, label_id)) if label_id is not None else None
+            if node is None:
+                return None
+        return node
+
+    def path(self, node: int) -> List[str]:
+        """노드의 대분류부터의 라벨 경로"""
+        labels = []
+        while node > ROOT:
+            labels.append(self.labels[self.node_labels[node]])
+            node = self.parents[node]
+        labels.reverse()
+        return labels
+
+    def node_stats(self, node: int) -> Dict[str, Any]:
+        """노드(하위 트리 전체)의 건수/금액"""
+        stats = {
+            "id": node,
+            "path": self.path(node),
+            "itemCount": self.item_counts[node],
+            "childCount": len(self.child_lists[node]),
+        }
+        for field, column in zip(CATEGORY_VALUE_FIELDS, self.totals):
+            stats[field] = column[node]
+        return stats
+
+    def stats(self, path: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """경로 노드의 통계 (없으면 None)"""
+        node = self.find(path)
+        return self.node_stats(node) if node is not None else None
+
+    def children_stats(self, path: Sequence[str] = ()) -> List[Dict[str, Any]]:
+        """경로 노드의 바로 아래 노드 통계 (생성 순서)"""
+        node = self.find(path)
+        if node is None:
+            return []
+        return [self.node_stats(child) for child in self.child_lists[node]]
+
+    def subtree(self, path: Sequence[str] = (), max_depth: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """경로 노드 아래의 중첩 트리 ({"label", "itemCount", ..., "children": [...]})"""
+        node = self.find(path)
+        if node is None:
+            return None
+        return self._subtree(node, max_depth)
+
+    def _subtree(self, node: int, max_depth: Optional[int]) -> Dict[str, Any]:
+        tree = {"label": self.labels[self.node_labels[node]], "itemCount": self.item_counts[node]}
+        for field, column in zip(CATEGORY_VALUE_FIELDS, self.totals):
+            tree[field] = column[node]
+        if max_depth is None or max_depth > 0:
+            next_depth = None if max_depth is None else max_depth - 1
+            tree["children"] = [self._subtree(child, next_depth) for child in self.child_lists[node]]
+        return tree
+
+    def search_prefix(self, prefix: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """라벨이 prefix로 시작하는 노드 통계 (라벨 순, 최대 limit개)"""
+        if self._label_index is None:
+            self._label_index = sorted(
+                (self.labels[self.node_labels[node]], node) for node in range(1, len(self.parents))
+            )
+        index = self._label_index
+        results = []
+        for position in range(bisect_left(index, (prefix, -1)), len(index)):
+            label, node = index[position]
+            if not label.startswith(prefix) or len(results) >= limit:
+                break
+            results.append(self.node_stats(node))
+        return results
+
+    def merge(self, other: "CategoryTrie") -> "CategoryTrie":
+        """다른 트리의 노드 통계를 같은 경로 노드에 더함 (self를 반환)"""
+        # 노드 ID는 생성 순서라 부모가 항상 먼저 나오므로 한 번 훑으며 대응 노드를 찾음
+        mapping = [ROOT] * len(other.parents)
+        for node in range(len(other.parents)):
+            if node != ROOT:
+                mapping[node] = self._child(mapping[other.parents[node]],
+                                            other.labels[other.node_labels[node]])
+            target = mapping[node]
+            self.item_counts[target] += other.item_counts[node]
+            for column, other_column in zip(self.totals, other.totals):
+                column[target] += other_column[node]
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON 직렬화 형태 (노드는 columns/rows 압축 테이블)"""
+        columns = [range(len(self.parents)), self.parents, self.node_labels, self.depths,
+                   self.item_counts] + self.totals
+        return {
+            "version": CATEGORY_TREE_VERSION,
+            "labels": self.labels,
+            "columns": CATEGORY_NODE_COLUMNS,
+            "rows": [list(row) for row in zip(*columns)]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CategoryTrie":
+        """to_dict 결과로 트리 복원"""
+        if data.get("version") != CATEGORY_TREE_VERSION:
+            raise ValueError(f"지원하지 않는 분류 트리 버전입니다: {data.get('version')}")
+        positions = {name: data["columns"].index(name) for name in CATEGORY_NODE_COLUMNS}
+        labels = data["labels"]
+
+        trie = cls()
+        for row in data["rows"]:
+            node = row[positions["id"]]
+            if node != ROOT:
+                created = trie._child(row[positions["parent"]], labels[row[positions["label"]]])
+                if created != node:
+                    raise ValueError("분류 트리 노드 순서가 올바르지 않습니다")
+            trie.item_counts[node] = row[positions["itemCount"]]
+            for field, column in zip(CATEGORY_VALUE_FIELDS, trie.totals):
+                column[node] = row[positions[field]]
+        return trie
+
+
+def merge_category_trees(trees: Iterable[Dict[str, Any]]) -> CategoryTrie:
+    """여러 업로드의 to_dict 결과를 하나의 트리로 합침"""
+    merged = CategoryTrie()
+    for tree in trees:
+        merged.merge(CategoryTrie.from_dict(tree))
+    return merged
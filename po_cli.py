@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+"""
+엑셀 처리 스크립트 통합 진입점
+
+업로드마다 프로세스를 새로 띄우는 동안은 기동 시간이 곧 요청 지연이다.
+이 모듈은 명령별 처리 함수를 한곳에 모으고, 각 명령이 실제로 필요한 모듈만
+실행 시점에 import한다 (예: parse --engine xml은 openpyxl/pandas를 불러오지 않음).
+excel-python-worker.py도 같은 명령 표(COMMANDS)를 사용한다.
+
+사용법:
+    python po_cli.py parse <file> [--engine xml|openpyxl] [--streaming|--no-streaming] [--no-cache]
+                           [--fingerprints] [--previous-fingerprints 이전결과.json] [--category-tree]
+    python po_cli.py parse <file> --stream|--no-stream [--engine xml|openpyxl]
+    python po_cli.py remove-sheet <source> <target> [--sheet Input] [--method minimal|binary]
+    python po_cli.py extract-sheets <file> [sheet ...] [--output 첨부파일.xlsx]
+    python po_cli.py pipeline <file> [attachment] [--sheets 갑지 을지] [--input-sheet Input]
+    python po_cli.py generate-po <file> <output_dir> [--template T] [--group-by order|vendor] [--layout L.json] [--workers N]
+    python po_cli.py export-input <orders.json|orders.jsonl|upload.xlsx> <output.xlsx>
+    python po_cli.py validate <file> [--rounding round|floor|ceil|none] [--tax-rate 0.1] [--tolerance 1] [--rules AMT001 ...]
+    python po_cli.py rollup <file> [--by order vendor site category]
+    python po_cli.py match-names <file> --master master.json [--fields vendorName siteName deliveryName]
+    python po_cli.py read-records <file> [--sheet "Input Sheet"]
+    python po_cli.py category-tree <결과.json>... [--path 대분류 중분류] [--prefix 라벨] [--depth N]
+    python po_cli.py verify <file> | --compare <original> <processed> [--diff-mode styles|parts]
+    python po_cli.py cache-stats [--clear]
+    python po_cli.py batch <파일 또는 디렉토리>... [po_batch 옵션]
+    python po_cli.py compile
+
+결과는 stdout에 JSON 한 줄로 출력하며, 처리 함수의 로그는 stderr로 보낸다.
+parse --stream은 발주서를 읽는 대로 한 줄에 하나씩 출력한 뒤 마지막 줄에 요약을 출력한다
+(iter_po_template_orders, 메모리 사용량이 행 수와 무관). --stream/--no-stream을 주지 않으면
+STREAMING_THRESHOLD_BYTES 이상인 파일은 스트림으로 처리한다 (지문/분류 트리 옵션이 없을 때).
+--streaming은 openpyxl 행 소스(read-only) 선택일 뿐 결과는 전부 메모리에 만든다.
+compile은 배포 빌드 단계에서 __pycache__를 미리 만들어 둔다 (읽기 전용 파일시스템 대비).
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_DIR = os.path.join(REPO_ROOT, "scripts")
+SERVER_UTILS_DIR = os.path.join(REPO_ROOT, "server", "utils")
+
+# compile 명령이 미리 컴파일하는 모듈
+PRECOMPILE_PATHS = [
+    "po_cli.py", "po_batch.py", "parse_cache.py", "po_upload_pipeline.py", "po_document_generator.py",
+    "po_input_exporter.py", "po_validation.py", "po_rollup.py", "po_name_matcher.py",
+    "po_schema_registry.py", "po_category_trie.py", "po_template_parser.py", "po_records.py", "po_columnar.py", "xlsx_reader.py", "xlsx_sheet_remover.py", "atomic_write.py",
+    "excel_dates.py", "excel_vectorized.py", "excel_parser.py",
+    "excel_parser_with_categories.py", os.path.join("scripts", "excel_format_preserving.py"),
+    os.path.join("server", "utils", "excel-minimal-processing.py"),
+    os.path.join("server", "utils", "excel-python-worker.py"),
+]
+
+
+def load_script_module(module_name, file_path):
+    """하이픈이 들어간 파일명의 스크립트를 모듈로 로드 (한 번 로드한 모듈은 재사용)"""
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def _minimal_processing():
+    return load_script_module(
+        "excel_minimal_processing", os.path.join(SERVER_UTILS_DIR, "excel-minimal-processing.py")
+    )
+
+
+def _format_preserving():
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    import excel_format_preserving
+    return excel_format_preserving
+
+
+def _load_previous_fingerprints(value):
+    """이전 파싱 결과 또는 그 "fingerprints"를 dict나 JSON 파일 경로로 받아 fingerprints만 반환"""
+    if isinstance(value, str):
+        with open(value, encoding="utf-8") as fingerprints_file:
+            value = json.load(fingerprints_file)
+    return value.get("fingerprints", value)
+
+
+def run_parse(args):
+    options = {"streaming": args.get("streaming"), "engine": args.get("engine", "openpyxl")}
+    if args.get("fingerprints"):
+        options["fingerprints"] = True
+    if args.get("previous_fingerprints"):
+        options["previous_fingerprints"] = _load_previous_fingerprints(args["previous_fingerprints"])
+    if args.get("category_tree"):
+        options["category_tree"] = True
+    if args.get("cache", True):
+        from parse_cache import cached_parse
+        return cached_parse("po_template", args["file"], **options)
+
+    from po_template_parser import parse_po_template_input
+    return parse_po_template_input(args["file"], **options)
+
+
+def stream_parse(args, emit):
+    """
+    parse --stream: 발주서를 연속 구간 단위로 emit하고 요약 반환
+
+    같은 발주번호가 떨어져 다시 나오면 "continuation": True인 발주서로 한 번 더 emit된다
+    (iter_po_template_orders 참고).
+    """
+    from po_template_parser import iter_po_template_orders
+
+    order_numbers = set()
+    total_items = 0
+    emitted = 0
+    try:
+        for order in iter_po_template_orders(args["file"], engine=args.get("engine", "xml")):
+            emit(order)
+            order_numbers.add(order["orderNumber"])
+            total_items += len(order["items"])
+            emitted += 1
+    except Exception as e:
+        return {"success": False, "error": str(e), "streamed": emitted}
+    return {
+        "success": True,
+        "totalOrders": len(order_numbers),
+        "totalItems": total_items,
+        "streamed": emitted
+    }
+
+
+def run_remove_sheet(args):
+    method = args.get("method", "minimal")
+    # binary는 minimal의 별칭 (excel-minimal-processing.BATCH_METHODS)
+    remove = _minimal_processing().BATCH_METHODS.get(method)
+    if remove is None:
+        raise ValueError(f"지원하지 않는 처리 방식입니다: {method}")
+    return remove(args["source"], args["target"], args.get("sheet", "Input"))
+
+
+def run_extract_sheets(args):
+    from po_template_parser import extract_sheets_for_email
+
+    return extract_sheets_for_email(args["file"], args.get("sheets") or ["갑지", "을지"],
+                                    output_path=args.get("output"))
+
+
+def run_pipeline(args):
+    from po_upload_pipeline import process_upload
+
+    return process_upload(args["file"], args.get("attachment"), args.get("sheets"),
+                          args.get("input_sheet", "Input"))
+
+
+def run_generate_po(args):
+    from parse_cache import cached_parse
+    from po_document_generator import generate_po_documents
+
+    parsed = cached_parse("po_template", args["file"], engine="xml")
+    if not parsed.get("success"):
+        return parsed
+
+    started = time.perf_counter()
+    try:
+        layout = None
+        if args.get("layout"):
+            with open(args["layout"], encoding="utf-8") as layout_file:
+                layout = json.load(layout_file)
+
+        # 템플릿에 갑지/을지가 없거나 레이아웃이 맞지 않으면 POTemplate이 ValueError를 냄
+        documents = list(generate_po_documents(
+            args.get("template") or args["file"], parsed["orders"], args["output_dir"],
+            group_by=args.get("group_by", "order"), layout=layout, max_workers=args.get("workers")
+        ))
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    elapsed = time.perf_counter() - started
+    failed = sum(1 for document in documents if not document["success"])
+    return {
+        "success": failed == 0,
+        "totalDocuments": len(documents),
+        "failed": failed,
+        "elapsedSeconds": round(elapsed, 3),
+        "documentsPerSecond": round(len(documents) / elapsed, 1) if elapsed > 0 else None,
+        "documents": documents
+    }
+
+
+def run_export_input(args):
+    from po_input_exporter import export_orders_to_input, iter_orders_json
+
+    source = args["source"]
+    if source.endswith((".json", ".jsonl")):
+        orders = iter_orders_json(source)
+    else:
+        from parse_cache import cached_parse
+
+        parsed = cached_parse("po_template", source, engine="xml")
+        if not parsed.get("success"):
+            return parsed
+        orders = parsed["orders"]
+    return export_orders_to_input(orders, args["output"])
+
+
+def run_validate(args):
+    from po_validation import validate_po_amounts
+
+    config = {}
+    for option, key in (("rounding", "rounding"), ("tax_rate", "tax_rate"),
+                        ("tolerance", "abs_tolerance"), ("rules", "rules")):
+        if args.get(option) is not None:
+            config[key] = args[option]
+    return validate_po_amounts(args["file"], engine=args.get("engine", "xml"), config=config)
+
+
+def run_rollup(args):
+    from po_rollup import rollup_item_table
+    from po_template_parser import build_po_item_table
+
+    table = build_po_item_table(args["file"], engine=args.get("engine", "xml"))
+    return rollup_item_table(table, args.get("by"))
+
+
+def run_match_names(args):
+    from po_name_matcher import match_upload_names
+
+    config = {}
+    for option, key in (("min_score", "min_score"), ("accept_score", "accept_score")):
+        if args.get(option) is not None:
+            config[key] = args[option]
+    return match_upload_names(args["file"], args["master"], engine=args.get("engine", "xml"),
+                              fields=args.get("fields"), config=config)
+
+
+def run_read_records(args):
+    from po_schema_registry import read_sheet_records
+
+    return read_sheet_records(args["file"], args.get("sheet"))
+
+
+def _load_category_tree(value):
+    """파싱 결과 또는 그 "categoryTree"를 dict나 JSON 파일 경로로 받아 categoryTree만 반환"""
+    if isinstance(value, str):
+        with open(value, encoding="utf-8") as tree_file:
+            value = json.load(tree_file)
+    return value.get("categoryTree", value)
+
+
+def run_category_tree(args):
+    from po_category_trie import merge_category_trees
+
+    trie = merge_category_trees(_load_category_tree(tree) for tree in args["trees"])
+    path = args.get("path") or []
+    result = {"success": True, "nodeCount": len(trie)}
+    if args.get("prefix") is not None:
+        result["matches"] = trie.search_prefix(args["prefix"])
+    else:
+        result["node"] = trie.stats(path)
+        result["tree"] = trie.subtree(path, args.get("depth"))
+    if args.get("merged"):
+        result["categoryTree"] = trie.to_dict()
+    return result
+
+
+def run_verify(args):
+    format_preserving = _format_preserving()
+    if "original" in args:
+        return format_preserving.compare_formats(args["original"], args["processed"],
+                                                 diff_mode=args.get("diff_mode", "styles"))
+    return format_preserving.verify_format_preservation(args["file"])
+
+
+def run_cache_stats(args):
+    from parse_cache import get_parse_cache
+
+    cache = get_parse_cache()
+    if args.get("clear"):
+        cache.clear()
+    return {"success": True, **cache.stats()}
+
+
+# 명령 이름 → 처리 함수(args dict → 결과 dict)
+COMMANDS = {
+    "parse": run_parse,
+    "remove-sheet": run_remove_sheet,
+    "extract-sheets": run_extract_sheets,
+    "pipeline": run_pipeline,
+    "generate-po": run_generate_po,
+    "export-input": run_export_input,
+    "validate": run_validate,
+    "rollup": run_rollup,
+    "match-names": run_match_names,
+    "read-records": run_read_records,
+    "category-tree": run_category_tree,
+    "verify": run_verify,
+    "cache-stats": run_cache_stats,
+}
+
+
+# args["stream"]이 참일 때 쓰는 스트리밍 처리 함수 (args, emit) → 요약 dict
+STREAM_COMMANDS = {
+    "parse": stream_parse,
+}
+
+# 전체 결과가 있어야 하는 parse 옵션 (주면 큰 파일도 스트림으로 바꾸지 않음)
+FULL_RESULT_PARSE_OPTIONS = ("fingerprints", "previous_fingerprints", "category_tree")
+
+
+def _wants_stream(command, args):
+    """
+    스트리밍 처리 함수로 실행할지 여부
+
+    args["stream"]을 지정하지 않은 parse는 파일이 STREAMING_THRESHOLD_BYTES 이상이면
+    스트림으로 처리한다 (orders 목록 전체를 메모리에 만들지 않음).
+    """
+    stream = args.get("stream")
+    if stream is not None or command != "parse":
+        return bool(stream)
+    if any(args.get(option) for option in FULL_RESULT_PARSE_OPTIONS):
+        return False
+    from po_template_parser import STREAMING_THRESHOLD_BYTES
+
+    try:
+        return os.path.getsize(args["file"]) >= STREAMING_THRESHOLD_BYTES
+    except (KeyError, OSError):
+        return False
+
+
+def preload_modules():
+    """상주 워커용: 모든 명령의 모듈을 미리 import"""
+    import openpyxl  # noqa: F401
+    import po_template_parser  # noqa: F401
+    import po_upload_pipeline  # noqa: F401
+    import po_document_generator  # noqa: F401
+    _minimal_processing()
+    _format_preserving()
+
+
+def run_command(command, args, emit=None):
+    """
+    명령 하나 실행 (처리 함수가 stdout에 쓰는 로그는 stderr로 돌림)
+
+    Args:
+        command: COMMANDS의 명령 이름
+        args: 명령 인자 dict
+        emit: 스트리밍 항목을 받을 함수. 주고 args["stream"]이 참이면(parse는 지정하지
+              않아도 큰 파일이면, _wants_stream) STREAM_COMMANDS의 처리 함수로 실행
+
+    Returns:
+        Dict: 처리 함수의 결과 (스트리밍이면 요약)
+    """
+    if emit is not None and command in STREAM_COMMANDS and _wants_stream(command, args):
+        with contextlib.redirect_stdout(sys.stderr):
+            return STREAM_COMMANDS[command](args, emit)
+
+    handler = COMMANDS.get(command)
+    if handler is None:
+        raise ValueError(f"알 수 없는 명령: {command}")
+    with contextlib.redirect_stdout(sys.stderr):
+        return handler(args)
+
+
+def compile_modules():
+    """PRECOMPILE_PATHS를 바이트코드로 미리 컴파일"""
+    import py_compile
+
+    compiled = []
+    for relative_path in PRECOMPILE_PATHS:
+        path = os.path.join(REPO_ROOT, relative_path)
+        py_compile.compile(path, doraise=True)
+        compiled.append(relative_path)
+    return {"success": True, "compiled": compiled}
+
+
+def _build_parser():
+    parser = argparse.ArgumentParser(description="엑셀 처리 스크립트 통합 진입점")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parse = subparsers.add_parser("parse", help="PO Template Input 시트 파싱")
+    parse.add_argument("file")
+    parse.add_argument("--engine", choices=["openpyxl", "xml"], default="openpyxl")
+    parse.add_argument("--streaming", action=argparse.BooleanOptionalAction, default=None,
+                       help="openpyxl read-only 행 소스 사용 여부 (결과는 전부 메모리에 만듦)")
+    parse.add_argument("--no-cache", dest="cache", action="store_false", help="파싱 결과 캐시 사용 안 함")
+    parse.add_argument("--fingerprints", action="store_true", help="발주서별 행 지문 포함")
+    parse.add_argument("--previous-fingerprints", metavar="JSON",
+                       help="이전 파싱 결과(또는 fingerprints) 파일. 변경된 발주서만 반환")
+    parse.add_argument("--category-tree", action="store_true", help="분류 트리(건수/금액) 포함")
+    parse.add_argument("--stream", action=argparse.BooleanOptionalAction, default=None,
+                       help="발주서를 한 줄에 하나씩 출력 (JSON Lines, 마지막 줄은 요약). "
+                            "지정하지 않으면 큰 파일만 스트림")
+
+    remove = subparsers.add_parser("remove-sheet", help="Input 시트 제거")
+    remove.add_argument("source")
+    remove.add_argument("target")
+    remove.add_argument("--sheet", default="Input")
+    remove.add_argument("--method", choices=["minimal", "binary"], default="minimal")
+
+    extract = subparsers.add_parser("extract-sheets", help="이메일용 시트 정보 추출")
+    extract.add_argument("file")
+    extract.add_argument("sheets", nargs="*")
+    extract.add_argument("--output", help="추출한 시트만 담은 워크북 저장 경로")
+
+    pipeline = subparsers.add_parser("pipeline", help="파싱 + 시트 정보 + 첨부 파일 생성을 한 번에")
+    pipeline.add_argument("file")
+    pipeline.add_argument("attachment", nargs="?", help="Input 시트를 뺀 첨부 파일 경로")
+    pipeline.add_argument("--sheets", nargs="+", help="정보를 추출할 시트 (기본: 갑지 을지)")
+    pipeline.add_argument("--input-sheet", default="Input")
+
+    generate = subparsers.add_parser("generate-po", help="발주서(또는 거래처)별 갑지/을지 워크북 생성")
+    generate.add_argument("file", help="Input 시트가 있는 업로드 파일")
+    generate.add_argument("output_dir")
+    generate.add_argument("--template", help="갑지/을지 템플릿 (기본: 업로드 파일)")
+    generate.add_argument("--group-by", choices=["order", "vendor"], default="order")
+    generate.add_argument("--layout", help="채울 셀 정의 JSON (기본: 압출 발주서 레이아웃)")
+    generate.add_argument("--workers", type=int, help="워커 프로세스 수 (기본: CPU 코어 수)")
+
+    export = subparsers.add_parser("export-input", help="발주서를 Input 시트 형식 .xlsx로 내보내기")
+    export.add_argument("source", help="orders JSON/JSONL 또는 Input 시트가 있는 워크북")
+    export.add_argument("output")
+
+    validate = subparsers.add_parser("validate", help="Input 시트 금액 정합성 검증")
+    validate.add_argument("file")
+    validate.add_argument("--engine", choices=["openpyxl", "xml"], default="xml")
+    validate.add_argument("--rounding", choices=["round", "floor", "ceil", "none"])
+    validate.add_argument("--tax-rate", type=float)
+    validate.add_argument("--tolerance", type=float, help="허용 오차 (원)")
+    validate.add_argument("--rules", nargs="+", help="검사할 규칙 ID (기본: 전체)")
+
+    rollup = subparsers.add_parser("rollup", help="발주서/거래처/현장/분류별 집계")
+    rollup.add_argument("file")
+    rollup.add_argument("--engine", choices=["openpyxl", "xml"], default="xml")
+    rollup.add_argument("--by", nargs="+", choices=["order", "vendor", "site", "category"],
+                        help="집계 기준 (기본: 전체)")
+
+    match = subparsers.add_parser("match-names", help="거래처명/현장명/납품처명을 마스터 ID로 매칭")
+    match.add_argument("file")
+    match.add_argument("--master", required=True, help="vendors/projects 마스터 JSON")
+    match.add_argument("--engine", choices=["openpyxl", "xml"], default="xml")
+    match.add_argument("--fields", nargs="+", choices=["vendorName", "siteName", "deliveryName"],
+                       help="매칭할 필드 (기본: 전체)")
+    match.add_argument("--min-score", type=float, help="후보 최소 점수")
+    match.add_argument("--accept-score", type=float, help="매칭 ID로 확정할 점수")
+
+    read_records = subparsers.add_parser("read-records", help="헤더로 레이아웃을 판별해 시트 행 변환")
+    read_records.add_argument("file")
+    read_records.add_argument("--sheet", help="읽을 시트 (기본: Input 또는 Input Sheet)")
+
+    category_tree = subparsers.add_parser("category-tree", help="분류 트리 합치기/조회")
+    category_tree.add_argument("trees", nargs="+", help="parse --category-tree 결과(또는 categoryTree) JSON")
+    category_tree.add_argument("--path", nargs="+", help="조회할 분류 경로 (기본: 전체)")
+    category_tree.add_argument("--prefix", help="라벨 접두어 검색")
+    category_tree.add_argument("--depth", type=int, help="tree에 포함할 하위 단계 수")
+    category_tree.add_argument("--merged", action="store_true", help="합친 트리(categoryTree) 포함")
+
+    verify = subparsers.add_parser("verify", help="서식 보존 검증")
+    verify.add_argument("file", nargs="?")
+    verify.add_argument("--compare", nargs=2, metavar=("ORIGINAL", "PROCESSED"))
+    verify.add_argument("--diff-mode", choices=["styles", "parts"], default="styles",
+                        help="--compare 비교 방식 (parts: 패키지 파트 단위)")
+
+    cache_stats = subparsers.add_parser("cache-stats", help="파싱 캐시 통계")
+    cache_stats.add_argument("--clear", action="store_true", help="캐시 비우기")
+
+    subparsers.add_parser("batch", help="여러 워크북 병렬 파싱 (po_batch)", add_help=False)
+    subparsers.add_parser("compile", help="모듈 바이트코드 미리 컴파일")
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+
+    # batch는 자체 인자 파서를 가진 po_batch로 그대로 넘김
+    if argv and argv[0] == "batch":
+        import po_batch
+        sys.argv = ["po_batch.py"] + argv[1:]
+        return po_batch.main()
+
+    options = _build_parser().parse_args(argv)
+
+    if options.command == "compile":
+        result = compile_modules()
+    else:
+        if options.command == "verify":
+            if options.compare:
+                args = {"original": options.compare[0], "processed": options.compare[1],
+                        "diff_mode": options.diff_mode}
+            elif options.file:
+                args = {"file": options.file}
+            else:
+                print("❌ 검증할 파일 또는 --compare가 필요합니다.", file=sys.stderr)
+                return 1
+        else:
+            args = {key: value for key, value in vars(options).items() if key != "command"}
+        output = sys.stdout
+
+        def emit(item):
+            output.write(json.dumps(item, ensure_ascii=False, default=str) + "\n")
+
+        result = run_command(options.command, args, emit)
+
+    print(json.dumps(result, ensure_ascii=False, default=str))
+    return 0 if result.get("success", True) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+파싱된 발주 데이터의 컬럼형(columnar) 중간 표현
+
+아이템마다 dict를 만드는 대신 필드별로 하나의 배열에 값을 쌓는다.
+
+- 숫자 필드: array('d') / array('q') 타입 배열 (numpy 배열로 바로 집계 가능)
+- 반복이 많은 문자열 필드(거래처명, 현장명, 분류, 납품처명 등): 사전 인코딩
+  (고유 문자열 목록 + 행별 정수 코드)
+- 거의 고유한 문자열 필드(품목명 등): 문자열 리스트
+
+JSON/dict 형태는 iter_records / to_records / table_to_po_orders로 필요할 때만 만든다.
+테이블을 쌓는 데는 numpy가 필요 없으므로 numpy는 집계 메서드 안에서 import한다.
+"""
+
+import sys
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# 필드 종류
+FLOAT = "float"      # 실수 배열
+INT = "int"          # 정수 배열
+CATEGORY = "category"  # 사전 인코딩 문자열
+TEXT = "text"        # 일반 문자열 리스트
+
+# po_template_parser 아이템 한 행의 스키마 (발주서 헤더 필드 포함)
+PO_ORDER_FIELDS = ["orderNumber", "orderDate", "siteName", "dueDate", "vendorName"]
+PO_ITEM_FIELDS = [
+    "itemName", "specification", "quantity", "unitPrice", "supplyAmount", "taxAmount",
+    "totalAmount", "categoryLv1", "categoryLv2", "categoryLv3", "deliveryName", "notes"
+]
+PO_ITEM_SCHEMA = {
+    "orderNumber": CATEGORY,
+    "orderDate": CATEGORY,
+    "siteName": CATEGORY,
+    "dueDate": CATEGORY,
+    "vendorName": CATEGORY,
+    "itemName": TEXT,
+    "specification": CATEGORY,
+    "quantity": FLOAT,
+    "unitPrice": FLOAT,
+    "supplyAmount": FLOAT,
+    "taxAmount": FLOAT,
+    "totalAmount": FLOAT,
+    "categoryLv1": CATEGORY,
+    "categoryLv2": CATEGORY,
+    "categoryLv3": CATEGORY,
+    "deliveryName": CATEGORY,
+    "notes": CATEGORY,
+}
+
+# 아이템의 Input 시트 행 번호 (build_po_item_table(row_numbers=True)에서 INT 필드로 추가)
+SHEET_ROW_FIELD = "sheetRow"
+
+# excel_parser.parse_excel_to_purchase_orders 한 행의 스키마 (13개 컬럼)
+PURCHASE_ORDER_SCHEMA = {
+    "order_number": CATEGORY,
+    "order_date": CATEGORY,
+    "item_name": TEXT,
+    "specification": CATEGORY,
+    "quantity": INT,
+    "unit_price": INT,
+    "supply_amount": INT,
+    "tax": INT,
+    "total_amount": INT,
+    "due_date": CATEGORY,
+    "vendor_name": CATEGORY,
+    "delivery_name": CATEGORY,
+    "note": CATEGORY,
+}
+
+# excel_parser_with_categories.parse_excel_with_categories 한 행의 스키마 (16개 컬럼)
+PURCHASE_ORDER_CATEGORY_SCHEMA = {
+    "order_number": CATEGORY,
+    "order_date": CATEGORY,
+    "category_lv1": CATEGORY,
+    "category_lv2": CATEGORY,
+    "category_lv3": CATEGORY,
+    "item_name": TEXT,
+    "specification": CATEGORY,
+    "quantity": INT,
+    "unit_price": INT,
+    "supply_amount": INT,
+    "tax": INT,
+    "total_amount": INT,
+    "due_date": CATEGORY,
+    "vendor_name": CATEGORY,
+    "delivery_name": CATEGORY,
+    "note": CATEGORY,
+}
+
+
+class DictionaryColumn:
+    """사전 인코딩 문자열 컬럼: 고유값 목록과 행별 코드(array('i'))"""
+
+    __slots__ = ("codes", "values", "_index")
+
+    def __init__(self):
+        self.codes = array("i")
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def append(self, value: str) -> None:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def __getitem__(self, row: int) -> str:
+        return self.values[self.codes[row]]
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def nbytes(self) -> int:
+        return (self.codes.itemsize * len(self.codes)
+                + sum(sys.getsizeof(value) for value in self.values))
+
+
+class ColumnarTable:
+    """
+    스키마(필드명 → 종류)를 가진 컬럼형 테이블
+
+    Args:
+        schema: 필드명 → FLOAT / INT / CATEGORY / TEXT (순서가 레코드 키 순서)
+    """
+
+    def __init__(self, schema: Dict[str, str]):
+        self.schema = dict(schema)
+        self.fields = list(schema.keys())
+        self.columns: Dict[str, Any] = {}
+        for name, kind in self.schema.items():
+            if kind == FLOAT:
+                self.columns[name] = array("d")
+            elif kind == INT:
+                self.columns[name] = array("q")
+            elif kind == CATEGORY:
+                self.columns[name] = DictionaryColumn()
+            elif kind == TEXT:
+                self.columns[name] = []
+            else:
+                raise ValueError(f"지원하지 않는 필드 종류입니다: {name}={kind}")
+        self._appenders = [self.columns[name].append for name in self.fields]
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, values: Sequence[Any]) -> None:
+        """스키마 순서대로 값 한 행 추가"""
+        for append, value in zip(self._appenders, values):
+            append(value)
+        self._length += 1
+
+    def append_record(self, record: Dict[str, Any]) -> None:
+        """dict 레코드 한 행 추가 (스키마 필드만 사용)"""
+        self.append([record[name] for name in self.fields])
+
+    def numeric(self, name: str) -> "np.ndarray":
+        """
+        숫자 필드를 numpy 배열로 반환
+
+        array 버퍼를 한 번 memcpy한 복사본이므로 이후에 행을 추가해도 안전하다.
+        """
+        import numpy as np
+
+        dtype = np.float64 if self.schema[name] == FLOAT else np.int64
+        return np.array(self.columns[name], dtype=dtype)
+
+    def codes(self, name: str) -> Tuple["np.ndarray", List[str]]:
+        """사전 인코딩 필드의 (행별 코드 배열, 고유값 목록) 반환. 코드는 첫 등장 순서"""
+        import numpy as np
+
+        column = self.columns[name]
+        if self.schema[name] != CATEGORY:
+            raise ValueError(f"사전 인코딩 필드가 아닙니다: {name}")
+        return np.array(column.codes, dtype=np.int32), column.values
+
+    def sum_by(self, group_field: str, value_field: str) -> Dict[str, float]:
+        """group_field 값별 value_field 합계"""
+        import numpy as np
+
+        codes, categories = self.codes(group_field)
+        totals = np.bincount(codes, weights=self.numeric(value_field), minlength=len(categories))
+        return dict(zip(categories, totals.tolist()))
+
+    def count_by(self, group_field: str) -> Dict[str, int]:
+        """group_field 값별 행 수"""
+        import numpy as np
+
+        codes, categories = self.codes(group_field)
+        counts = np.bincount(codes, minlength=len(categories))
+        return dict(zip(categories, counts.tolist()))
+
+    def record(self, row: int, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """한 행을 dict로 변환"""
+        return {name: self.columns[name][row] for name in (fields or self.fields)}
+
+    def iter_records(self, fields: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """행을 dict로 하나씩 생성 (필요할 때만 JSON 형태를 만드는 지연 뷰)"""
+        fields = fields or self.fields
+        decoded = []
+        for name in fields:
+            column = self.columns[name]
+            if self.schema[name] == CATEGORY:
+                decoded.append(map(column.values.__getitem__, column.codes))
+            else:
+                decoded.append(iter(column))
+        for row_values in zip(*decoded):
+            yield dict(zip(fields, row_values))
+
+    def to_records(self, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        return list(self.iter_records(fields))
+
+    def nbytes(self) -> int:
+        """컬럼 데이터가 차지하는 대략적인 메모리 (바이트)"""
+        total = 0
+        for name in self.fields:
+            column = self.columns[name]
+            kind = self.schema[name]
+            if kind in (FLOAT, INT):
+                total += column.itemsize * len(column)
+            elif kind == CATEGORY:
+                total += column.nbytes()
+            else:
+                total += sys.getsizeof(column) + sum(sys.getsizeof(value) for value in column)
+        return total
+
+
+def table_to_po_orders(table: ColumnarTable) -> List[Dict[str, Any]]:
+    """
+    PO_ITEM_SCHEMA 테이블을 parse_po_template_input의 orders 형태로 변환
+
+    발주번호 코드로 아이템을 묶고, 발주서 헤더는 각 발주번호의 첫 행에서 가져오며,
+    총액은 코드별 bincount로 한 번에 계산한다.
+    """
+    import numpy as np
+
+    if len(table) == 0:
+        return []
+
+    codes, order_numbers = table.codes("orderNumber")
+    order_count = len(order_numbers)
+    totals = np.bincount(codes, weights=table.numeric("totalAmount"), minlength=order_count)
+
+    # 코드는 첫 등장 순서로 부여되므로 안정 정렬 결과가 발주서 순서 그대로의 아이템 목록
+    item_order = np.argsort(codes, kind="stable")
+    boundaries = np.cumsum(np.bincount(codes, minlength=order_count))[:-1]
+    rows_by_order = np.split(item_order, boundaries)
+
+    orders = []
+    for order_code, rows in enumerate(rows_by_order):
+        first_row = int(rows[0])
+        order = table.record(first_row, PO_ORDER_FIELDS)
+        order["totalAmount"] = float(totals[order_code])
+        order["items"] = [table.record(int(row), PO_ITEM_FIELDS) for row in rows]
+        orders.append(order)
+    return orders
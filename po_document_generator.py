@@ -0,0 +1,538 @@
+"""
+발주서별(또는 거래처별) 갑지/을지 워크북 생성기
+
+parse_po_template_input으로 묶은 발주서마다 템플릿을 openpyxl로 열고 저장하면
+문서 한 건에 수백 ms가 든다. POTemplate은 템플릿을 한 번만 읽어
+
+- 갑지/을지 외의 시트(Input 등)를 빼는 파트 변경 내용(xlsx_sheet_remover.plan_sheet_subset)과
+- 레이아웃이 값을 채우는 셀 위치로 잘라 둔 시트 XML 조각
+
+을 캐시해 두고, 문서마다 채울 셀의 <c> 요소만 새로 만들어 이어붙인다. 나머지 파트
+(스타일, 테마, 공유 문자열, 그림 등)는 템플릿의 압축 바이트를 그대로 복사한다.
+수식 셀은 그대로 두고 Excel이 열 때 다시 계산하도록 calcPr/@fullCalcOnLoad를 켠다.
+
+레이아웃:
+    {"cells": [[시트, 셀, 값 서식], ...],
+     "items": {"sheet", "first_row", "row_step", "max_items", "columns": {컬럼: 값 서식}}}
+
+    값 서식은 "{필드}"(값을 그대로, 숫자는 숫자로) 또는 "발주번호: {orderNumber}" 같은
+    str.format 문자열이다. 헤더 필드는 parse_po_template_input의 orders 항목 키,
+    아이템 필드는 items 항목 키와 "no"(1부터 시작하는 순번)이다.
+
+    아이템 슬롯(first_row부터 row_step 간격으로 max_items개) 행에 템플릿이 담고 있던
+    상수 값 셀(예시 품목의 색상/길이/단중 등)은 columns에 없어도 모두 비운다. 수식 셀은
+    그대로 두므로 중량/합계 수식은 채운 값으로만 계산된다.
+
+사용 예:
+    from po_document_generator import generate_po_documents
+    for result in generate_po_documents("upload.xlsx", orders, "out/"):
+        print(result["path"])
+"""
+
+import io
+import os
+import re
+import struct
+import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from atomic_write import atomic_output
+from excel_dates import PY_EPOCH_1900, PY_EPOCH_1904
+from xlsx_reader import XlsxPackage
+from xlsx_sheet_remover import (
+    CALC_CHAIN_TYPE_SUFFIX, CONTENT_TYPES_PART, _RawZipWriter, _parse_relationships, _rels_path,
+    _workbook_part, plan_sheet_subset, rewrite_content_types,
+)
+
+# 익진 압출 발주서 템플릿(갑지: 표지, 을지: 6행 간격 품목 리스트) 기준 기본 레이아웃
+DEFAULT_LAYOUT = {
+    "cells": [
+        ["갑지", "C3", "{orderDate}"],
+        ["갑지", "M3", "{orderNumber}"],
+        ["갑지", "C4", "{siteName}"],
+        ["갑지", "I10", "{dueDate}"],
+        ["갑지", "L10", "{vendorName}"],
+        ["을지", "A3", "◆ 공   사   명 :   {siteName}"],
+        ["을지", "J3", "작성일자 : {orderDate}"],
+    ],
+    "items": {
+        "sheet": "을지",
+        "first_row": 5,
+        "row_step": 6,
+        "max_items": 9,
+        "columns": {
+            "A": "{no}",
+            "B": "{itemName}",
+            "C": "{specification}",
+            "H": "{quantity}",
+            "J": "{notes}"
+        }
+    }
+}
+
+DEFAULT_SHEETS = ["갑지", "을지"]
+
+_FIELD_ONLY_RE = re.compile(r"^\{(\w+)\}$")
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+_CELL_REF_SPLIT_RE = re.compile(r"^([A-Z]+)(\d+)$")
+_SHEET_DATA_RE = re.compile(r"<((?:\w+:)?)sheetData\b[^>]*?(?:/>|>(.*?)</\1sheetData>)", re.S)
+_ROW_RE = re.compile(r"<((?:\w+:)?)row\b([^>]*?)(?:/>|>(.*?)</\1row>)", re.S)
+_CELL_RE = re.compile(r"<((?:\w+:)?)c\b([^>]*?)(?:/>|>.*?</\1c>)", re.S)
+_CELL_VALUE_RE = re.compile(r"<(?:\w+:)?(?:v|is)\b")
+_CELL_FORMULA_RE = re.compile(r"<(?:\w+:)?f\b")
+_R_ATTR_RE = re.compile(r'\br="([A-Z]+)?(\d+)?"')
+_STYLE_ATTR_RE = re.compile(r'\bs="(\d+)"')
+_SPANS_ATTR_RE = re.compile(r'\s+spans="[^"]*"')
+_CALC_PR_RE = re.compile(r"<((?:\w+:)?)calcPr\b([^>]*?)/>")
+_WORKBOOK_END_RE = re.compile(r"</((?:\w+:)?)workbook>")
+
+# 파일명에 쓸 수 없는 문자
+_UNSAFE_FILENAME_RE = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def _column_number(letters: str) -> int:
+    number = 0
+    for letter in letters:
+        number = number * 26 + (ord(letter) - 64)
+    return number
+
+
+def _column_letters(number: int) -> str:
+    letters = ""
+    while number:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _split_ref(cell_ref: str) -> Tuple[str, int]:
+    match = _CELL_REF_SPLIT_RE.match(cell_ref)
+    if not match:
+        raise ValueError(f"잘못된 셀 주소입니다: {cell_ref}")
+    return match.group(1), int(match.group(2))
+
+
+def _format_value(value_format: str, values: Dict[str, Any]) -> Any:
+    """값 서식 적용. "{필드}" 하나뿐이면 원래 값(숫자, None 등)을 그대로 반환"""
+    field = _FIELD_ONLY_RE.match(value_format)
+    if field:
+        return values.get(field.group(1))
+    return value_format.format_map({key: "" if value is None else value for key, value in values.items()})
+
+
+def _to_date_serial(value: str, date1904: bool = False) -> int:
+    """
+    'YYYY-MM-DD' 문자열을 템플릿 날짜 체계의 Excel 시리얼 번호로 변환
+
+    1900 체계에서는 존재하지 않는 1900-02-29 때문에 1900-03-01 이전 날짜를 하루 당긴다
+    (읽을 때 excel_serial_to_datetime이 하루 더하는 것의 역).
+    """
+    parsed = datetime.strptime(value, "%Y-%m-%d")
+    if date1904:
+        return (parsed - PY_EPOCH_1904).days
+    days = (parsed - PY_EPOCH_1900).days
+    return days - 1 if 0 < days < 61 else days
+
+
+def _is_constant_cell(cell_xml: str) -> bool:
+    """수식 없이 값만 있는 셀인지 여부"""
+    return _CELL_VALUE_RE.search(cell_xml) is not None and _CELL_FORMULA_RE.search(cell_xml) is None
+
+
+class _StaticChunk:
+    """시트 XML의 고정 조각 (원문 바이트와 압축 블록)"""
+
+    __slots__ = ("data", "compressed")
+
+    def __init__(self, data: bytes, compressed: bytes):
+        self.data = data
+        self.compressed = compressed
+
+
+# 마지막 표시가 있는 빈 고정 허프만 블록 (deflate 스트림 끝)
+_FINAL_EMPTY_BLOCK = b"\x03\x00"
+_MAX_STORED_BLOCK = 0xFFFF
+
+
+def _compress_static(text: str) -> _StaticChunk:
+    """바이트 경계에서 끝나는(sync flush) 독립 raw deflate 블록으로 압축"""
+    data = text.encode("utf-8")
+    compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+    return _StaticChunk(data, compressor.compress(data) + compressor.flush(zlib.Z_SYNC_FLUSH))
+
+
+def _stored_blocks(data: bytes) -> bytes:
+    """압축하지 않은 deflate stored 블록 (셀 몇 개 크기는 압축 비용이 더 큼)"""
+    blocks = []
+    for start in range(0, len(data), _MAX_STORED_BLOCK):
+        chunk = data[start:start + _MAX_STORED_BLOCK]
+        blocks.append(struct.pack("<BHH", 0, len(chunk), len(chunk) ^ 0xFFFF) + chunk)
+    return b"".join(blocks)
+
+
+class _SheetTemplate:
+    """
+    채울 셀 위치에서 잘라 둔 시트 XML
+
+    segments는 고정 XML 조각(원문 바이트, 미리 압축한 raw deflate 블록)과
+    셀 슬롯(셀 주소, 스타일 번호)이 번갈아 오는 목록이다. 템플릿에 없던 셀/행은
+    준비 단계에서 빈 셀로 추가해 둔다. clear_rows의 행에 있는 상수 값 셀(수식 제외)도
+    슬롯으로 만들어, 값을 주지 않으면 스타일만 남긴 빈 셀이 된다. 고정 조각은 각각 새 압축기로 압축해 sync flush로
+    끝내 두었으므로, 문서마다 슬롯 셀만 stored 블록으로 끼워 이어붙이면 유효한 deflate
+    스트림이 된다 (시트 XML 전체를 문서마다 다시 압축하지 않음).
+    """
+
+    def __init__(self, xml: str, cell_refs: List[str], clear_rows: Optional[set] = None):
+        wanted: Dict[int, Dict[int, str]] = {}
+        for cell_ref in cell_refs:
+            letters, row = _split_ref(cell_ref)
+            wanted.setdefault(row, {})[_column_number(letters)] = cell_ref
+
+        sheet_data = _SHEET_DATA_RE.search(xml)
+        if sheet_data is None:
+            raise ValueError("시트에 sheetData가 없습니다.")
+        prefix = sheet_data.group(1)
+        inner = sheet_data.group(2) or ""
+
+        # 행 번호 → (행 시작 태그 속성, [(컬럼 번호, 셀 XML)])
+        rows: Dict[int, Tuple[str, List[Tuple[int, str]]]] = {}
+        for row_match in _ROW_RE.finditer(inner):
+            row_attrs = row_match.group(2)
+            row_number = int(re.search(r'\br="(\d+)"', row_attrs).group(1))
+            cells = []
+            next_column = 1
+            for cell_match in _CELL_RE.finditer(row_match.group(3) or ""):
+                ref = _R_ATTR_RE.search(cell_match.group(2))
+                column = _column_number(ref.group(1)) if ref and ref.group(1) else next_column
+                cells.append((column, cell_match.group(0)))
+                next_column = column + 1
+            rows[row_number] = (row_attrs, cells)
+
+        self.segments: List[Any] = []
+        static: List[str] = [xml[:sheet_data.start()], f"<{prefix}sheetData>"]
+        for row_number in sorted(set(rows) | set(wanted)):
+            row_attrs, cells = rows.get(row_number, (f' r="{row_number}"', []))
+            row_wanted = wanted.get(row_number, {})
+            if row_wanted:
+                # 셀을 추가하는 행은 spans 힌트가 맞지 않을 수 있으므로 제거
+                row_attrs = _SPANS_ATTR_RE.sub("", row_attrs)
+                existing = {column for column, _ in cells}
+                cells = sorted(cells + [
+                    (column, f'<{prefix}c r="{cell_ref}"/>')
+                    for column, cell_ref in row_wanted.items() if column not in existing
+                ])
+            static.append(f"<{prefix}row{row_attrs}>")
+            clear_row = clear_rows is not None and row_number in clear_rows
+            for column, cell_xml in cells:
+                cell_ref = row_wanted.get(column)
+                if cell_ref is None and clear_row and _is_constant_cell(cell_xml):
+                    cell_ref = f"{_column_letters(column)}{row_number}"
+                if cell_ref is None:
+                    static.append(cell_xml)
+                    continue
+                self.segments.append("".join(static))
+                static = []
+                style = _STYLE_ATTR_RE.search(cell_xml.split(">", 1)[0])
+                self.segments.append((cell_ref, int(style.group(1)) if style else None))
+            static.append(f"</{prefix}row>")
+        static.append(f"</{prefix}sheetData>")
+        static.append(xml[sheet_data.end():])
+        self.segments.append("".join(static))
+        self.segments = [
+            _compress_static(segment) if isinstance(segment, str) else segment
+            for segment in self.segments if segment != ""
+        ]
+        self.prefix = prefix
+
+    def render(self, values: Dict[str, Any], date_styles: Dict[int, str],
+               date1904: bool = False) -> Tuple[bytes, int, int]:
+        """
+        셀 주소 → 값으로 슬롯을 채운 시트 XML (값이 없는 슬롯은 스타일만 남긴 빈 셀)
+
+        Returns:
+            Tuple: (raw deflate 데이터, CRC-32, 원래 크기)
+        """
+        prefix = self.prefix
+        compressed = []
+        crc = 0
+        size = 0
+        for segment in self.segments:
+            if isinstance(segment, _StaticChunk):
+                compressed.append(segment.compressed)
+                crc = zlib.crc32(segment.data, crc)
+                size += len(segment.data)
+                continue
+            cell_ref, style = segment
+            style_attr = f' s="{style}"' if style is not None else ""
+            value = values.get(cell_ref)
+            if isinstance(value, str) and style in date_styles and _ISO_DATE_RE.match(value):
+                value = _to_date_serial(value, date1904)
+            if value is None or value == "":
+                cell_xml = f'<{prefix}c r="{cell_ref}"{style_attr}/>'
+            elif isinstance(value, bool):
+                cell_xml = f'<{prefix}c r="{cell_ref}"{style_attr} t="b"><{prefix}v>{int(value)}</{prefix}v></{prefix}c>'
+            elif isinstance(value, (int, float)):
+                cell_xml = f'<{prefix}c r="{cell_ref}"{style_attr}><{prefix}v>{value!r}</{prefix}v></{prefix}c>'
+            else:
+                text = escape(str(value))
+                cell_xml = (
+                    f'<{prefix}c r="{cell_ref}"{style_attr} t="inlineStr"><{prefix}is>'
+                    f'<{prefix}t xml:space="preserve">{text}</{prefix}t></{prefix}is></{prefix}c>'
+                )
+            data = cell_xml.encode("utf-8")
+            compressed.append(_stored_blocks(data))
+            crc = zlib.crc32(data, crc)
+            size += len(data)
+        compressed.append(_FINAL_EMPTY_BLOCK)
+        return b"".join(compressed), crc & 0xFFFFFFFF, size
+
+
+class POTemplate:
+    """
+    한 번 읽어 캐시해 둔 발주서 템플릿
+
+    Args:
+        template_path: 갑지/을지 시트가 있는 템플릿(또는 업로드 원본) 경로
+        layout: 채울 셀 정의 (기본: DEFAULT_LAYOUT)
+        sheets: 결과 워크북에 남길 시트 (기본: 갑지, 을지)
+    """
+
+    def __init__(self, template_path: str, layout: Optional[Dict[str, Any]] = None,
+                 sheets: Optional[List[str]] = None):
+        self.layout = layout or DEFAULT_LAYOUT
+        sheets = sheets or DEFAULT_SHEETS
+        with open(template_path, "rb") as source:
+            self.data = source.read()
+        self.archive = zipfile.ZipFile(io.BytesIO(self.data))
+
+        with XlsxPackage(io.BytesIO(self.data)) as package:
+            missing = [name for name in sheets if name not in package.sheet_paths]
+            if missing:
+                raise ValueError(f"템플릿에 시트가 없습니다: {', '.join(missing)}")
+            sheet_paths = package.sheet_paths
+            self.date_styles = package.date_styles
+            self.date1904 = package.date1904
+
+        plan = plan_sheet_subset(self.archive, sheets)
+        self.dropped = set(plan["dropped"])
+        self.replaced = dict(plan["replaced"])
+        self._enable_full_calc()
+
+        # 시트별로 채울 셀 주소와 템플릿 값을 비울 아이템 슬롯 행 수집
+        items = self.layout.get("items")
+        cells_by_sheet: Dict[str, List[str]] = {}
+        clear_rows: Dict[str, set] = {}
+        for sheet_name, cell_ref, _ in self.layout.get("cells", []):
+            cells_by_sheet.setdefault(sheet_name, []).append(cell_ref)
+        if items:
+            for index in range(items["max_items"]):
+                row = items["first_row"] + index * items["row_step"]
+                for column in items["columns"]:
+                    cells_by_sheet.setdefault(items["sheet"], []).append(f"{column}{row}")
+            clear_rows[items["sheet"]] = set(range(
+                items["first_row"], items["first_row"] + items["max_items"] * items["row_step"]
+            ))
+
+        self.sheet_templates: Dict[str, _SheetTemplate] = {}
+        self.sheet_parts: Dict[str, str] = {}
+        for sheet_name, cell_refs in cells_by_sheet.items():
+            if sheet_name not in sheets:
+                raise ValueError(f"레이아웃의 시트가 결과 시트 목록에 없습니다: {sheet_name}")
+            part = sheet_paths[sheet_name]
+            self.sheet_parts[sheet_name] = part
+            self.sheet_templates[part] = _SheetTemplate(self.archive.read(part).decode("utf-8"), cell_refs,
+                                                        clear_rows.get(sheet_name))
+
+        # 바꾼 파트(workbook.xml, [Content_Types].xml 등)는 문서마다 같으므로 한 번만 압축
+        self.compressed_parts = {}
+        for part, data in self.replaced.items():
+            compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+            self.compressed_parts[part] = (
+                compressor.compress(data) + compressor.flush(), zlib.crc32(data) & 0xFFFFFFFF, len(data)
+            )
+
+    def _enable_full_calc(self) -> None:
+        """계산 체인을 빼고 워크북을 열 때 수식을 다시 계산하도록 설정 (채운 값에 맞춰 재계산)"""
+        def read_text(name):
+            return (self.replaced.get(name) or self.archive.read(name)).decode("utf-8")
+
+        workbook_part = _workbook_part(read_text)
+        xml = read_text(workbook_part)
+        calc_pr = _CALC_PR_RE.search(xml)
+        if calc_pr is None:
+            end = _WORKBOOK_END_RE.search(xml)
+            xml = xml[:end.start()] + f'<{end.group(1)}calcPr fullCalcOnLoad="1"/>' + xml[end.start():]
+        elif "fullCalcOnLoad=" not in calc_pr.group(2):
+            xml = xml[:calc_pr.end() - 2] + ' fullCalcOnLoad="1"/>' + xml[calc_pr.end():]
+        self.replaced[workbook_part] = xml.encode("utf-8")
+
+        # 시트를 빼지 않은 템플릿에서도 calcChain은 제거 (값을 바꾼 셀과 맞지 않을 수 있음)
+        rels_part = _rels_path(workbook_part)
+        rels_xml = read_text(rels_part)
+        calc_chain_parts = set()
+        for relationship in _parse_relationships(rels_xml, workbook_part):
+            if relationship["type"].endswith(CALC_CHAIN_TYPE_SUFFIX):
+                calc_chain_parts.add(relationship["target"])
+                rels_xml = rels_xml.replace(relationship["element"], "", 1)
+        if calc_chain_parts:
+            self.dropped |= calc_chain_parts
+            self.replaced[rels_part] = rels_xml.encode("utf-8")
+            self.replaced[CONTENT_TYPES_PART] = rewrite_content_types(
+                read_text(CONTENT_TYPES_PART), calc_chain_parts
+            ).encode("utf-8")
+
+    def cell_values(self, order: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """발주서 한 건을 시트 → {셀 주소: 값}으로 변환"""
+        values: Dict[str, Dict[str, Any]] = {name: {} for name in self.sheet_parts}
+        for sheet_name, cell_ref, value_format in self.layout.get("cells", []):
+            values[sheet_name][cell_ref] = _format_value(value_format, order)
+
+        items = self.layout.get("items")
+        if items:
+            order_items = order.get("items", [])
+            if len(order_items) > items["max_items"]:
+                raise ValueError(
+                    f"아이템 수({len(order_items)})가 템플릿 행 수({items['max_items']})를 초과합니다."
+                )
+            for index, item in enumerate(order_items):
+                row = items["first_row"] + index * items["row_step"]
+                item_values = {**item, "no": index + 1}
+                for column, value_format in items["columns"].items():
+                    values[items["sheet"]][f"{column}{row}"] = _format_value(value_format, item_values)
+        return values
+
+    def write(self, order: Dict[str, Any], output) -> None:
+        """발주서 한 건의 워크북을 output(바이너리 파일 객체)에 기록"""
+        rendered = {}
+        for sheet_name, cell_values in self.cell_values(order).items():
+            part = self.sheet_parts[sheet_name]
+            rendered[part] = self.sheet_templates[part].render(cell_values, self.date_styles, self.date1904)
+
+        source = memoryview(self.data)
+        writer = _RawZipWriter(output)
+        for info in self.archive.infolist():
+            if info.filename in self.dropped:
+                continue
+            compressed = rendered.get(info.filename) or self.compressed_parts.get(info.filename)
+            if compressed is not None:
+                writer.write_compressed(info, *compressed)
+            else:
+                writer.copy_raw(source, info)
+        writer.close(self.archive.comment)
+
+    def render(self, order: Dict[str, Any]) -> bytes:
+        """발주서 한 건의 워크북 바이트"""
+        output = io.BytesIO()
+        self.write(order, output)
+        return output.getvalue()
+
+
+def group_orders(orders: List[Dict[str, Any]], group_by: str = "order") -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    문서 단위로 발주서 묶기
+
+    Args:
+        orders: parse_po_template_input의 orders
+        group_by: "order"(발주서마다 한 문서) 또는 "vendor"(거래처마다 한 문서,
+                  아이템은 발주서 순서대로 이어붙이고 발주번호는 쉼표로 연결)
+
+    Returns:
+        List: (문서 키, 문서에 채울 발주서 dict) 목록
+    """
+    if group_by == "order":
+        return [(order["orderNumber"], order) for order in orders]
+    if group_by != "vendor":
+        raise ValueError(f"지원하지 않는 묶음 기준입니다: {group_by}")
+
+    documents: Dict[str, Dict[str, Any]] = {}
+    for order in orders:
+        vendor = order.get("vendorName") or ""
+        document = documents.get(vendor)
+        if document is None:
+            documents[vendor] = {**order, "orderNumbers": [order["orderNumber"]], "items": list(order["items"])}
+            continue
+        document["orderNumbers"].append(order["orderNumber"])
+        document["items"].extend(order["items"])
+        document["totalAmount"] += order.get("totalAmount", 0)
+    for document in documents.values():
+        document["orderNumber"] = ", ".join(document.pop("orderNumbers"))
+    return list(documents.items())
+
+
+def _document_file_name(key: str, used: set) -> str:
+    base = _UNSAFE_FILENAME_RE.sub("_", key).strip("._") or "PO"
+    name = base
+    suffix = 2
+    while name in used:
+        name = f"{base}_{suffix}"
+        suffix += 1
+    used.add(name)
+    return name + ".xlsx"
+
+
+# 워커 프로세스마다 한 번 만드는 템플릿
+_worker_template: Optional[POTemplate] = None
+
+
+def _init_worker(template_path: str, layout: Optional[Dict[str, Any]], sheets: Optional[List[str]]) -> None:
+    global _worker_template
+    _worker_template = POTemplate(template_path, layout, sheets)
+
+
+def _write_document(job: Tuple[str, Dict[str, Any], str]) -> Dict[str, Any]:
+    key, document, path = job
+    try:
+        with atomic_output(path) as output:
+            _worker_template.write(document, output)
+        return {"key": key, "success": True, "path": path, "items": len(document.get("items", []))}
+    except Exception as e:
+        return {"key": key, "success": False, "path": path, "error": str(e)}
+
+
+def generate_po_documents(template_path: str, orders: List[Dict[str, Any]], output_dir: str,
+                          group_by: str = "order", layout: Optional[Dict[str, Any]] = None,
+                          sheets: Optional[List[str]] = None,
+                          max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    발주서(또는 거래처)마다 갑지/을지 워크북을 만들어 output_dir에 저장
+
+    문서가 많으면 프로세스 풀에서 나눠 만들며, 각 워커는 템플릿을 한 번만 읽는다.
+    결과는 문서 순서대로 yield된다.
+
+    Args:
+        template_path: 템플릿 경로 (업로드 원본을 그대로 써도 됨)
+        orders: parse_po_template_input의 orders
+        output_dir: 결과 디렉토리 (없으면 생성)
+        group_by: "order" 또는 "vendor" (group_orders 참고)
+        layout: 채울 셀 정의 (기본: DEFAULT_LAYOUT)
+        sheets: 결과에 남길 시트 (기본: 갑지, 을지)
+        max_workers: 워커 프로세스 수 (기본: CPU 코어 수, 1이면 현재 프로세스에서 처리)
+
+    Yields:
+        Dict: {"key", "success", "path", "items"} 또는 실패 시 {"key", "success": False, "path", "error"}
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    used_names: set = set()
+    jobs = [
+        (key, document, os.path.join(output_dir, _document_file_name(key, used_names)))
+        for key, document in group_orders(orders, group_by)
+    ]
+    if not jobs:
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    # 문서 수가 적으면 프로세스 기동 비용이 더 크므로 현재 프로세스에서 처리
+    workers = max(1, min(workers, len(jobs) // 50 or 1))
+    if workers == 1:
+        _init_worker(template_path, layout, sheets)
+        for job in jobs:
+            yield _write_document(job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(template_path, layout, sheets)) as executor:
+        yield from executor.map(_write_document, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
@@ -0,0 +1,329 @@
+"""
+발주서를 Input 시트 형식(.xlsx)으로 내보내기
+
+create_new_sample.py 등은 openpyxl 일반 모드로 셀을 하나씩 만들기 때문에 행 수만큼
+메모리를 쓰고, 발주서를 다시 편집할 수 있는 Input 시트로 되돌리는 기능은 없었다.
+이 모듈은 워크시트 XML을 직접 생성해 zip 멤버에 청크 단위로 흘려 쓴다.
+
+- 헤더 행은 굵은 글꼴/배경색/테두리, 컬럼 너비 지정, 1행 틀 고정
+- 발주일/납기일은 날짜 서식(yyyy-mm-dd)의 시리얼 번호, 금액은 #,##0 서식
+- 문자열은 인라인 문자열(t="inlineStr")로 써서 공유 문자열 표를 메모리에 모으지 않음
+  (10만 행 이상도 메모리 사용량이 행 수와 무관하게 일정)
+
+컬럼 순서는 po_template_parser의 Input 시트(A~Q 17개 컬럼)와 같으므로, 내보낸 파일을
+parse_po_template_input으로 다시 파싱하면 같은 orders가 나온다.
+
+사용 예:
+    from po_input_exporter import export_orders_to_input
+    export_orders_to_input(result["orders"], "input.xlsx")
+"""
+
+import json
+import zipfile
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+from xml.sax.saxutils import escape
+
+from atomic_write import atomic_output
+from excel_dates import DATE_CACHE_SIZE, PY_EPOCH_1900
+from po_records import POOrderBook
+
+# (헤더, 컬럼 너비, 값 종류) - po_schema_registry.SCHEMA_LAYOUTS["po_template"]의 컬럼 순서
+INPUT_COLUMNS = [
+    ("발주번호", 14, "text"),
+    ("발주일", 12, "date"),
+    ("현장명", 24, "text"),
+    ("대분류", 12, "text"),
+    ("중분류", 14, "text"),
+    ("소분류", 12, "text"),
+    ("품목명", 24, "text"),
+    ("규격", 16, "text"),
+    ("수량", 10, "number"),
+    ("단가", 12, "amount"),
+    ("공급가액", 14, "amount"),
+    ("세액", 12, "amount"),
+    ("총금액", 14, "amount"),
+    ("납기일", 12, "date"),
+    ("거래처명", 16, "text"),
+    ("납품처명", 16, "text"),
+    ("비고", 20, "text"),
+]
+
+# 이 행 수마다 시트 XML을 zip 멤버에 기록
+ROWS_PER_CHUNK = 1000
+
+# styles.xml의 cellXfs 순서: 0 기본, 1 헤더, 2 날짜, 3 금액
+_STYLE_BY_KIND = {"text": 0, "number": 0, "date": 2, "amount": 3}
+_HEADER_STYLE = 1
+_DATE_FORMAT_ID = 164
+_AMOUNT_FORMAT_ID = 3  # 기본 제공 "#,##0"
+
+_SHEET_NAME = "Input"
+
+_CONTENT_TYPES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '</Types>'
+)
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+_WORKBOOK_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    f'<sheets><sheet name="{_SHEET_NAME}" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+_WORKBOOK_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '<Relationship Id="rId2" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/>'
+    '</Relationships>'
+)
+
+_STYLES_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    f'<numFmts count="1"><numFmt numFmtId="{_DATE_FORMAT_ID}" formatCode="yyyy\\-mm\\-dd"/></numFmts>'
+    '<fonts count="2">'
+    '<font><sz val="11"/><name val="맑은 고딕"/><family val="3"/><charset val="129"/></font>'
+    '<font><b/><sz val="11"/><name val="맑은 고딕"/><family val="3"/><charset val="129"/></font>'
+    '</fonts>'
+    '<fills count="3">'
+    '<fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill>'
+    '<fill><patternFill patternType="solid"><fgColor rgb="FFD9E1F2"/><bgColor indexed="64"/></patternFill></fill>'
+    '</fills>'
+    '<borders count="2">'
+    '<border><left/><right/><top/><bottom/><diagonal/></border>'
+    '<border><left style="thin"><color auto="1"/></left><right style="thin"><color auto="1"/></right>'
+    '<top style="thin"><color auto="1"/></top><bottom style="thin"><color auto="1"/></bottom><diagonal/></border>'
+    '</borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="4">'
+    '<xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/>'
+    '<xf numFmtId="0" fontId="1" fillId="2" borderId="1" xfId="0" applyFont="1" applyFill="1" '
+    'applyBorder="1" applyAlignment="1"><alignment horizontal="center" vertical="center"/></xf>'
+    f'<xf numFmtId="{_DATE_FORMAT_ID}" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    f'<xf numFmtId="{_AMOUNT_FORMAT_ID}" fontId="0" fillId="0" borderId="0" xfId="0" applyNumberFormat="1"/>'
+    '</cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+
+def _column_letter(index: int) -> str:
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+_COLUMN_LETTERS = [_column_letter(index) for index in range(1, len(INPUT_COLUMNS) + 1)]
+_COLUMN_KINDS = [kind for _, _, kind in INPUT_COLUMNS]
+
+
+def _date_serial(value: Any) -> Optional[float]:
+    """YYYY-MM-DD 문자열/date/datetime을 Excel 1900 시리얼 번호로 변환 (해석할 수 없으면 None)"""
+    if isinstance(value, datetime):
+        delta = value - PY_EPOCH_1900
+        return _leap_bug_adjusted(delta.days) + delta.seconds / 86400
+    if isinstance(value, date):
+        return _leap_bug_adjusted((value - PY_EPOCH_1900.date()).days)
+    if isinstance(value, str):
+        return _date_string_serial(value[:10])
+    return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _date_string_serial(value: str) -> Optional[int]:
+    # 발주일/납기일은 같은 값이 반복되므로 strptime 결과를 캐시
+    try:
+        return _leap_bug_adjusted((datetime.strptime(value, "%Y-%m-%d") - PY_EPOCH_1900).days)
+    except ValueError:
+        return None
+
+
+def _leap_bug_adjusted(days: int) -> int:
+    """
+    1899-12-30 기준 일수를 Excel 1900 시리얼로 보정
+
+    Excel에는 존재하지 않는 1900-02-29(시리얼 60)가 있어 1900-03-01 이전 날짜는
+    시리얼이 하루 작다 (읽을 때 excel_serial_to_datetime이 하루 더하는 것의 역).
+    """
+    return days - 1 if 0 < days < 61 else days
+
+
+def _number_text(value: float) -> str:
+    """정수 값은 소수점 없이 (0.0 → "0")"""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def _row_xml(row_number: int, values: Tuple[Any, ...]) -> str:
+    row = str(row_number)
+    cells = []
+    for letter, kind, value in zip(_COLUMN_LETTERS, _COLUMN_KINDS, values):
+        if value is None or value == "":
+            continue
+        style = _STYLE_BY_KIND[kind]
+        if kind == "date":
+            serial = _date_serial(value)
+            if serial is not None:
+                cells.append(f'<c r="{letter}{row}" s="{style}"><v>{_number_text(serial)}</v></c>')
+                continue
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            style_attr = f' s="{style}"' if style else ""
+            cells.append(f'<c r="{letter}{row}"{style_attr}><v>{_number_text(value)}</v></c>')
+            continue
+        cells.append(
+            f'<c r="{letter}{row}" t="inlineStr"><is><t xml:space="preserve">{escape(str(value))}</t></is></c>'
+        )
+    return f'<row r="{row}">{"".join(cells)}</row>'
+
+
+def _sheet_head_xml() -> str:
+    columns = "".join(
+        f'<col min="{index}" max="{index}" width="{width}" customWidth="1"/>'
+        for index, (_, width, _) in enumerate(INPUT_COLUMNS, 1)
+    )
+    header_cells = "".join(
+        f'<c r="{letter}1" s="{_HEADER_STYLE}" t="inlineStr"><is><t>{escape(header)}</t></is></c>'
+        for letter, (header, _, _) in zip(_COLUMN_LETTERS, INPUT_COLUMNS)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<sheetViews><sheetView tabSelected="1" workbookViewId="0">'
+        '<pane ySplit="1" topLeftCell="A2" activePane="bottomLeft" state="frozen"/>'
+        '</sheetView></sheetViews>'
+        '<sheetFormatPr defaultRowHeight="16.5"/>'
+        f'<cols>{columns}</cols>'
+        f'<sheetData><row r="1">{header_cells}</row>'
+    )
+
+
+def order_rows(orders: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, ...]]:
+    """
+    orders 목록(parse_po_template_input 결과 형태)을 Input 시트 행 튜플로 펼치기
+
+    아이템마다 한 행이며 발주서 헤더 값은 행마다 반복된다.
+    """
+    for order in orders:
+        header = (order.get("orderNumber"), order.get("orderDate"), order.get("siteName"))
+        tail = (order.get("dueDate"), order.get("vendorName"))
+        for item in order.get("items", []):
+            yield header + (
+                item.get("categoryLv1"), item.get("categoryLv2"), item.get("categoryLv3"),
+                item.get("itemName"), item.get("specification"), item.get("quantity"),
+                item.get("unitPrice"), item.get("supplyAmount"), item.get("taxAmount"),
+                item.get("totalAmount")
+            ) + tail + (item.get("deliveryName"), item.get("notes"))
+
+
+def order_book_rows(order_book: POOrderBook) -> Iterator[Tuple[Any, ...]]:
+    """POOrderBook을 dict로 바꾸지 않고 Input 시트 행 튜플로 펼치기"""
+    items = order_book.items
+    for order in order_book.orders.values():
+        header = (order.order_number, order.order_date, order.site_name)
+        tail = (order.due_date, order.vendor_name)
+        for index in order.item_indexes:
+            item = items[index]
+            yield header + (
+                item.category_lv1, item.category_lv2, item.category_lv3, item.item_name,
+                item.specification, item.quantity, item.unit_price, item.supply_amount,
+                item.tax_amount, item.total_amount
+            ) + tail + (item.delivery_name, item.notes)
+
+
+def iter_orders_json(file_path: str) -> Iterator[Dict[str, Any]]:
+    """
+    JSON 파일의 orders 읽기
+
+    .jsonl은 한 줄에 발주서 하나씩 읽으므로 파일 크기와 무관하게 메모리가 일정하다.
+    .json은 orders 목록 또는 parse_po_template_input 결과({"orders": [...]})를 받는다.
+    """
+    with open(file_path, encoding="utf-8") as source:
+        if file_path.endswith(".jsonl"):
+            for line in source:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        data = json.load(source)
+    yield from data["orders"] if isinstance(data, dict) else data
+
+
+def write_input_workbook(rows: Iterable[Tuple[Any, ...]], output: BinaryIO) -> int:
+    """
+    Input 시트 행들을 .xlsx로 기록 (시트 XML은 ROWS_PER_CHUNK 행씩 흘려 씀)
+
+    Args:
+        rows: 17개 컬럼(A~Q) 값 튜플
+        output: 바이너리 파일 객체
+
+    Returns:
+        int: 기록한 데이터 행 수 (헤더 제외)
+    """
+    row_count = 0
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _CONTENT_TYPES_XML)
+        archive.writestr("_rels/.rels", _ROOT_RELS_XML)
+        archive.writestr("xl/workbook.xml", _WORKBOOK_XML)
+        archive.writestr("xl/_rels/workbook.xml.rels", _WORKBOOK_RELS_XML)
+        archive.writestr("xl/styles.xml", _STYLES_XML)
+
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            chunk = [_sheet_head_xml()]
+            for row_count, values in enumerate(rows, 1):
+                chunk.append(_row_xml(row_count + 1, values))
+                if len(chunk) >= ROWS_PER_CHUNK:
+                    sheet.write("".join(chunk).encode("utf-8"))
+                    chunk = []
+            chunk.append("</sheetData></worksheet>")
+            sheet.write("".join(chunk).encode("utf-8"))
+    return row_count
+
+
+def export_orders_to_input(orders: Any, output_path: str) -> Dict[str, Any]:
+    """
+    발주서를 Input 시트 형식 .xlsx로 저장 (임시 파일에 쓴 뒤 원자적으로 교체)
+
+    Args:
+        orders: orders 목록/이터레이터(dict) 또는 POOrderBook
+        output_path: 저장 경로
+
+    Returns:
+        Dict: {"success", "path", "rows"} 또는 실패 시 {"success": False, "error"}
+    """
+    rows = order_book_rows(orders) if isinstance(orders, POOrderBook) else order_rows(orders)
+    try:
+        with atomic_output(output_path) as output:
+            row_count = write_input_workbook(rows, output)
+    except Exception as e:
+        return {"success": False, "path": output_path, "error": str(e)}
+    return {"success": True, "path": output_path, "rows": row_count}
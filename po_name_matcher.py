@@ -0,0 +1,304 @@
+"""
+업로드 거래처명/현장명/납품처명 → 마스터 데이터 ID 매칭
+
+Input 시트의 거래처명/현장명/납품처명은 자유 입력이라 "㈜삼성전자"와 "삼성전자"처럼 같은
+대상이 다르게 적힌다 (schema_comparison.py: vendorId/projectId로 연결해야 함).
+이 모듈은 마스터 목록(거래처명 + 별칭, 현장명 + 현장 코드)으로 정규화 n-gram 역색인을
+한 번 만들고, 업로드의 고유 이름마다 후보 ID와 점수를 돌려준다.
+
+- 정규화: NFKC(㈜ → (주)), 소문자, 법인 표기((주)/주식회사/(유)/유한회사 등)와 공백/기호 제거
+- 점수: 정규화 이름의 문자 n-gram 집합 Dice 계수 (정규화 이름이 같으면 1.0)
+- 후보 탐색: 이름의 n-gram posting 목록만 모아 bincount로 공통 n-gram 수를 세므로
+  이름 하나당 비용은 마스터 전체가 아니라 n-gram을 공유하는 항목 수에 비례
+- 이름은 컬럼형 테이블의 사전 값(고유 값)만 매칭하므로 행 수와 무관
+- 색인과 매칭 결과는 마스터 파일 해시별로 프로세스에 보관해 다음 업로드에서 재사용
+  (python-worker-pool의 워커는 상주하므로 업로드 사이에 유지됨)
+
+마스터 파일은 {"vendors": [{"id", "name", "aliases"}], "projects": [{"id", "projectName",
+"projectCode"}]} 형태의 JSON (db-data.json 내보내기 형식)이다.
+
+사용 예:
+    from po_name_matcher import match_upload_names
+    result = match_upload_names("upload.xlsx", "master.json")
+"""
+
+import json
+import re
+import sys
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from parse_cache import file_sha256
+from po_template_parser import build_po_item_table
+
+# Input 필드 → 마스터 목록
+MATCH_FIELDS = {
+    "vendorName": "vendors",
+    "deliveryName": "vendors",
+    "siteName": "projects",
+}
+
+# 마스터 목록 → (ID 필드, 이름 필드, 별칭 필드들). 별칭 필드는 문자열 또는 문자열 목록
+MASTER_SOURCES = {
+    "vendors": ("id", "name", ["aliases"]),
+    "projects": ("id", "projectName", ["projectCode"]),
+}
+
+DEFAULT_MATCH_CONFIG = {
+    "ngram": 2,                # n-gram 길이 (한글 상호는 짧아 2가 적당)
+    "min_score": 0.3,          # 후보로 남길 최소 점수 (vendor-validation.ts 추천 기준과 동일)
+    "accept_score": 0.8,       # 이 점수 이상인 1순위 후보를 매칭 ID로 확정
+    "max_candidates": 5,
+    "include_inactive": False,
+}
+
+MATCH_COLUMNS = ["name", "rowCount", "id", "score", "candidates"]
+
+# 정규화 시 지우는 법인 표기 (NFKC 후 기준)
+_CORPORATE_MARKERS = re.compile(r"\((주|유|사|재|합)\)|주식회사|유한회사|유한책임회사|합자회사|재단법인|사단법인")
+_NON_WORD = re.compile(r"[\W_]+")
+
+# 마스터 파일 해시 → NameMatcher (LRU)
+MAX_CACHED_MATCHERS = 8
+MAX_CACHED_RESOLUTIONS = 100000
+_matchers: "OrderedDict[Tuple[str, str], NameMatcher]" = OrderedDict()
+
+
+def normalize_name(name: Any) -> str:
+    """매칭용 이름 정규화 (법인 표기/공백/기호 제거, 소문자)"""
+    if name is None:
+        return ""
+    text = unicodedata.normalize("NFKC", str(name)).lower()
+    text = _CORPORATE_MARKERS.sub("", text)
+    return _NON_WORD.sub("", text)
+
+
+def name_ngrams(normalized: str, n: int) -> List[str]:
+    """정규화 이름의 고유 문자 n-gram (n보다 짧은 이름은 이름 전체 하나)"""
+    if len(normalized) <= n:
+        return [normalized] if normalized else []
+    return list(dict.fromkeys(normalized[i:i + n] for i in range(len(normalized) - n + 1)))
+
+
+class NameIndex:
+    """
+    마스터 목록 하나의 n-gram 역색인
+
+    이름과 별칭을 각각 키로 색인하고, 키 → 마스터 항목 위치를 따로 둔다.
+    resolve 결과는 정규화 이름별로 보관한다.
+    """
+
+    __slots__ = ("ids", "names", "key_entries", "key_sources", "key_sizes",
+                 "exact", "postings", "ngram", "resolutions")
+
+    def __init__(self, records: Sequence[Dict[str, Any]], id_field: str, name_field: str,
+                 alias_fields: Sequence[str], ngram: int = 2, include_inactive: bool = False):
+        self.ngram = ngram
+        self.ids: List[Any] = []
+        self.names: List[str] = []
+        key_entries: List[int] = []
+        key_sources: List[str] = []
+        key_sizes: List[int] = []
+        self.exact: Dict[str, int] = {}
+        postings: Dict[str, List[int]] = {}
+
+        for record in records:
+            if not include_inactive and record.get("isActive") is False:
+                continue
+            name = record.get(name_field)
+            if not name:
+                continue
+            entry = len(self.ids)
+            self.ids.append(record.get(id_field))
+            self.names.append(str(name))
+
+            keys = [(name, "name")]
+            for field in alias_fields:
+                aliases = record.get(field) or []
+                if isinstance(aliases, str):
+                    aliases = [aliases]
+                keys.extend((alias, "alias") for alias in aliases if alias)
+
+            for key, source in keys:
+                normalized = normalize_name(key)
+                grams = name_ngrams(normalized, ngram)
+                if not grams:
+                    continue
+                # 같은 정규화 이름이 여러 항목에 있으면 먼저 나온 항목 (이름 > 별칭 순)
+                self.exact.setdefault(normalized, entry)
+                position = len(key_entries)
+                key_entries.append(entry)
+                key_sources.append(source)
+                key_sizes.append(len(grams))
+                for gram in grams:
+                    postings.setdefault(gram, []).append(position)
+
+        self.key_entries = np.array(key_entries, dtype=np.intp)
+        self.key_sources = key_sources
+        self.key_sizes = np.array(key_sizes, dtype=np.float64)
+        self.postings = {gram: np.array(keys, dtype=np.intp) for gram, keys in postings.items()}
+        self.resolutions: Dict[Tuple[str, float, int], List[List[Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def resolve(self, name: Any, min_score: float = 0.3, max_candidates: int = 5) -> List[List[Any]]:
+        """
+        이름 하나의 후보 목록
+
+        Returns:
+            List: [[id, 마스터 이름, 점수, "name"|"alias"|"exact"], ...] (점수 내림차순)
+        """
+        normalized = normalize_name(name)
+        cache_key = (normalized, min_score, max_candidates)
+        cached = self.resolutions.get(cache_key)
+        if cached is not None:
+            return cached
+
+        candidates: List[List[Any]] = []
+        exact_entry = self.exact.get(normalized)
+        if exact_entry is not None:
+            candidates.append([self.ids[exact_entry], self.names[exact_entry], 1.0, "exact"])
+
+        grams = name_ngrams(normalized, self.ngram)
+        hits = [self.postings[gram] for gram in grams if gram in self.postings]
+        if hits:
+            overlaps = np.bincount(np.concatenate(hits), minlength=self.key_sizes.size)
+            keys = np.flatnonzero(overlaps)
+            scores = 2.0 * overlaps[keys] / (len(grams) + self.key_sizes[keys])
+
+            # 항목별 최고 점수 키만 남김 (점수 내림차순 → 같은 항목의 첫 키)
+            order = np.argsort(-scores, kind="stable")
+            seen = {exact_entry}
+            for position in order.tolist():
+                score = float(scores[position])
+                if score < min_score or len(candidates) >= max_candidates:
+                    break
+                key = int(keys[position])
+                entry = int(self.key_entries[key])
+                if entry in seen:
+                    continue
+                seen.add(entry)
+                candidates.append([self.ids[entry], self.names[entry], round(score, 4), self.key_sources[key]])
+
+        if len(self.resolutions) >= MAX_CACHED_RESOLUTIONS:
+            self.resolutions.clear()
+        self.resolutions[cache_key] = candidates
+        return candidates
+
+
+class NameMatcher:
+    """마스터 파일 하나의 목록별 NameIndex 묶음"""
+
+    __slots__ = ("indexes", "signature")
+
+    def __init__(self, master: Dict[str, Any], ngram: int = 2, include_inactive: bool = False,
+                 signature: Optional[str] = None):
+        self.signature = signature
+        self.indexes: Dict[str, NameIndex] = {}
+        for source, (id_field, name_field, alias_fields) in MASTER_SOURCES.items():
+            self.indexes[source] = NameIndex(master.get(source) or [], id_field, name_field,
+                                             alias_fields, ngram, include_inactive)
+
+
+def load_master_data(master_path: str) -> Dict[str, Any]:
+    """마스터 JSON 파일 읽기"""
+    with open(master_path, "r", encoding="utf-8") as f:
+        master = json.load(f)
+    if not isinstance(master, dict):
+        raise ValueError("마스터 파일은 vendors/projects 목록을 담은 JSON 객체여야 합니다")
+    return master
+
+
+def get_name_matcher(master_path: str, config: Optional[Dict[str, Any]] = None) -> NameMatcher:
+    """마스터 파일 해시 기준으로 프로세스에 보관된 NameMatcher (없으면 생성)"""
+    config = {**DEFAULT_MATCH_CONFIG, **(config or {})}
+    signature = file_sha256(master_path)
+    cache_key = (signature, f"{config['ngram']}:{config['include_inactive']}")
+
+    matcher = _matchers.get(cache_key)
+    if matcher is not None:
+        _matchers.move_to_end(cache_key)
+        return matcher
+
+    started = time.perf_counter()
+    matcher = NameMatcher(load_master_data(master_path), config["ngram"],
+                          config["include_inactive"], signature)
+    _matchers[cache_key] = matcher
+    while len(_matchers) > MAX_CACHED_MATCHERS:
+        _matchers.popitem(last=False)
+    sizes = ", ".join(f"{source} {len(index)}건" for source, index in matcher.indexes.items())
+    print(f"🔎 이름 색인 생성: {sizes} ({(time.perf_counter() - started) * 1000:.1f}ms)", file=sys.stderr)
+    return matcher
+
+
+def match_names(index: NameIndex, names: Sequence[Any], row_counts: Sequence[int],
+                config: Dict[str, Any]) -> Dict[str, Any]:
+    """고유 이름 목록을 매칭해 {"columns": MATCH_COLUMNS, "rows"} 테이블로 반환"""
+    rows = []
+    for name, row_count in zip(names, row_counts):
+        if not name:
+            continue
+        candidates = index.resolve(name, config["min_score"], config["max_candidates"])
+        best = candidates[0] if candidates else None
+        accepted = best is not None and best[2] >= config["accept_score"]
+        rows.append([
+            name,
+            int(row_count),
+            best[0] if accepted else None,
+            best[2] if best else 0.0,
+            candidates
+        ])
+    return {"columns": MATCH_COLUMNS, "rows": rows}
+
+
+def match_upload_names(file_path: str, master_path: str, engine: str = "xml",
+                       fields: Optional[Sequence[str]] = None,
+                       config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    업로드 Input 시트의 고유 거래처명/현장명/납품처명을 마스터 ID로 매칭
+
+    Args:
+        file_path: Excel 파일 경로
+        master_path: 마스터 JSON 파일 경로
+        engine: build_po_item_table의 행 소스 ("xml" 또는 "openpyxl")
+        fields: MATCH_FIELDS 중 매칭할 필드 (기본: 전체)
+        config: DEFAULT_MATCH_CONFIG 중 바꿀 항목
+
+    Returns:
+        Dict: {"success", "totalItems", "fields": {필드: {"columns", "rows"}},
+               "unmatched": {필드: 확정 못 한 이름 수}, "elapsedMs"}
+    """
+    config = {**DEFAULT_MATCH_CONFIG, **(config or {})}
+    started = time.perf_counter()
+    try:
+        fields = list(fields or MATCH_FIELDS)
+        for field in fields:
+            if field not in MATCH_FIELDS:
+                raise ValueError(f"매칭할 수 없는 필드입니다: {field}")
+
+        matcher = get_name_matcher(master_path, config)
+        table = build_po_item_table(file_path, engine=engine)
+
+        results = {}
+        unmatched = {}
+        for field in fields:
+            # 사전 인코딩 값(고유 이름)과 코드별 행 수만 사용
+            codes, names = table.codes(field)
+            row_counts = np.bincount(codes, minlength=len(names)) if len(names) else []
+            results[field] = match_names(matcher.indexes[MATCH_FIELDS[field]], names, row_counts, config)
+            unmatched[field] = sum(1 for row in results[field]["rows"] if row[2] is None)
+
+        return {
+            "success": True,
+            "totalItems": len(table),
+            "fields": results,
+            "unmatched": unmatched,
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 2)
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
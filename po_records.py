@@ -0,0 +1,137 @@
+"""
+PO Template 파싱용 경량 레코드 타입
+
+아이템마다 {"orderInfo": ..., "itemData": ...} dict 쌍을 만들면 발주서 헤더가
+아이템 수만큼 중복되고 dict 오버헤드가 크다. 여기서는 __slots__ 기반 레코드로
+
+- 아이템(POItemRecord)은 전체 목록(POOrderBook.items)에 한 번씩만 저장하고
+- 발주서(POOrderRecord)는 헤더를 한 번만 저장한 뒤 아이템을 인덱스(array('i'))로 참조하며
+- to_dict / to_orders로 기존 JSON 형태(orders 목록)를 바로 만든다.
+"""
+
+from array import array
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class POItemRecord:
+    """발주서 아이템 한 행"""
+
+    __slots__ = (
+        "item_name", "specification", "quantity", "unit_price", "supply_amount",
+        "tax_amount", "total_amount", "category_lv1", "category_lv2", "category_lv3",
+        "delivery_name", "notes"
+    )
+
+    def __init__(self, item_name: str, specification: str, quantity: float, unit_price: float,
+                 supply_amount: float, tax_amount: float, total_amount: float,
+                 category_lv1: str, category_lv2: str, category_lv3: str,
+                 delivery_name: str, notes: str):
+        self.item_name = item_name
+        self.specification = specification
+        self.quantity = quantity
+        self.unit_price = unit_price
+        self.supply_amount = supply_amount
+        self.tax_amount = tax_amount
+        self.total_amount = total_amount
+        self.category_lv1 = category_lv1
+        self.category_lv2 = category_lv2
+        self.category_lv3 = category_lv3
+        self.delivery_name = delivery_name
+        self.notes = notes
+
+    def as_tuple(self) -> Tuple[Any, ...]:
+        """__slots__ 순서(= JSON 키 순서)의 값 튜플"""
+        return (
+            self.item_name, self.specification, self.quantity, self.unit_price,
+            self.supply_amount, self.tax_amount, self.total_amount, self.category_lv1,
+            self.category_lv2, self.category_lv3, self.delivery_name, self.notes
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """parse_po_template_input의 items 항목과 같은 형태"""
+        return {
+            "itemName": self.item_name,
+            "specification": self.specification,
+            "quantity": self.quantity,
+            "unitPrice": self.unit_price,
+            "supplyAmount": self.supply_amount,
+            "taxAmount": self.tax_amount,
+            "totalAmount": self.total_amount,
+            "categoryLv1": self.category_lv1,
+            "categoryLv2": self.category_lv2,
+            "categoryLv3": self.category_lv3,
+            "deliveryName": self.delivery_name,
+            "notes": self.notes
+        }
+
+
+# 발주서 헤더 튜플: (발주번호, 발주일, 현장명, 납기일, 거래처명)
+OrderHeader = Tuple[str, str, str, str, str]
+
+
+class POOrderRecord:
+    """발주서 헤더 한 건과 소속 아이템 인덱스 (총액은 아이템을 추가하며 누적)"""
+
+    __slots__ = ("order_number", "order_date", "site_name", "due_date", "vendor_name", "item_indexes",
+                 "total_amount")
+
+    def __init__(self, order_number: str, order_date: str, site_name: str,
+                 due_date: str, vendor_name: str):
+        self.order_number = order_number
+        self.order_date = order_date
+        self.site_name = site_name
+        self.due_date = due_date
+        self.vendor_name = vendor_name
+        self.item_indexes = array("i")
+        self.total_amount = 0
+
+    def to_dict(self, items: List[POItemRecord]) -> Dict[str, Any]:
+        """parse_po_template_input의 orders 항목과 같은 형태"""
+        order_items = [items[index] for index in self.item_indexes]
+        return {
+            "orderNumber": self.order_number,
+            "orderDate": self.order_date,
+            "siteName": self.site_name,
+            "dueDate": self.due_date,
+            "vendorName": self.vendor_name,
+            "totalAmount": self.total_amount,
+            "items": [item.to_dict() for item in order_items]
+        }
+
+
+class POOrderBook:
+    """
+    발주번호별로 묶인 발주서와 전체 아이템 목록
+
+    발주서 헤더는 해당 발주번호가 처음 나온 행에서 한 번만 저장한다.
+    """
+
+    __slots__ = ("orders", "items")
+
+    def __init__(self):
+        self.orders: Dict[str, POOrderRecord] = {}
+        self.items: List[POItemRecord] = []
+
+    def add(self, header: OrderHeader, item: POItemRecord) -> None:
+        """아이템 한 행 추가"""
+        order = self.orders.get(header[0])
+        if order is None:
+            order = self.orders[header[0]] = POOrderRecord(*header)
+        order.item_indexes.append(len(self.items))
+        order.total_amount += item.total_amount
+        self.items.append(item)
+
+    def get(self, order_number: str) -> Optional[POOrderRecord]:
+        return self.orders.get(order_number)
+
+    @property
+    def total_orders(self) -> int:
+        return len(self.orders)
+
+    @property
+    def total_items(self) -> int:
+        return len(self.items)
+
+    def to_orders(self) -> List[Dict[str, Any]]:
+        """발주번호 첫 등장 순서의 orders 목록 (JSON 직렬화 가능)"""
+        return [order.to_dict(self.items) for order in self.orders.values()]
@@ -0,0 +1,175 @@
+"""
+발주 아이템 컬럼형 테이블의 그룹별 집계(rollup)
+
+build_po_item_table이 만든 ColumnarTable은 발주번호/거래처/현장/분류를 이미 정수 코드로
+사전 인코딩해 두었으므로, 그룹 키를 다시 해시하지 않고 코드 배열로 바로 집계한다.
+
+- 합계/아이템 수: np.bincount (그룹 코드를 인덱스로 하는 가중 합)
+- 발주서 수: (그룹 코드, 발주번호 코드) 쌍을 정렬해 센 고유값 수
+- 최소/최대 납기일: 날짜 문자열을 정렬 순위로 바꾼 뒤 그룹 코드로 안정 정렬하고
+  np.minimum/maximum.reduceat으로 구간별 축약
+- 여러 필드 키(분류 대분류/중분류/소분류)는 코드를 자리값으로 합친 뒤 다시 조밀한 코드로 변환
+
+숫자 컬럼, 날짜 순위, 발주번호 코드는 한 번만 만들고 모든 집계 기준이 함께 쓴다.
+결과는 기준마다 {"columns": [...], "rows": [[...], ...]} 압축 테이블이며 행 순서는
+그룹 키의 첫 등장 순서이다.
+
+사용 예:
+    from po_template_parser import build_po_item_table
+    from po_rollup import rollup_item_table
+    rollups = rollup_item_table(build_po_item_table("upload.xlsx", engine="xml"))
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from po_columnar import ColumnarTable
+
+# 집계 기준 이름 → 그룹 키 필드
+ROLLUP_DIMENSIONS = {
+    "order": ["orderNumber"],
+    "vendor": ["vendorName"],
+    "site": ["siteName"],
+    "category": ["categoryLv1", "categoryLv2", "categoryLv3"],
+}
+
+ROLLUP_VALUE_FIELDS = ["quantity", "supplyAmount", "taxAmount", "totalAmount"]
+ROLLUP_STAT_COLUMNS = ["itemCount", "orderCount"] + ROLLUP_VALUE_FIELDS + ["minDueDate", "maxDueDate"]
+
+
+def factorize_fields(table: ColumnarTable, fields: Sequence[str]) -> Tuple[np.ndarray, List[Tuple[str, ...]]]:
+    """
+    사전 인코딩 필드(들)의 값 조합을 첫 등장 순서의 조밀한 정수 코드로 변환
+
+    Returns:
+        Tuple: (행별 그룹 코드 배열, 코드 → 필드 값 튜플 목록)
+    """
+    field_codes = [table.codes(name) for name in fields]
+    if len(field_codes) == 1:
+        codes, values = field_codes[0]
+        return codes.astype(np.intp), [(value,) for value in values]
+
+    combined = np.zeros(len(table), dtype=np.int64)
+    for codes, values in field_codes:
+        combined = combined * max(len(values), 1) + codes
+    unique, inverse = np.unique(combined, return_inverse=True)
+
+    # np.unique는 값 순서이므로 첫 등장 순서로 코드를 다시 매김
+    first_row = np.full(unique.size, len(table), dtype=np.int64)
+    np.minimum.at(first_row, inverse, np.arange(len(table)))
+    appearance = np.argsort(first_row, kind="stable")
+    remap = np.empty_like(appearance)
+    remap[appearance] = np.arange(appearance.size)
+
+    keys = []
+    for key in unique[appearance].tolist():
+        parts = []
+        for codes, values in reversed(field_codes):
+            key, code = divmod(key, max(len(values), 1))
+            parts.append(values[code])
+        keys.append(tuple(reversed(parts)))
+    return remap[inverse], keys
+
+
+def _date_ranks(table: ColumnarTable, field: str) -> Tuple[np.ndarray, List[str]]:
+    """날짜 문자열 필드의 행별 정렬 순위 (빈 값은 -1)와 순위 → 날짜 목록"""
+    codes, values = table.codes(field)
+    dates = sorted(value for value in values if value)
+    rank_of = {value: rank for rank, value in enumerate(dates)}
+    code_ranks = np.array([rank_of.get(value, -1) for value in values], dtype=np.int64)
+    return code_ranks[codes] if len(values) else np.full(len(table), -1, dtype=np.int64), dates
+
+
+def _segment_min_max(group_codes: np.ndarray, group_count: int,
+                     ranks: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """그룹별 최소/최대 순위 (값이 없는 그룹은 -1)"""
+    order = np.argsort(group_codes, kind="stable")
+    starts = np.concatenate(([0], np.cumsum(np.bincount(group_codes, minlength=group_count))[:-1]))
+    sorted_ranks = ranks[order]
+
+    missing = np.iinfo(np.int64).max
+    minimums = np.minimum.reduceat(np.where(sorted_ranks < 0, missing, sorted_ranks), starts)
+    maximums = np.maximum.reduceat(sorted_ranks, starts)
+    minimums[minimums == missing] = -1
+    return minimums, maximums
+
+
+def _distinct_counts(group_codes: np.ndarray, group_count: int,
+                     value_codes: np.ndarray, value_count: int) -> np.ndarray:
+    """그룹별 고유 value 코드 수 ((그룹, 값) 쌍을 정렬해 바뀌는 지점만 셈)"""
+    pairs = np.sort(group_codes.astype(np.int64) * value_count + value_codes)
+    first = np.empty(pairs.size, dtype=bool)
+    first[0] = True
+    np.not_equal(pairs[1:], pairs[:-1], out=first[1:])
+    return np.bincount(pairs[first] // value_count, minlength=group_count)
+
+
+def rollup_item_table(table: ColumnarTable, dimensions: Optional[Sequence[str]] = None,
+                      due_date_field: str = "dueDate") -> Dict[str, Any]:
+    """
+    아이템 테이블을 여러 기준으로 한 번에 집계
+
+    Args:
+        table: PO_ITEM_SCHEMA 테이블 (build_po_item_table 결과)
+        dimensions: ROLLUP_DIMENSIONS의 기준 이름들 (기본: 전체)
+        due_date_field: 최소/최대를 구할 날짜 필드
+
+    Returns:
+        Dict: {"success", "totalItems", "rollups": {기준: {"columns", "rows"}}, "elapsedMs"}
+    """
+    started = time.perf_counter()
+    dimensions = list(dimensions or ROLLUP_DIMENSIONS)
+    for dimension in dimensions:
+        if dimension not in ROLLUP_DIMENSIONS:
+            raise ValueError(f"지원하지 않는 집계 기준입니다: {dimension}")
+
+    rollups: Dict[str, Any] = {}
+    if len(table) == 0:
+        for dimension in dimensions:
+            rollups[dimension] = {"columns": ROLLUP_DIMENSIONS[dimension] + ROLLUP_STAT_COLUMNS, "rows": []}
+        return {"success": True, "totalItems": 0, "rollups": rollups, "elapsedMs": 0.0}
+
+    # 모든 기준이 함께 쓰는 배열
+    values = {name: table.numeric(name) for name in ROLLUP_VALUE_FIELDS}
+    order_codes, order_numbers = table.codes("orderNumber")
+    due_ranks, due_dates = _date_ranks(table, due_date_field)
+
+    for dimension in dimensions:
+        fields = ROLLUP_DIMENSIONS[dimension]
+        group_codes, keys = factorize_fields(table, fields)
+        group_count = len(keys)
+
+        item_counts = np.bincount(group_codes, minlength=group_count)
+        sums = [np.bincount(group_codes, weights=values[name], minlength=group_count)
+                for name in ROLLUP_VALUE_FIELDS]
+        order_counts = _distinct_counts(group_codes, group_count, order_codes, len(order_numbers))
+        minimums, maximums = _segment_min_max(group_codes, group_count, due_ranks)
+
+        date_labels = due_dates + [""]  # 순위 -1 → ""
+        columns = [item_counts.tolist(), order_counts.tolist()] + [total.tolist() for total in sums]
+        columns.append([date_labels[rank] for rank in minimums.tolist()])
+        columns.append([date_labels[rank] for rank in maximums.tolist()])
+        rows = [list(key) + list(stats) for key, stats in zip(keys, zip(*columns))]
+        rollups[dimension] = {"columns": fields + ROLLUP_STAT_COLUMNS, "rows": rows}
+
+    return {
+        "success": True,
+        "totalItems": len(table),
+        "rollups": rollups,
+        "elapsedMs": round((time.perf_counter() - started) * 1000, 2)
+    }
+
+
+def rollup_order_totals(table: ColumnarTable) -> Dict[str, Tuple[int, float]]:
+    """
+    발주번호별 (아이템 수, 총액) — rollup_item_table의 order 기준 집계
+
+    parse_po_template_input은 POOrderBook이 행을 추가하며 누적한 총액을 쓰므로 numpy를
+    불러오지 않는다. 이 함수는 이미 만든 아이템 테이블(build_po_item_table)에서 구할 때 쓴다.
+    """
+    rollup = rollup_item_table(table, ["order"])["rollups"]["order"]
+    columns = rollup["columns"]
+    number_at, count_at, total_at = (columns.index(name) for name in ("orderNumber", "itemCount", "totalAmount"))
+    return {row[number_at]: (row[count_at], row[total_at]) for row in rollup["rows"]}
@@ -0,0 +1,350 @@
+"""
+헤더 기반 Input 시트 레이아웃 등록부와 행 변환 함수 생성
+
+Input 시트 레이아웃은 여러 가지다 (excel_parser 13개, excel_parser_with_categories 16개,
+po_template_parser 17개, PO_test/update_column_names.py의 STANDARD_COLUMNS 16개 컬럼).
+컬럼 위치를 하드코딩하지 않고 시트의 헤더 행으로 레이아웃을 정한다.
+
+- 헤더를 정규화(공백 제거)해 지문(blake2b)을 만들고, 등록된 레이아웃(SCHEMA_LAYOUTS)과
+  같으면 그 이름을, 아니면 한국어 헤더 이름(HEADER_FIELDS)으로 컬럼을 매핑한다
+- 매핑이 정해지면 그 레이아웃 전용 행 변환 함수를 소스로 만들어 한 번 컴파일한다.
+  컬럼 위치와 변환 종류가 상수로 박혀 있으므로 행마다 셀 위치로 분기하지 않는다
+- 변환 함수는 헤더 지문별로 프로세스에 보관해 같은 템플릿의 다음 업로드에서 재사용
+
+변환 결과는 converter.fields 순서의 튜플이며, 필드 이름은 PO_ITEM_SCHEMA와 같은
+camelCase를 쓴다. fields를 지정하지 않으면 레이아웃에 있는 필드만, 지정하면 그 순서대로
+만들고 레이아웃에 없는 필드는 빈 값(숫자는 number(None))으로 채운다. po_template_parser,
+excel_parser, excel_parser_with_categories의 행 변환이 이 함수를 쓴다.
+
+사용 예:
+    from po_schema_registry import read_sheet_records
+    result = read_sheet_records("upload.xlsx")
+    result["layout"], result["columns"], result["rows"]
+"""
+
+import hashlib
+import re
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from excel_dates import format_date
+from xlsx_reader import XlsxPackage
+
+# 변환 종류
+TEXT = "text"
+NUMBER = "number"
+DATE = "date"
+
+# 정규화한 한국어 헤더 → (필드, 변환 종류)
+HEADER_FIELDS = {
+    "발주번호": ("orderNumber", TEXT),
+    "발주서번호": ("orderNumber", TEXT),
+    "발주일": ("orderDate", DATE),
+    "발주일자": ("orderDate", DATE),
+    "현장명": ("siteName", TEXT),
+    "프로젝트명": ("siteName", TEXT),
+    "대분류": ("categoryLv1", TEXT),
+    "중분류": ("categoryLv2", TEXT),
+    "소분류": ("categoryLv3", TEXT),
+    "품목": ("itemName", TEXT),
+    "품목명": ("itemName", TEXT),
+    "품명": ("itemName", TEXT),
+    "규격": ("specification", TEXT),
+    "수량": ("quantity", NUMBER),
+    "단가": ("unitPrice", NUMBER),
+    "공급가액": ("supplyAmount", NUMBER),
+    "세액": ("taxAmount", NUMBER),
+    "부가세": ("taxAmount", NUMBER),
+    "총금액": ("totalAmount", NUMBER),
+    "합계": ("totalAmount", NUMBER),
+    "납기일": ("dueDate", DATE),
+    "납기일자": ("dueDate", DATE),
+    "거래처": ("vendorName", TEXT),
+    "거래처명": ("vendorName", TEXT),
+    "거래처이메일": ("vendorEmail", TEXT),
+    "납품처명": ("deliveryName", TEXT),
+    "납품처이메일": ("deliveryEmail", TEXT),
+    "비고": ("notes", TEXT),
+}
+
+# 알려진 템플릿 레이아웃: 이름 → 헤더 순서
+SCHEMA_LAYOUTS = {
+    # po_template_parser (Input 시트 A~Q)
+    "po_template": [
+        "발주번호", "발주일", "현장명", "대분류", "중분류", "소분류", "품목명", "규격", "수량",
+        "단가", "공급가액", "세액", "총금액", "납기일", "거래처명", "납품처명", "비고",
+    ],
+    # excel_parser.parse_excel_to_purchase_orders (Input Sheet A~M)
+    "purchase_orders": [
+        "발주번호", "발주일", "품목명", "규격", "수량", "단가", "공급가액", "세액", "총금액",
+        "납기일", "거래처명", "납품처명", "비고",
+    ],
+    # excel_parser_with_categories (Input Sheet A~P)
+    "categories": [
+        "발주번호", "발주일", "대분류", "중분류", "소분류", "품목명", "규격", "수량", "단가",
+        "공급가액", "세액", "총금액", "납기일", "거래처명", "납품처명", "비고",
+    ],
+    # PO_test/update_column_names.py STANDARD_COLUMNS (PO_Excel_Template.xlsx)
+    "standard": [
+        "발주일자", "납기일자", "거래처명", "거래처 이메일", "납품처명", "납품처 이메일", "프로젝트명",
+        "대분류", "중분류", "소분류", "품목명", "규격", "수량", "단가", "총금액", "비고",
+    ],
+}
+
+# 필드 → 변환 종류
+FIELD_KINDS = {field: kind for field, kind in HEADER_FIELDS.values()}
+
+# 레이아웃으로 인정하는 데 필요한 필드
+REQUIRED_FIELDS = ["itemName"]
+
+# 이 필드가 있으면 값이 빈 행을 건너뛰고, 없으면 모든 셀이 빈 행만 건너뜀 (기존 파서와 동일)
+ROW_KEY_FIELD = "orderNumber"
+
+INPUT_SHEET_NAMES = ["Input", "Input Sheet"]
+
+MAX_CACHED_CONVERTERS = 64
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def safe_number(value: Any) -> float:
+    """
+    값을 안전하게 숫자로 변환 (파서들이 공유하는 숫자 변환, 실패 시 0.0)
+
+    변환 실패 로그는 stderr로 보낸다 (stdout은 워커/CLI의 JSON 출력용).
+    """
+    if value is None:
+        return 0.0
+
+    try:
+        if isinstance(value, (int, float)):
+            return float(value)
+
+        if isinstance(value, str):
+            if not value.strip():
+                return 0.0
+            # 쉼표 제거 후 변환
+            cleaned_value = value.replace(",", "").strip()
+            return float(cleaned_value)
+
+        return 0.0
+
+    except Exception as e:
+        print(f"숫자 변환 오류: {value} -> {str(e)}", file=sys.stderr)
+        return 0.0
+
+
+def normalize_header(value: Any) -> str:
+    """헤더 셀 정규화 (공백 제거, 빈 셀은 "")"""
+    if value is None:
+        return ""
+    return _WHITESPACE.sub("", str(value))
+
+
+def _trim_headers(header_row: Sequence[Any]) -> List[str]:
+    headers = [normalize_header(value) for value in header_row]
+    while headers and not headers[-1]:
+        headers.pop()
+    return headers
+
+
+def header_fingerprint(header_row: Sequence[Any]) -> str:
+    """헤더 행 지문 (정규화 헤더를 구분자로 이은 blake2b 8바이트 hex)"""
+    material = "\x1f".join(_trim_headers(header_row)).encode("utf-8")
+    return hashlib.blake2b(material, digest_size=8).hexdigest()
+
+
+# 지문 → 레이아웃 이름
+_LAYOUT_FINGERPRINTS = {header_fingerprint(headers): name for name, headers in SCHEMA_LAYOUTS.items()}
+
+
+class RowConverter:
+    """
+    레이아웃 하나의 행 변환 함수
+
+    convert(row, date1904=False)는 건너뛸 행이면 None, 아니면 fields 순서의 튜플을 반환한다.
+    """
+
+    __slots__ = ("fingerprint", "layout", "fields", "columns", "unmapped_headers", "width",
+                 "source", "convert")
+
+    def __init__(self, fingerprint: str, layout: str, columns: List[Tuple[int, str, str]],
+                 unmapped_headers: List[str], width: int, fields: Optional[Sequence[str]] = None,
+                 number: Callable[[Any], Any] = safe_number, key_field: Optional[str] = ROW_KEY_FIELD):
+        self.fingerprint = fingerprint
+        self.layout = layout
+        self.columns = columns
+        self.fields = list(fields) if fields is not None else [field for _, field, _ in columns]
+        self.unmapped_headers = unmapped_headers
+        self.width = width
+        self.source = _converter_source(columns, width, self.fields, repr(number(None)), key_field)
+        namespace = {"_number": number, "_date": format_date, "_PAD": (None,) * width}
+        exec(compile(self.source, f"<row converter {layout} {fingerprint}>", "exec"), namespace)
+        self.convert: Callable[..., Optional[tuple]] = namespace["convert"]
+
+    def has_field(self, field: str) -> bool:
+        """레이아웃(헤더)에 필드 컬럼이 있는지 여부"""
+        return any(name == field for _, name, _ in self.columns)
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "layout": self.layout,
+            "fingerprint": self.fingerprint,
+            "columns": [[index, field, kind] for index, field, kind in self.columns],
+            "unmappedHeaders": self.unmapped_headers,
+        }
+
+
+def _converter_source(columns: List[Tuple[int, str, str]], width: int, fields: Sequence[str],
+                      number_default: str, key_field: Optional[str]) -> str:
+    """컬럼 위치/변환 종류를 상수로 넣은 convert 함수 소스"""
+    lines = [
+        "def convert(row, date1904=False):",
+        f"    if len(row) < {width}:",
+        f"        row = tuple(row) + _PAD[:{width} - len(row)]",
+    ]
+    positions = {field: (index, kind) for index, field, kind in columns}
+    if key_field in positions:
+        lines.append(f"    if not row[{positions[key_field][0]}]:")
+    else:
+        lines.append(f"    if all(cell is None or cell == '' for cell in row[:{width}]):")
+    lines.append("        return None")
+
+    expressions = []
+    for field in fields:
+        if field not in positions:
+            # 레이아웃에 없는 필드는 빈 값
+            expressions.append(number_default if FIELD_KINDS.get(field) == NUMBER else "''")
+            continue
+        index, kind = positions[field]
+        if kind == NUMBER:
+            expressions.append(f"_number(row[{index}])")
+        elif kind == DATE:
+            expressions.append(f"_date(row[{index}], date1904)")
+        else:
+            expressions.append(f"(str(row[{index}]) if row[{index}] is not None else '')")
+    lines.append(f"    return ({', '.join(expressions)},)")
+    return "\n".join(lines) + "\n"
+
+
+def map_headers(header_row: Sequence[Any]) -> Tuple[List[Tuple[int, str, str]], List[str]]:
+    """
+    헤더 이름으로 컬럼 매핑
+
+    Returns:
+        Tuple: ([(컬럼 위치, 필드, 변환 종류), ...], 매핑하지 못한 헤더 목록).
+               같은 필드가 여러 번 나오면 첫 컬럼을 쓴다.
+    """
+    columns = []
+    unmapped = []
+    seen = set()
+    for index, header in enumerate(_trim_headers(header_row)):
+        if not header:
+            continue
+        mapping = HEADER_FIELDS.get(header)
+        if mapping is None or mapping[0] in seen:
+            unmapped.append(header)
+            continue
+        seen.add(mapping[0])
+        columns.append((index, mapping[0], mapping[1]))
+    return columns, unmapped
+
+
+_converters: Dict[Tuple[Any, ...], RowConverter] = {}
+
+
+def get_row_converter(header_row: Sequence[Any], fields: Optional[Sequence[str]] = None,
+                      number: Callable[[Any], Any] = safe_number,
+                      key_field: Optional[str] = ROW_KEY_FIELD) -> RowConverter:
+    """
+    헤더 행에 맞는 RowConverter (지문과 옵션 조합별로 한 번만 생성)
+
+    Args:
+        header_row: 시트 1행 값
+        fields: 결과 튜플의 필드 순서 (기본: 레이아웃에 있는 필드를 컬럼 순서로)
+        number: 숫자 컬럼 변환 함수 (기본 safe_number, excel_parser는 safe_int)
+        key_field: 값이 비면 행을 건너뛸 필드 (None이거나 레이아웃에 없으면 모든 셀이 빈 행만 건너뜀)
+
+    Raises:
+        ValueError: 필수 필드(품목명)를 찾지 못한 경우
+    """
+    fingerprint = header_fingerprint(header_row)
+    cache_key = (fingerprint, tuple(fields) if fields is not None else None, number, key_field)
+    converter = _converters.get(cache_key)
+    if converter is not None:
+        return converter
+
+    columns, unmapped = map_headers(header_row)
+    missing = [field for field in REQUIRED_FIELDS if field not in {name for _, name, _ in columns}]
+    if missing:
+        raise ValueError(f"알 수 없는 헤더 형식입니다 (필수 필드 없음: {', '.join(missing)})")
+
+    layout = _LAYOUT_FINGERPRINTS.get(fingerprint, "mapped")
+    converter = RowConverter(fingerprint, layout, columns, unmapped, len(_trim_headers(header_row)),
+                             fields, number, key_field)
+    if len(_converters) >= MAX_CACHED_CONVERTERS:
+        _converters.clear()
+    _converters[cache_key] = converter
+    return converter
+
+
+def find_input_sheet(package: XlsxPackage, sheet_name: Optional[str] = None) -> str:
+    """지정 시트 또는 INPUT_SHEET_NAMES 중 처음 있는 시트 이름"""
+    names = package.sheet_names
+    if sheet_name is not None:
+        if sheet_name not in names:
+            raise ValueError(f"시트를 찾을 수 없습니다: {sheet_name}")
+        return sheet_name
+    for candidate in INPUT_SHEET_NAMES:
+        if candidate in names:
+            return candidate
+    raise ValueError(f"Input 시트를 찾을 수 없습니다 (시트: {', '.join(names)})")
+
+
+def read_sheet_records(file_path: str, sheet_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    헤더로 레이아웃을 정해 시트 전체를 변환
+
+    Args:
+        file_path: Excel 파일 경로
+        sheet_name: 읽을 시트 (기본: Input 또는 Input Sheet)
+
+    Returns:
+        Dict: {"success", "sheet", "layout", "fingerprint", "unmappedHeaders",
+               "columns": 필드 목록, "rows": [[...], ...], "skippedRows", "elapsedMs"}
+    """
+    started = time.perf_counter()
+    try:
+        with XlsxPackage(file_path) as package:
+            sheet = find_input_sheet(package, sheet_name)
+            rows = package.iter_rows(sheet)
+            header_row = next(rows, None)
+            if header_row is None:
+                raise ValueError(f"헤더 행이 없습니다: {sheet}")
+
+            converter = get_row_converter(header_row)
+            convert = converter.convert
+            date1904 = package.date1904
+            records = []
+            skipped = 0
+            for row in rows:
+                record = convert(row, date1904)
+                if record is None:
+                    skipped += 1
+                else:
+                    records.append(record)
+
+        return {
+            "success": True,
+            "sheet": sheet,
+            "layout": converter.layout,
+            "fingerprint": converter.fingerprint,
+            "unmappedHeaders": converter.unmapped_headers,
+            "columns": converter.fields,
+            "rows": records,
+            "skippedRows": skipped,
+            "elapsedMs": round((time.perf_counter() - started) * 1000, 2)
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
@@ -1,128 +1,105 @@
-import pandas as pd
-import json
-from datetime import datetime
-from openpyxl import load_workbook
-from typing import List, Dict, Any, Optional
-from collections import defaultdict
+import io
+import os
+import hashlib
+from collections import Counter
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Sequence, Set, Tuple
+from xlsx_reader import XlsxPackage, iter_sheet_rows, is_date1904
+from po_columnar import INT, ColumnarTable, PO_ITEM_FIELDS, PO_ITEM_SCHEMA, PO_ORDER_FIELDS, SHEET_ROW_FIELD
+from po_records import OrderHeader, POItemRecord, POOrderBook
+from po_category_trie import CategoryTrie
+from po_schema_registry import get_row_converter
 
-def parse_po_template_input(file_path: str) -> Dict[str, Any]:
+# 기존 import 경로 호환 (from po_template_parser import format_date, safe_number)
+from excel_dates import format_date  # noqa: F401
+from po_schema_registry import safe_number  # noqa: F401
+
+# 이 크기 이상의 업로드는 기본적으로 read-only 행 소스로 읽음.
+# po_cli parse(와 워커)는 stream을 지정하지 않으면 이 크기 이상에서 iter_po_template_orders로 발주서를 스트리밍
+STREAMING_THRESHOLD_BYTES = 1 * 1024 * 1024
+
+# 행 변환 결과 순서: 발주서 헤더(OrderHeader) + POItemRecord 필드
+INPUT_RECORD_FIELDS = PO_ORDER_FIELDS + PO_ITEM_FIELDS
+
+# 행 지문 계산 방식이 바뀌면 올려서 이전 지문을 무효화
+FINGERPRINT_VERSION = 1
+
+def parse_po_template_input(file_path: str, streaming: Optional[bool] = None,
+                            engine: str = "openpyxl", columnar: bool = False,
+                            fingerprints: bool = False,
+                            previous_fingerprints: Optional[Dict[str, Any]] = None,
+                            category_tree: bool = False) -> Dict[str, Any]:
     """
     PO Template Input 시트를 파싱하여 DB 저장 가능한 형태로 변환
     
     Args:
         file_path: Excel 파일 경로
+        streaming: openpyxl 행 소스 방식. True면 read-only로 행을 순서대로 읽고, False면
+                   워크북 전체 로드, None이면 파일 크기가 STREAMING_THRESHOLD_BYTES 이상일 때 read-only.
+                   어느 쪽이든 결과(POOrderBook, orders 목록)는 전부 메모리에 만든다.
+                   메모리 사용량이 행 수와 무관해야 하면 iter_po_template_orders를 쓴다
+        engine: 행 소스 ("openpyxl" 또는 시트 XML을 직접 읽는 "xml").
+                "xml"은 항상 행을 순서대로 읽음 (streaming=True와 같음)
+        columnar: True면 orders 대신 컬럼형 아이템 테이블("table", ColumnarTable)을 반환.
+                  po_columnar.table_to_po_orders로 같은 orders 목록을 만들 수 있음
+        fingerprints: True면 발주서별 행 지문("fingerprints")을 함께 반환
+        previous_fingerprints: 이전 파싱의 "fingerprints". 주면 추가/변경된 발주서만
+                               orders에 담고, 삭제된 발주번호와 변경 요약("diff")을 반환
+        category_tree: True면 같은 행 처리 중에 만든 분류 트리(CategoryTrie.to_dict)를
+                       "categoryTree"로 반환 (시트를 다시 읽지 않은 변경 없음 결과에는 없음)
         
     Returns:
         Dict: 파싱된 데이터 (purchase_orders와 purchase_order_items 분리)
     """
     try:
-        # Excel 파일 로드
-        workbook = load_workbook(file_path, data_only=True)
-        
-        if "Input" not in workbook.sheetnames:
-            raise ValueError("'Input' 시트를 찾을 수 없습니다.")
-        
-        worksheet = workbook["Input"]
-        
-        # 발주서별로 그룹화할 딕셔너리
-        orders_by_number = defaultdict(list)
+        if engine not in ("openpyxl", "xml"):
+            raise ValueError(f"지원하지 않는 엔진입니다: {engine}")
         
-        # 2행부터 시작하여 모든 행 읽기
-        for row in worksheet.iter_rows(min_row=2, values_only=True):
-            # 빈 행이거나 발주번호가 없는 경우 건너뛰기
-            if not row or not row[0]:
-                continue
-            
-            # 17개 컬럼 (A~Q)만 처리
-            row_data = list(row[:17])
-            
-            # 각 필드 추출
-            order_number = str(row_data[0]) if row_data[0] else None
-            order_date = format_date(row_data[1])
-            site_name = str(row_data[2]) if row_data[2] else ""
-            category_lv1 = str(row_data[3]) if row_data[3] else ""
-            category_lv2 = str(row_data[4]) if row_data[4] else ""
-            category_lv3 = str(row_data[5]) if row_data[5] else ""
-            item_name = str(row_data[6]) if row_data[6] else ""
-            specification = str(row_data[7]) if row_data[7] else ""
-            quantity = safe_number(row_data[8])
-            unit_price = safe_number(row_data[9])
-            supply_amount = safe_number(row_data[10])
-            tax_amount = safe_number(row_data[11])
-            total_amount = safe_number(row_data[12])
-            due_date = format_date(row_data[13])
-            vendor_name = str(row_data[14]) if row_data[14] else ""
-            delivery_name = str(row_data[15]) if row_data[15] else ""
-            notes = str(row_data[16]) if row_data[16] else ""
-            
-            # 발주번호가 없으면 건너뛰기
-            if not order_number:
-                continue
-            
-            # 발주서 아이템 데이터 생성
-            item_data = {
-                "itemName": item_name,
-                "specification": specification,
-                "quantity": quantity,
-                "unitPrice": unit_price,
-                "supplyAmount": supply_amount,
-                "taxAmount": tax_amount,
-                "totalAmount": total_amount,
-                "categoryLv1": category_lv1,
-                "categoryLv2": category_lv2,
-                "categoryLv3": category_lv3,
-                "deliveryName": delivery_name,
-                "notes": notes
+        if columnar:
+            table = build_po_item_table(file_path, engine=engine)
+            return {
+                "success": True,
+                "totalOrders": len(table.codes("orderNumber")[1]),
+                "totalItems": len(table),
+                "table": table
             }
-            
-            # 발주서 정보 (첫 번째 아이템에서 추출)
-            order_info = {
-                "orderNumber": order_number,
-                "orderDate": order_date,
-                "siteName": site_name,
-                "dueDate": due_date,
-                "vendorName": vendor_name
-            }
-            
-            orders_by_number[order_number].append({
-                "orderInfo": order_info,
-                "itemData": item_data
-            })
         
-        # 발주서별로 데이터 정리
-        parsed_orders = []
-        for order_number, items in orders_by_number.items():
-            if not items:
-                continue
-            
-            # 첫 번째 아이템에서 발주서 정보 추출
-            first_item = items[0]
-            order_info = first_item["orderInfo"]
-            
-            # 모든 아이템 데이터 수집
-            item_list = [item["itemData"] for item in items]
-            
-            # 발주서 총액 계산
-            order_total = sum(item["totalAmount"] for item in item_list)
-            
-            parsed_order = {
-                "orderNumber": order_info["orderNumber"],
-                "orderDate": order_info["orderDate"],
-                "siteName": order_info["siteName"],
-                "dueDate": order_info["dueDate"],
-                "vendorName": order_info["vendorName"],
-                "totalAmount": order_total,
-                "items": item_list
-            }
-            
-            parsed_orders.append(parsed_order)
+        row_fingerprints = {} if fingerprints or previous_fingerprints is not None else None
+        source = input_sheet_signature(file_path) if row_fingerprints is not None else None
+        if previous_fingerprints is not None and _same_source(previous_fingerprints, source):
+            # Input 시트와 값 해석에 쓰이는 파트가 그대로면 시트를 읽지 않고 변경 없음으로 반환
+            return _unchanged_result(previous_fingerprints)
         
-        return {
+        category_trie = CategoryTrie() if category_tree else None
+        order_book = build_po_order_book(file_path, streaming=streaming, engine=engine,
+                                         row_fingerprints=row_fingerprints,
+                                         category_trie=category_trie)
+        
+        result = {
             "success": True,
-            "totalOrders": len(parsed_orders),
-            "totalItems": sum(len(order["items"]) for order in parsed_orders),
-            "orders": parsed_orders
+            "totalOrders": order_book.total_orders,
+            "totalItems": order_book.total_items
         }
+        if previous_fingerprints is not None:
+            diff = diff_row_fingerprints(previous_fingerprints, row_fingerprints)
+            result["incremental"] = True
+            result["orders"] = [
+                order_book.get(order_number).to_dict(order_book.items)
+                for order_number in diff["added"] + diff["changed"]
+            ]
+            result["removedOrders"] = diff["removed"]
+            result["diff"] = diff
+        else:
+            result["orders"] = order_book.to_orders()
+        if row_fingerprints is not None:
+            result["fingerprints"] = {
+                "version": FINGERPRINT_VERSION,
+                "source": source,
+                "totalItems": result["totalItems"],
+                "orders": row_fingerprints
+            }
+        if category_trie is not None:
+            result["categoryTree"] = category_trie.to_dict()
+        return result
         
     except Exception as e:
         return {
@@ -131,100 +108,370 @@ def parse_po_template_input(file_path: str) -> Dict[str, Any]:
             "orders": []
         }
 
-def format_date(date_value: Any) -> str:
-    """날짜 값을 YYYY-MM-DD 형식으로 변환"""
-    if date_value is None:
-        return ""
-    
+def input_sheet_signature(file_path: str) -> Optional[str]:
+    """Input 시트 파트 서명 (XlsxPackage.sheet_signature, 읽을 수 없으면 None)"""
     try:
-        # datetime 객체인 경우
-        if isinstance(date_value, datetime):
-            return date_value.strftime("%Y-%m-%d")
+        with XlsxPackage(file_path) as package:
+            return package.sheet_signature("Input")
+    except Exception:
+        return None
+
+def _same_source(previous_fingerprints: Dict[str, Any], source: Optional[str]) -> bool:
+    return (source is not None
+            and previous_fingerprints.get("version") == FINGERPRINT_VERSION
+            and previous_fingerprints.get("source") == source)
+
+def _unchanged_result(previous_fingerprints: Dict[str, Any]) -> Dict[str, Any]:
+    total_orders = len(previous_fingerprints["orders"])
+    return {
+        "success": True,
+        "totalOrders": total_orders,
+        "totalItems": previous_fingerprints["totalItems"],
+        "incremental": True,
+        "orders": [],
+        "removedOrders": [],
+        "diff": {"added": [], "changed": [], "removed": [], "unchanged": total_orders, "rowChanges": {}},
+        "fingerprints": previous_fingerprints
+    }
+
+def build_po_order_book(file_path: str, streaming: Optional[bool] = None,
+                        engine: str = "openpyxl",
+                        row_fingerprints: Optional[Dict[str, List[str]]] = None,
+                        category_trie: Optional[CategoryTrie] = None) -> POOrderBook:
+    """
+    Input 시트를 읽어 발주번호별로 묶은 POOrderBook 생성
+    
+    발주서 헤더는 발주번호가 처음 나온 행에서 한 번만 저장하고, 아이템은
+    __slots__ 레코드로 보관한다. 같은 발주번호가 떨어진 위치에 다시 나와도
+    같은 발주서에 추가된다.
+    
+    Args:
+        file_path: Excel 파일 경로
+        streaming: parse_po_template_input과 동일
+        engine: parse_po_template_input과 동일
+        row_fingerprints: collect_po_order_book과 동일
+        category_trie: collect_po_order_book과 동일
+    """
+    if engine == "xml":
+        streaming = True
+    elif streaming is None:
+        streaming = os.path.getsize(file_path) >= STREAMING_THRESHOLD_BYTES
+    
+    if streaming:
+        date1904 = is_date1904(file_path)
+        rows = iter_input_rows(file_path, engine=engine)
+    else:
+        from openpyxl import load_workbook
+        from openpyxl.utils.datetime import CALENDAR_MAC_1904
+
+        # Excel 파일 로드
+        workbook = load_workbook(file_path, data_only=True)
         
-        # Excel 시리얼 번호인 경우
-        if isinstance(date_value, (int, float)):
-            excel_epoch = datetime(1900, 1, 1)
-            if date_value > 59:
-                date_value -= 1  # Excel 1900년 버그 보정
-            converted_date = excel_epoch + pd.Timedelta(days=date_value - 2)
-            return converted_date.strftime("%Y-%m-%d")
+        if "Input" not in workbook.sheetnames:
+            raise ValueError("'Input' 시트를 찾을 수 없습니다.")
         
-        # 문자열인 경우
-        if isinstance(date_value, str):
-            if len(date_value) == 10 and date_value.count('-') == 2:
-                return date_value
-            try:
-                parsed_date = pd.to_datetime(date_value)
-                return parsed_date.strftime("%Y-%m-%d")
-            except:
-                return str(date_value)
+        date1904 = workbook.epoch == CALENDAR_MAC_1904
+        # 1행(헤더)부터 모든 행 읽기
+        rows = workbook["Input"].iter_rows(values_only=True)
+    
+    return collect_po_order_book(rows, date1904, row_fingerprints, category_trie)
+
+def collect_po_order_book(rows: Iterable[tuple], date1904: bool = False,
+                          row_fingerprints: Optional[Dict[str, List[str]]] = None,
+                          category_trie: Optional[CategoryTrie] = None) -> POOrderBook:
+    """
+    Input 시트 행(1행 헤더부터)을 POOrderBook으로 수집
+    
+    행 소스와 무관하게 동작하므로 이미 열어 둔 XlsxPackage의 iter_rows도 그대로 넘길 수 있다.
+    첫 행의 헤더로 컬럼 레이아웃을 정한다 (InputRowParser).
+    
+    Args:
+        rows: Input 시트 행 튜플 (첫 행은 헤더)
+        date1904: 워크북이 1904 날짜 체계인지 여부
+        row_fingerprints: 주면 발주번호 → [헤더 지문, 아이템 행 지문, ...]을 행 순서대로 채움
+        category_trie: 주면 아이템마다 분류 경로를 누적
+    
+    Raises:
+        ValueError: 발주번호 컬럼이 없는 레이아웃인 경우
+    """
+    order_book = POOrderBook()
+    rows = iter(rows)
+    parse_row = _read_header(rows, date1904)
+    if parse_row is None:
+        return order_book
+    parse_row.require_order_number()
+    for row in rows:
+        parsed_row = parse_row(row)
+        if parsed_row is not None:
+            order_book.add(*parsed_row)
+            if category_trie is not None:
+                category_trie.add_item(parsed_row[1])
+            if row_fingerprints is not None:
+                header, item = parsed_row
+                order_fingerprints = row_fingerprints.get(header[0])
+                if order_fingerprints is None:
+                    # 헤더는 발주번호의 첫 행 값만 쓰이므로 첫 행에서 한 번만 지문 계산
+                    order_fingerprints = row_fingerprints[header[0]] = [fingerprint_values(header)]
+                order_fingerprints.append(fingerprint_values(item.as_tuple()))
+    
+    return order_book
+
+def fingerprint_values(values: tuple) -> str:
+    """
+    파싱된 값 튜플의 지문 (16자리 hex)
+    
+    셀 원시값이 아닌 변환 결과로 계산하므로 엔진(openpyxl/xml)이나 날짜 저장 방식이
+    달라도 값이 같으면 지문이 같다.
+    """
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=8).hexdigest()
+
+def diff_row_fingerprints(previous: Dict[str, Any], current: Dict[str, List[str]]) -> Dict[str, Any]:
+    """
+    이전/현재 행 지문 비교
+    
+    발주서의 지문 목록(헤더 + 아이템 행, 순서 포함)이 다르면 변경으로 본다. 이전 지문의
+    버전이 다르면 모든 발주서를 추가로 취급한다.
+    
+    Args:
+        previous: 이전 파싱의 "fingerprints"
+                  ({"version", "source", "totalItems", "orders": {발주번호: [헤더 지문, 행 지문, ...]}})
+        current: 이번 파싱의 발주번호 → 지문 목록
+    
+    Returns:
+        Dict: {"added", "changed", "removed": 발주번호 목록, "unchanged": 발주서 수,
+               "rowChanges": {변경된 발주번호: [추가된 아이템 행 수, 삭제된 아이템 행 수]}}
+              (행 수가 [0, 0]이면 헤더나 아이템 순서만 바뀐 것)
+    """
+    previous_orders = previous.get("orders", {}) if previous.get("version") == FINGERPRINT_VERSION else {}
+    added, changed, row_changes = [], [], {}
+    for order_number, rows in current.items():
+        previous_rows = previous_orders.get(order_number)
+        if previous_rows is None:
+            added.append(order_number)
+        elif previous_rows != rows:
+            changed.append(order_number)
+            current_counts, previous_counts = Counter(rows[1:]), Counter(previous_rows[1:])
+            row_changes[order_number] = [
+                sum((current_counts - previous_counts).values()),
+                sum((previous_counts - current_counts).values())
+            ]
+    removed = [order_number for order_number in previous_orders if order_number not in current]
+    return {
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "unchanged": len(current) - len(added) - len(changed),
+        "rowChanges": row_changes
+    }
+
+def iter_po_template_orders(file_path: str, engine: str = "openpyxl") -> Iterator[Dict[str, Any]]:
+    """
+    Input 시트를 read-only 모드로 한 행씩 읽으며 발주서 단위로 yield
+    
+    연속된 행 중 발주번호가 같은 행들을 하나의 발주서로 묶는다.
+    메모리에는 현재 발주서 하나(와 이미 yield한 발주번호 집합)만 유지되므로 행 수와
+    관계없이 사용량이 일정하다.
+    
+    같은 발주번호가 연속되지 않고 다시 나오면 그 행들은 별도의 발주서로 한 번 더
+    yield되며 "continuation": True가 붙는다. 이 경우 헤더는 이어지는 구간의 첫 행 값이고
+    totalAmount는 그 구간 아이템의 합계이다. parse_po_template_input과 같은 결과가
+    필요하면 continuation 발주서의 items를 앞서 받은 같은 발주번호 발주서에 이어 붙이고
+    totalAmount를 더하면 된다.
+    
+    Args:
+        file_path: Excel 파일 경로
+        engine: 행 소스 ("openpyxl" 또는 "xml")
         
-        return str(date_value)
+    Yields:
+        Dict: parse_po_template_input의 orders 항목과 같은 형태의 발주서
+    
+    Raises:
+        ValueError: 발주번호 컬럼이 없는 레이아웃인 경우
+    """
+    current_run = POOrderBook()
+    yielded_numbers = set()
+    rows = iter_input_rows(file_path, engine=engine)
+    parse_row = _read_header(rows, is_date1904(file_path))
+    if parse_row is None:
+        return
+    parse_row.require_order_number()
+    
+    for row in rows:
+        parsed_row = parse_row(row)
+        if parsed_row is None:
+            continue
         
-    except Exception as e:
-        print(f"날짜 변환 오류: {date_value} -> {str(e)}")
-        return str(date_value) if date_value is not None else ""
+        header, item = parsed_row
+        if current_run.total_items and current_run.get(header[0]) is None:
+            yield from _run_orders(current_run, yielded_numbers)
+            current_run = POOrderBook()
+        current_run.add(header, item)
+    
+    if current_run.total_items:
+        yield from _run_orders(current_run, yielded_numbers)
 
-def safe_number(value: Any) -> float:
-    """값을 안전하게 숫자로 변환"""
-    if value is None:
-        return 0.0
+def _run_orders(run: POOrderBook, yielded_numbers: set) -> Iterator[Dict[str, Any]]:
+    """연속 구간 하나의 발주서 (앞에서 이미 나온 발주번호면 continuation 표시)"""
+    for order in run.to_orders():
+        if order["orderNumber"] in yielded_numbers:
+            order["continuation"] = True
+        else:
+            yielded_numbers.add(order["orderNumber"])
+        yield order
+
+def build_po_item_table(file_path: str, engine: str = "openpyxl",
+                        row_numbers: bool = False,
+                        mapped_fields: Optional[Set[str]] = None) -> ColumnarTable:
+    """
+    Input 시트를 스트리밍으로 읽어 아이템 단위 컬럼형 테이블 생성
     
-    try:
-        if isinstance(value, (int, float)):
-            return float(value)
+    발주서 헤더 필드(발주번호, 발주일, 현장명, 납기일, 거래처명)도 아이템 행마다
+    사전 인코딩되어 저장되므로 반복되는 문자열은 한 번만 메모리에 올라간다.
+    
+    Args:
+        file_path: Excel 파일 경로
+        engine: 행 소스 ("openpyxl" 또는 "xml")
+        row_numbers: True면 아이템의 시트 행 번호를 INT 필드 "sheetRow"로 함께 저장
+        mapped_fields: 주면 헤더에서 컬럼을 찾은 필드 이름을 채움 (없는 필드는 테이블에 0/빈 값)
+    
+    발주번호 컬럼이 없는 레이아웃도 읽으며, 이때 orderNumber는 빈 값이다.
+    """
+    schema = {**PO_ITEM_SCHEMA, SHEET_ROW_FIELD: INT} if row_numbers else PO_ITEM_SCHEMA
+    table = ColumnarTable(schema)
+    rows = iter_input_rows(file_path, engine=engine)
+    parse_row = _read_header(rows, is_date1904(file_path))
+    if parse_row is None:
+        return table
+    if mapped_fields is not None:
+        mapped_fields.update(parse_row.mapped_fields)
+    
+    # 빈 행도 yield되므로 헤더 다음 2행부터 순서대로 세면 시트 행 번호
+    for sheet_row, row in enumerate(rows, start=2):
+        parsed_row = parse_row(row)
+        if parsed_row is None:
+            continue
         
-        if isinstance(value, str):
-            if not value.strip():
-                return 0.0
-            # 쉼표 제거 후 변환
-            cleaned_value = value.replace(",", "").strip()
-            return float(cleaned_value)
+        header, item = parsed_row
+        if row_numbers:
+            table.append(header + item.as_tuple() + (sheet_row,))
+        else:
+            table.append(header + item.as_tuple())
+    
+    return table
+
+def iter_input_rows(file_path: str, engine: str = "openpyxl") -> Iterator[tuple]:
+    """
+    Input 시트의 행을 1행(헤더)부터 스트리밍
+    
+    Args:
+        file_path: Excel 파일 경로
+        engine: "openpyxl"(read-only 모드) 또는 "xml"(xlsx_reader)
+    """
+    if engine == "xml":
+        yield from iter_sheet_rows(file_path, "Input")
+        return
+    
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if "Input" not in workbook.sheetnames:
+            raise ValueError("'Input' 시트를 찾을 수 없습니다.")
         
-        return 0.0
+        worksheet = workbook["Input"]
+        yield from worksheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+class InputRowParser:
+    """
+    Input 시트 한 행을 (발주서 헤더, 아이템 레코드) 쌍으로 변환
+    
+    컬럼 위치는 헤더 행으로 정한다 (po_schema_registry.get_row_converter). 발주번호가 빈
+    행은 건너뛴다.
+    
+    발주번호 컬럼이 없는 레이아웃(standard, PO_Excel_Template.xlsx 16개 컬럼)은 모든 셀이
+    빈 행만 건너뛰고 발주번호를 빈 값으로 둔다. 발주번호는 서버에서 부여하므로 발주서로
+    묶는 경로(collect_po_order_book, iter_po_template_orders)는 이 레이아웃을 거부한다.
+    """
+    
+    __slots__ = ("convert", "date1904", "mapped_fields", "has_order_number")
+    
+    def __init__(self, header_row: Sequence[Any], date1904: bool = False):
+        converter = get_row_converter(header_row, fields=INPUT_RECORD_FIELDS)
+        self.convert = converter.convert
+        self.date1904 = date1904
+        # 헤더에서 컬럼을 찾은 필드 (나머지는 빈 값/0으로 채워짐)
+        self.mapped_fields = frozenset(field for _, field, _ in converter.columns)
+        self.has_order_number = converter.has_field("orderNumber")
+    
+    def __call__(self, row: tuple) -> Optional[Tuple[OrderHeader, POItemRecord]]:
+        """
+        Returns:
+            tuple | None: 건너뛸 행이면 None
+        """
+        values = self.convert(row, self.date1904)
+        if values is None:
+            return None
+        return values[:5], POItemRecord(*values[5:])
+    
+    def require_order_number(self) -> None:
+        """
+        발주서 단위로 묶을 수 있는 레이아웃인지 확인
         
-    except Exception as e:
-        print(f"숫자 변환 오류: {value} -> {str(e)}")
-        return 0.0
+        Raises:
+            ValueError: 발주번호 컬럼이 없는 경우
+        """
+        if not self.has_order_number:
+            raise ValueError("발주번호 컬럼이 없는 Input 시트입니다 (발주번호는 서버에서 부여)")
 
-def extract_sheets_for_email(file_path: str, sheet_names: List[str] = ["갑지", "을지"]) -> Dict[str, Any]:
+def _read_header(rows: Iterator[tuple], date1904: bool) -> Optional[InputRowParser]:
+    """행 이터레이터에서 헤더 행을 꺼내 InputRowParser 생성 (시트가 비었으면 None)"""
+    header_row = next(rows, None)
+    if header_row is None:
+        return None
+    return InputRowParser(header_row, date1904)
+
+def extract_sheets_for_email(file_path: str, sheet_names: List[str] = ["갑지", "을지"],
+                             output_path: Optional[str] = None) -> Dict[str, Any]:
     """
     이메일 발송을 위한 특정 시트들 추출
     
+    워크북을 로드하지 않고 시트 XML 머리의 dimension과 mergeCells만 읽는다.
+    output_path를 지정하면 요청한 시트만 남긴 워크북을 파트 복사로 만든다
+    (xlsx_sheet_remover.keep_sheets_in_bytes, 서식/그림 등은 원본 바이트 그대로).
+    
     Args:
         file_path: Excel 파일 경로
         sheet_names: 추출할 시트 이름들
+        output_path: 추출한 시트만 담은 워크북 저장 경로 (None이면 정보만 반환)
         
     Returns:
-        Dict: 추출된 시트 정보
+        Dict: 추출된 시트 정보 (output_path 지정 시 "extracted_file" 포함)
     """
     try:
-        workbook = load_workbook(file_path, data_only=True)
+        with open(file_path, "rb") as source:
+            data = source.read()
         
-        extracted_sheets = {}
-        for sheet_name in sheet_names:
-            if sheet_name in workbook.sheetnames:
-                worksheet = workbook[sheet_name]
-                
-                # 시트 정보 수집
-                sheet_info = {
-                    "name": sheet_name,
-                    "max_row": worksheet.max_row,
-                    "max_column": worksheet.max_column,
-                    "merged_cells": len(worksheet.merged_cells.ranges),
-                    "exists": True
-                }
-                extracted_sheets[sheet_name] = sheet_info
-            else:
-                extracted_sheets[sheet_name] = {
-                    "name": sheet_name,
-                    "exists": False
+        with XlsxPackage(io.BytesIO(data)) as package:
+            result = {
+                "success": True,
+                "sheets": read_sheet_info(package, sheet_names)
+            }
+            
+            if output_path:
+                from atomic_write import atomic_output
+                from xlsx_sheet_remover import keep_sheets_in_bytes
+
+                with atomic_output(output_path) as output:
+                    plan = keep_sheets_in_bytes(data, output, sheet_names, package.archive)
+                result["extracted_file"] = {
+                    "path": output_path,
+                    "kept_sheets": plan["remaining_sheets"],
+                    "removed_sheets": plan["removed_sheets"]
                 }
         
-        return {
-            "success": True,
-            "sheets": extracted_sheets
-        }
+        return result
         
     except Exception as e:
         return {
@@ -233,6 +480,24 @@ def extract_sheets_for_email(file_path: str, sheet_names: List[str] = ["갑지",
             "sheets": {}
         }
 
+def read_sheet_info(package: XlsxPackage, sheet_names: List[str]) -> Dict[str, Any]:
+    """
+    열어 둔 패키지에서 시트별 크기와 병합 셀 수 수집 (XlsxPackage.sheet_extent)
+    
+    Returns:
+        Dict: 시트 이름 → {"name", "max_row", "max_column", "merged_cells", "exists"}
+              또는 {"name", "exists": False}
+    """
+    sheets = {}
+    for sheet_name in sheet_names:
+        if sheet_name not in package.sheet_paths:
+            sheets[sheet_name] = {"name": sheet_name, "exists": False}
+            continue
+        
+        summary = package.sheet_extent(sheet_name)
+        sheets[sheet_name] = {"name": sheet_name, **summary, "exists": True}
+    return sheets
+
 # 테스트 실행
 if __name__ == "__main__":
     file_path = "PO_Template01__Ext_20250716_2.xlsx"
@@ -0,0 +1,117 @@
+"""
+업로드 한 건을 워크북 한 번 열기로 처리하는 파이프라인
+
+업로드마다 Input 시트 파싱(parse_po_template_input), 갑지/을지 정보 추출
+(extract_sheets_for_email), Input 시트를 뺀 첨부 파일 생성(remove_input_sheet_*)이
+각각 같은 파일을 다시 열고 다시 파싱했다. process_upload는
+
+- 파일을 한 번 읽어 메모리의 zip 하나(XlsxPackage)를 세 단계가 함께 쓰고
+- Input 시트는 xlsx_reader로 스트리밍 파싱하며 (parse --engine xml과 같은 결과)
+- 갑지/을지 정보는 extract_sheets_for_email과 같이 시트 XML 머리의 dimension/병합 범위만 읽고
+- 첨부 파일은 같은 바이트와 zip 목록으로 xlsx_sheet_remover가 만든다
+
+각 단계 결과는 기존 명령의 결과와 같은 형태이며, 단계별 소요 시간(ms)을 함께 반환한다.
+첨부 파일 생성이 실패해도 앞 단계의 파싱 결과와 시트 정보는 그대로 돌려준다.
+
+사용 예:
+    from po_upload_pipeline import process_upload
+    result = process_upload("upload.xlsx", "attachment.xlsx")
+"""
+
+import io
+import time
+from typing import Any, Dict, List, Optional
+
+from atomic_write import atomic_output
+from po_template_parser import collect_po_order_book, read_sheet_info
+from xlsx_reader import XlsxPackage
+from xlsx_sheet_remover import remove_sheet_from_bytes
+
+DEFAULT_EMAIL_SHEETS = ["갑지", "을지"]
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def _write_attachment(data: bytes, package: XlsxPackage, attachment_path: str,
+                      input_sheet_name: str) -> Dict[str, Any]:
+    """열어 둔 패키지의 바이트에서 Input 시트를 뺀 첨부 파일 생성"""
+    try:
+        with atomic_output(attachment_path) as output:
+            plan = remove_sheet_from_bytes(data, output, input_sheet_name, package.archive)
+    except Exception as e:
+        return {"success": False, "path": attachment_path, "error": str(e)}
+
+    return {
+        "success": True,
+        "path": attachment_path,
+        "removed_sheet": plan["removed_sheet"],
+        "remaining_sheets": plan["remaining_sheets"],
+        "dropped_parts": sorted(plan["dropped"])
+    }
+
+
+def process_upload(file_path: str, attachment_path: Optional[str] = None,
+                   sheet_names: Optional[List[str]] = None,
+                   input_sheet_name: str = "Input") -> Dict[str, Any]:
+    """
+    Input 시트 파싱, 시트 정보 추출, 첨부 파일 생성을 한 번에 수행
+
+    Args:
+        file_path: 업로드된 엑셀 파일 경로
+        attachment_path: Input 시트를 뺀 첨부 파일 경로 (None이면 생성하지 않음).
+                         임시 파일에 쓴 뒤 원자적으로 교체하므로 file_path와 같아도 된다
+        sheet_names: 정보를 추출할 시트들 (기본: 갑지, 을지)
+        input_sheet_name: 파싱 후 첨부 파일에서 제거할 시트명
+
+    Returns:
+        Dict: {"success", "parse": parse_po_template_input 결과,
+               "sheets": extract_sheets_for_email 결과,
+               "attachment": {"success", "path", "removed_sheet", "remaining_sheets", "dropped_parts"}
+                             (실패 시 {"success": False, "path", "error"}) 또는 None,
+               "timings": {"readMs", "parseMs", "sheetsMs", "attachmentMs", "totalMs"}}
+    """
+    sheet_names = sheet_names or DEFAULT_EMAIL_SHEETS
+    timings: Dict[str, float] = {}
+    result: Dict[str, Any] = {"success": False, "timings": timings}
+    pipeline_started = time.perf_counter()
+
+    try:
+        started = time.perf_counter()
+        with open(file_path, "rb") as source:
+            data = source.read()
+        timings["readMs"] = _elapsed_ms(started)
+
+        with XlsxPackage(io.BytesIO(data)) as package:
+            started = time.perf_counter()
+            if input_sheet_name not in package.sheet_paths:
+                raise ValueError(f"'{input_sheet_name}' 시트를 찾을 수 없습니다.")
+            rows = package.iter_rows(input_sheet_name)
+            order_book = collect_po_order_book(rows, package.date1904)
+            result["parse"] = {
+                "success": True,
+                "totalOrders": order_book.total_orders,
+                "totalItems": order_book.total_items,
+                "orders": order_book.to_orders()
+            }
+            timings["parseMs"] = _elapsed_ms(started)
+
+            started = time.perf_counter()
+            result["sheets"] = {"success": True, "sheets": read_sheet_info(package, sheet_names)}
+            timings["sheetsMs"] = _elapsed_ms(started)
+
+            result["attachment"] = None
+            if attachment_path:
+                started = time.perf_counter()
+                result["attachment"] = _write_attachment(data, package, attachment_path, input_sheet_name)
+                timings["attachmentMs"] = _elapsed_ms(started)
+
+        # 첨부 파일 생성이 실패해도(예: Input 시트만 있는 워크북) 파싱 결과는 그대로 반환
+        result["success"] = result["attachment"] is None or result["attachment"]["success"]
+
+    except Exception as e:
+        result["error"] = str(e)
+
+    timings["totalMs"] = _elapsed_ms(pipeline_started)
+    return result
@@ -0,0 +1,200 @@
+"""
+Input 시트 금액 정합성 검증
+
+파서들은 금액 컬럼을 숫자로 바꾸기만 하고 서로 맞는지는 확인하지 않아, 잘못된 행이
+승인 후에야 발견되었다. 이 모듈은 build_po_item_table이 만든 컬럼형 테이블의
+숫자 컬럼 전체에 규칙을 numpy 배열 연산으로 한 번에 적용한다 (행 단위 루프 없음).
+
+규칙 (AMOUNT_RULES):
+    AMT001  공급가액 = 수량 × 단가
+    AMT002  총금액 = 공급가액 + 세액
+    AMT003  세액 = 공급가액 × 세율
+
+시트 헤더에 없는 컬럼은 0으로 읽히므로, 규칙이 읽는 필드(RULE_FIELDS) 중 하나라도
+헤더에 없으면 그 규칙은 적용하지 않고 "skippedRules"에 빠진 필드와 함께 보고한다.
+
+기대값은 설정한 방식(반올림/버림/올림/없음)과 자릿수로 맞춘 뒤, 실제값과의 차이가
+abs_tolerance + rel_tolerance × |기대값|을 넘으면 위반이다. 결과는 위반 행만 담은
+압축 테이블(columns + violations 행 목록)이며 행 번호는 Input 시트의 행 번호이다.
+
+사용 예:
+    from po_validation import validate_po_amounts
+    result = validate_po_amounts("upload.xlsx", config={"rounding": "floor"})
+"""
+
+import time
+from typing import Any, Dict, Optional, Set
+
+import numpy as np
+
+from po_columnar import SHEET_ROW_FIELD, ColumnarTable
+from po_template_parser import build_po_item_table
+
+# 규칙 ID → (설명, 검사 대상 필드)
+AMOUNT_RULES = {
+    "AMT001": ("공급가액 = 수량 × 단가", "supplyAmount"),
+    "AMT002": ("총금액 = 공급가액 + 세액", "totalAmount"),
+    "AMT003": ("세액 = 공급가액 × 세율", "taxAmount"),
+}
+
+# 규칙 ID → 규칙이 읽는 필드 (하나라도 시트에 없으면 규칙을 적용하지 않음)
+RULE_FIELDS = {
+    "AMT001": ["quantity", "unitPrice", "supplyAmount"],
+    "AMT002": ["supplyAmount", "taxAmount", "totalAmount"],
+    "AMT003": ["supplyAmount", "taxAmount"],
+}
+
+DEFAULT_VALIDATION_CONFIG = {
+    "rules": list(AMOUNT_RULES),
+    "tax_rate": 0.1,
+    "rounding": "round",      # 기대값 처리: none | round | floor | ceil
+    "decimals": 0,            # rounding 자릿수 (0: 원 단위)
+    "abs_tolerance": 1.0,     # 허용 오차 (원)
+    "rel_tolerance": 0.0,     # 기대값 대비 허용 비율
+    "rule_tolerances": {},    # 규칙 ID → abs_tolerance (규칙별로 다르게 줄 때)
+    "max_violations": 1000,   # 결과에 담을 최대 위반 수 (건수 집계는 전체 기준)
+}
+
+VIOLATION_COLUMNS = ["row", "rule", "orderNumber", "expected", "actual", "difference"]
+
+# floor/ceil 전에 부동소수점 곱셈 오차(예: 657.9999999998)를 정리하는 자릿수
+_CLEANUP_DECIMALS = 6
+
+
+def _apply_rounding(values: np.ndarray, rounding: str, decimals: int) -> np.ndarray:
+    if rounding == "none":
+        return values
+    scale = 10.0 ** decimals
+    scaled = np.round(values * scale, _CLEANUP_DECIMALS)
+    if rounding == "round":
+        # Excel ROUND와 같이 0.5는 0에서 먼 쪽으로 (np.round는 짝수 쪽으로 반올림)
+        rounded = np.sign(scaled) * np.floor(np.abs(scaled) + 0.5)
+    elif rounding == "floor":
+        rounded = np.floor(scaled)
+    elif rounding == "ceil":
+        rounded = np.ceil(scaled)
+    else:
+        raise ValueError(f"지원하지 않는 반올림 방식입니다: {rounding}")
+    return rounded / scale
+
+
+def _expected_values(rule: str, columns: Dict[str, np.ndarray], tax_rate: float) -> np.ndarray:
+    if rule == "AMT001":
+        return columns["quantity"] * columns["unitPrice"]
+    if rule == "AMT002":
+        return columns["supplyAmount"] + columns["taxAmount"]
+    if rule == "AMT003":
+        return columns["supplyAmount"] * tax_rate
+    raise ValueError(f"알 수 없는 검증 규칙입니다: {rule}")
+
+
+def validate_item_table(table: ColumnarTable, config: Optional[Dict[str, Any]] = None,
+                        mapped_fields: Optional[Set[str]] = None) -> Dict[str, Any]:
+    """
+    PO_ITEM_SCHEMA 테이블의 금액 정합성 검증
+
+    Args:
+        table: build_po_item_table 결과 (row_numbers=True면 위반에 시트 행 번호가 들어감)
+        config: DEFAULT_VALIDATION_CONFIG 중 바꿀 항목
+        mapped_fields: 시트 헤더에 있던 필드 (build_po_item_table의 mapped_fields).
+                       주면 읽는 필드가 빠진 규칙은 적용하지 않음 (None이면 모든 규칙 적용)
+
+    Returns:
+        Dict: {"success", "checkedRows", "violationCount", "truncated", "rules",
+               "skippedRules": {규칙: 빠진 필드 목록}, "countsByRule",
+               "columns": VIOLATION_COLUMNS, "violations": [[...], ...], "elapsedMs"}
+    """
+    config = {**DEFAULT_VALIDATION_CONFIG, **(config or {})}
+    started = time.perf_counter()
+
+    for rule in config["rules"]:
+        if rule not in AMOUNT_RULES:
+            raise ValueError(f"알 수 없는 검증 규칙입니다: {rule}")
+    skipped_rules = {}
+    if mapped_fields is not None:
+        for rule in config["rules"]:
+            missing = [field for field in RULE_FIELDS[rule] if field not in mapped_fields]
+            if missing:
+                skipped_rules[rule] = missing
+    applied_rules = [rule for rule in config["rules"] if rule not in skipped_rules]
+
+    columns = {
+        name: table.numeric(name)
+        for name in ("quantity", "unitPrice", "supplyAmount", "taxAmount", "totalAmount")
+    }
+    rule_ids = []
+    row_indexes = []
+    expected_parts = []
+    actual_parts = []
+    counts_by_rule = {}
+    for rule in applied_rules:
+        actual = columns[AMOUNT_RULES[rule][1]]
+        expected = _apply_rounding(
+            _expected_values(rule, columns, config["tax_rate"]), config["rounding"], config["decimals"]
+        )
+        tolerance = config["rule_tolerances"].get(rule, config["abs_tolerance"])
+        violating = np.flatnonzero(
+            np.abs(actual - expected) > tolerance + config["rel_tolerance"] * np.abs(expected)
+        )
+        counts_by_rule[rule] = int(violating.size)
+        rule_ids.append(np.full(violating.size, len(rule_ids), dtype=np.int32))
+        row_indexes.append(violating)
+        expected_parts.append(expected[violating])
+        actual_parts.append(actual[violating])
+
+    # 위반을 (행, 규칙) 순으로 정렬한 뒤 max_violations개만 dict/list로 변환
+    rule_codes = np.concatenate(rule_ids) if rule_ids else np.empty(0, dtype=np.int32)
+    indexes = np.concatenate(row_indexes) if row_indexes else np.empty(0, dtype=np.intp)
+    expected_all = np.concatenate(expected_parts) if expected_parts else np.empty(0)
+    actual_all = np.concatenate(actual_parts) if actual_parts else np.empty(0)
+    order = np.lexsort((rule_codes, indexes))[:config["max_violations"]]
+
+    sheet_rows = table.columns.get(SHEET_ROW_FIELD)
+    order_number_codes, order_numbers = table.codes("orderNumber")
+    violations = []
+    for position in order.tolist():
+        index = int(indexes[position])
+        expected = float(expected_all[position])
+        actual = float(actual_all[position])
+        violations.append([
+            sheet_rows[index] if sheet_rows is not None else None,
+            applied_rules[rule_codes[position]],
+            order_numbers[order_number_codes[index]],
+            expected,
+            actual,
+            round(actual - expected, 6)
+        ])
+
+    return {
+        "success": True,
+        "checkedRows": len(table),
+        "violationCount": int(indexes.size),
+        "truncated": indexes.size > len(violations),
+        "rules": {rule: AMOUNT_RULES[rule][0] for rule in applied_rules},
+        "skippedRules": skipped_rules,
+        "countsByRule": counts_by_rule,
+        "columns": VIOLATION_COLUMNS,
+        "violations": violations,
+        "elapsedMs": round((time.perf_counter() - started) * 1000, 2)
+    }
+
+
+def validate_po_amounts(file_path: str, engine: str = "xml",
+                        config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Input 시트를 읽어 금액 정합성 검증
+
+    Args:
+        file_path: Excel 파일 경로
+        engine: build_po_item_table의 행 소스 ("xml" 또는 "openpyxl")
+        config: DEFAULT_VALIDATION_CONFIG 중 바꿀 항목
+
+    Returns:
+        Dict: validate_item_table 결과 (실패 시 {"success": False, "error"})
+    """
+    try:
+        mapped_fields = set()
+        table = build_po_item_table(file_path, engine=engine, row_numbers=True, mapped_fields=mapped_fields)
+        return validate_item_table(table, config, mapped_fields)
+    except Exception as e:
+        return {"success": False, "error": str(e)}
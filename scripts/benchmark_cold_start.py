@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+명령별 콜드 스타트 시간 측정
+
+Node가 업로드마다 python3를 새로 띄우는 것과 같은 방식으로, 명령마다 새 프로세스를
+여러 번 실행해 전체 소요 시간(인터프리터 기동 + import + 처리)의 중앙값/최소값을
+출력한다. 비교 기준으로 빈 인터프리터 기동 시간과 각 명령의 주요 모듈 import 여부를
+함께 보여준다.
+
+사용법:
+    python scripts/benchmark_cold_start.py [--runs 5] [--rows 50] [--file path.xlsx]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, ".."))
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, SCRIPT_DIR)
+
+from benchmark_xlsx_reader import create_input_workbook
+from po_cli import compile_modules
+
+CLI_PATH = os.path.join(REPO_ROOT, "po_cli.py")
+HEAVY_MODULES = ["openpyxl", "pandas", "numpy"]
+
+
+def create_benchmark_workbook(file_path, row_count):
+    """Input 시트에 갑지/을지 시트를 더한 측정용 워크북 (remove-sheet 후에도 시트가 남도록)"""
+    from openpyxl import load_workbook
+
+    create_input_workbook(file_path, row_count)
+    workbook = load_workbook(file_path)
+    for sheet_name in ("갑지", "을지"):
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet["A1"] = f"{sheet_name} 발주서"
+        worksheet.merge_cells("A1:D1")
+    workbook.save(file_path)
+
+
+def time_command(argv, runs):
+    """새 프로세스로 argv를 runs번 실행한 소요 시간(ms) 목록"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run(argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append((time.perf_counter() - started) * 1000)
+        if completed.returncode != 0:
+            raise RuntimeError(f"명령 실패 (code {completed.returncode}): {' '.join(argv)}")
+    return timings
+
+
+def loaded_heavy_modules(cli_args):
+    """명령 실행 후 sys.modules에 올라온 무거운 모듈 목록"""
+    code = (
+        "import sys, runpy, contextlib, io\n"
+        f"sys.argv = {['po_cli.py'] + cli_args!r}\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    try:\n"
+        f"        runpy.run_path({CLI_PATH!r}, run_name='__main__')\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                               cwd=REPO_ROOT)
+    return completed.stdout.strip().splitlines()[-1] if completed.stdout.strip() else ""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="명령별 콜드 스타트 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="명령당 실행 횟수")
+    parser.add_argument("--rows", type=int, default=50, help="생성할 Input 행 수 (--file 미지정 시)")
+    parser.add_argument("--file", help="측정에 사용할 엑셀 파일 (Input/갑지/을지 시트)")
+    args = parser.parse_args()
+
+    temp_dir = tempfile.TemporaryDirectory()
+    file_path = args.file
+    if not file_path:
+        file_path = os.path.join(temp_dir.name, "cold_start.xlsx")
+        create_benchmark_workbook(file_path, args.rows)
+    target_path = os.path.join(temp_dir.name, "removed.xlsx")
+    attachment_path = os.path.join(temp_dir.name, "attachment.xlsx")
+    copy_path = os.path.join(temp_dir.name, "copy.xlsx")
+    shutil.copy2(file_path, copy_path)
+
+    # 측정 전에 바이트코드를 만들어 두어 첫 실행의 컴파일 비용이 섞이지 않게 함
+    compile_modules()
+
+    commands = [
+        ("parse (xml)", ["parse", file_path, "--engine", "xml"]),
+        ("parse (openpyxl)", ["parse", file_path]),
+        ("extract-sheets", ["extract-sheets", file_path]),
+        ("remove-sheet", ["remove-sheet", copy_path, target_path, "--sheet", "Input"]),
+        ("verify", ["verify", file_path]),
+        ("pipeline", ["pipeline", file_path, attachment_path]),
+    ]
+
+    print(f"📊 {file_path}, 명령당 {args.runs}회 실행")
+    baseline = time_command([sys.executable, "-c", "pass"], args.runs)
+    print(f"  {'python3 -c pass':<20} 중앙값 {statistics.median(baseline):7.1f}ms  "
+          f"최소 {min(baseline):7.1f}ms")
+
+    for label, cli_args in commands:
+        timings = time_command([sys.executable, CLI_PATH] + cli_args, args.runs)
+        modules = loaded_heavy_modules(cli_args) or "-"
+        print(f"  {label:<20} 중앙값 {statistics.median(timings):7.1f}ms  "
+              f"최소 {min(timings):7.1f}ms  import: {modules}")
+
+    temp_dir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+발주서 그룹화 구조의 메모리 비교: 기존 dict 쌍 vs __slots__ 레코드(POOrderBook)
+
+Input 시트 행을 xlsx_reader로 한 번 읽어 둔 뒤, 각 구조로 그룹화했을 때
+살아 있는 객체가 차지하는 메모리를 아이템당 바이트로 출력한다.
+
+사용법:
+    python scripts/benchmark_po_records.py [--rows 50000] [--file path.xlsx]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import tracemalloc
+from collections import defaultdict
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(SCRIPT_DIR, ".."))
+sys.path.insert(0, SCRIPT_DIR)
+
+from benchmark_xlsx_reader import create_input_workbook
+from po_records import POOrderBook
+from po_template_parser import InputRowParser, iter_input_rows
+
+
+def iter_parsed_rows(raw_rows):
+    parse_row = InputRowParser(raw_rows[0])
+    for row in raw_rows[1:]:
+        parsed_row = parse_row(row)
+        if parsed_row is not None:
+            yield parsed_row
+
+
+def group_as_dict_pairs(raw_rows):
+    """기존 parse_po_template_input 방식: 아이템마다 orderInfo/itemData dict 쌍"""
+    orders_by_number = defaultdict(list)
+    for header, item in iter_parsed_rows(raw_rows):
+        order_info = {
+            "orderNumber": header[0],
+            "orderDate": header[1],
+            "siteName": header[2],
+            "dueDate": header[3],
+            "vendorName": header[4]
+        }
+        orders_by_number[header[0]].append({
+            "orderInfo": order_info,
+            "itemData": item.to_dict()
+        })
+    return orders_by_number
+
+
+def group_as_records(raw_rows):
+    """POOrderBook 방식: 헤더는 발주서당 한 번, 아이템은 __slots__ 레코드"""
+    order_book = POOrderBook()
+    for header, item in iter_parsed_rows(raw_rows):
+        order_book.add(header, item)
+    return order_book
+
+
+def measure(label, build, raw_rows, item_count):
+    """원시 행에서 구조를 만든 뒤 살아 있는 메모리를 측정 (원시 행 자체는 제외)"""
+    tracemalloc.start()
+    structure = build(raw_rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<28} {current / 1024 / 1024:8.1f}MB  {current / item_count:8.0f} bytes/item")
+    del structure
+    return current
+
+
+def main():
+    parser = argparse.ArgumentParser(description="발주서 그룹화 구조 메모리 비교")
+    parser.add_argument("--rows", type=int, default=50000, help="생성할 행 수 (--file 미지정 시)")
+    parser.add_argument("--file", help="측정할 기존 엑셀 파일 (Input 시트)")
+    args = parser.parse_args()
+
+    temp_dir = None
+    file_path = args.file
+    if not file_path:
+        temp_dir = tempfile.TemporaryDirectory()
+        file_path = os.path.join(temp_dir.name, "benchmark_input.xlsx")
+        print(f"📄 {args.rows}행 Input 시트 생성 중...")
+        create_input_workbook(file_path, args.rows)
+
+    raw_rows = list(iter_input_rows(file_path, engine="xml"))
+    print(f"📊 {file_path}: {len(raw_rows) - 1}행")
+
+    item_count = sum(1 for _ in iter_parsed_rows(raw_rows))
+    legacy = measure("dict 쌍 (orderInfo/itemData)", group_as_dict_pairs, raw_rows, item_count)
+    records = measure("POOrderBook (__slots__)", group_as_records, raw_rows, item_count)
+    print(f"  메모리 감소: {legacy / records:.1f}배")
+
+    if temp_dir:
+        temp_dir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
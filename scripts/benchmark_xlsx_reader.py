@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Input 시트 읽기 성능 비교: openpyxl(전체 로드 / read-only) vs xlsx_reader
+
+사용법:
+    python scripts/benchmark_xlsx_reader.py [--rows 50000] [--file path.xlsx] [--sheet Input]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from openpyxl import Workbook, load_workbook
+
+from xlsx_reader import iter_sheet_rows
+
+INPUT_HEADERS = [
+    "발주번호", "발주일", "현장명", "대분류", "중분류", "소분류", "품목명", "규격",
+    "수량", "단가", "공급가액", "세액", "총금액", "납기일", "거래처명", "납품처명", "비고"
+]
+
+
+def create_input_workbook(file_path, row_count):
+    """벤치마크용 Input 시트 생성 (write-only 모드)"""
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet("Input")
+    worksheet.append(INPUT_HEADERS)
+    base_date = datetime(2025, 1, 1)
+    for index in range(row_count):
+        quantity = index % 100 + 1
+        unit_price = (index * 37) % 10000 + 100
+        supply = quantity * unit_price
+        tax = round(supply * 0.1)
+        worksheet.append([
+            f"PO-{index // 5:06d}", base_date + timedelta(days=index % 30), f"현장{index % 7}",
+            "원자재", f"중분류{index % 5}", f"소분류{index % 3}", f"품목{index}", "규격",
+            quantity, unit_price, supply, tax, supply + tax,
+            base_date + timedelta(days=30 + index % 30), f"거래처{index % 40}",
+            f"납품처{index % 9}", None
+        ])
+    workbook.save(file_path)
+
+
+def measure(label, read_rows):
+    """행 읽기 함수 실행 시간과 최대 메모리 측정 (tracemalloc 오버헤드가 시간에 섞이지 않도록 두 번 실행)"""
+    started = time.perf_counter()
+    row_count = read_rows()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    read_rows()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<22} {elapsed:8.3f}s  {peak / 1024 / 1024:8.1f}MB  {row_count}행")
+    return elapsed
+
+
+def read_openpyxl(file_path, sheet_name, read_only):
+    workbook = load_workbook(file_path, read_only=read_only, data_only=True)
+    count = sum(1 for _ in workbook[sheet_name].iter_rows(min_row=2, max_col=17, values_only=True))
+    workbook.close()
+    return count
+
+
+def read_xml(file_path, sheet_name):
+    return sum(1 for _ in iter_sheet_rows(file_path, sheet_name, min_row=2, max_col=17))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Input 시트 읽기 엔진 성능 비교")
+    parser.add_argument("--rows", type=int, default=50000, help="생성할 행 수 (--file 미지정 시)")
+    parser.add_argument("--file", help="측정할 기존 엑셀 파일")
+    parser.add_argument("--sheet", default="Input", help="읽을 시트명 (기본: Input)")
+    args = parser.parse_args()
+
+    temp_dir = None
+    file_path = args.file
+    if not file_path:
+        temp_dir = tempfile.TemporaryDirectory()
+        file_path = os.path.join(temp_dir.name, "benchmark_input.xlsx")
+        print(f"📄 {args.rows}행 Input 시트 생성 중...")
+        create_input_workbook(file_path, args.rows)
+
+    print(f"📊 {file_path} ({os.path.getsize(file_path) / 1024:.0f}KB)")
+    full = measure("openpyxl (전체 로드)", lambda: read_openpyxl(file_path, args.sheet, False))
+    read_only = measure("openpyxl (read-only)", lambda: read_openpyxl(file_path, args.sheet, True))
+    xml = measure("xlsx_reader", lambda: read_xml(file_path, args.sheet))
+    print(f"  xlsx_reader 속도 향상: 전체 로드 대비 {full / xml:.1f}배, read-only 대비 {read_only / xml:.1f}배")
+
+    if temp_dir:
+        temp_dir.cleanup()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,51 +7,38 @@ Python openpyxl을 사용한 완벽한 서식 보존 엑셀 처리
 import sys
 import json
 import os
-from pathlib import Path
-from openpyxl import load_workbook
-from openpyxl.styles import Font, Border, Side, Alignment, PatternFill
-from openpyxl.utils import get_column_letter
 import argparse
+import hashlib
+import posixpath
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")))
+
+from xlsx_reader import XlsxPackage
+from xlsx_sheet_remover import remove_sheet_from_xlsx
 
 def remove_input_sheet_preserve_format(source_path, target_path, input_sheet_name='Input'):
     """
     Input 시트만 제거하고 모든 서식을 완벽하게 보존
     """
     try:
-        print(f"🐍 Python openpyxl로 서식 보존 처리 시작: {source_path} -> {target_path}")
+        print(f"🐍 서식 보존 처리 시작: {source_path} -> {target_path}")
         
         # 소스 파일 존재 확인
         if not os.path.exists(source_path):
             raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {source_path}")
         
-        # 워크북 로드 (모든 서식 정보 보존)
-        workbook = load_workbook(source_path, data_only=False, keep_vba=True, keep_links=True)
-        
-        original_sheets = workbook.sheetnames.copy()
-        print(f"📋 원본 시트 목록: {', '.join(original_sheets)}")
+        # 워크북을 로드하지 않고 zip 수준에서 Input 시트만 제거 (다른 시트 파트는 원본 바이트 그대로)
+        # 결과는 임시 파일에 쓴 뒤 rename으로 게시하며, 타겟 디렉토리가 없으면 생성
+        removal = remove_sheet_from_xlsx(source_path, target_path, input_sheet_name)
+        removed_sheet = removal['removed_sheet']
+        remaining_sheets = removal['remaining_sheets']
         
-        # Input 시트 제거
-        removed_sheet = False
-        if input_sheet_name in workbook.sheetnames:
-            del workbook[input_sheet_name]
-            removed_sheet = True
+        if removed_sheet:
             print(f"🗑️ '{input_sheet_name}' 시트가 제거되었습니다.")
         else:
             print(f"⚠️ '{input_sheet_name}' 시트를 찾을 수 없습니다.")
-        
-        remaining_sheets = workbook.sheetnames
         print(f"📋 남은 시트 목록: {', '.join(remaining_sheets)}")
-        
-        if len(remaining_sheets) == 0:
-            raise ValueError("모든 시트가 제거되어 빈 엑셀 파일이 됩니다.")
-        
-        # 타겟 디렉토리 생성
-        target_dir = os.path.dirname(target_path)
-        if target_dir and not os.path.exists(target_dir):
-            os.makedirs(target_dir, exist_ok=True)
-        
-        # 서식 보존하여 저장
-        workbook.save(target_path)
         print(f"✅ 서식 완벽 보존 완료: {target_path}")
         
         # 서식 검증
@@ -79,13 +66,106 @@ def remove_input_sheet_preserve_format(source_path, target_path, input_sheet_nam
             'error': error_msg
         }
 
+# 스타일 인덱스별 서식 판별 결과 순서
+STYLE_FLAGS = ('has_borders', 'has_font_styles', 'has_cell_colors', 'has_alignment')
+STYLE_COUNT_KEYS = {
+    'has_borders': 'borders_count',
+    'has_font_styles': 'font_styles_count',
+    'has_cell_colors': 'cell_colors_count',
+    'has_alignment': 'alignment_count'
+}
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+def _child(element, name):
+    if element is None:
+        return None
+    for child in element:
+        if _local_name(child.tag) == name:
+            return child
+    return None
+
+def _is_on(element):
+    return element is not None and element.get('val', 'true').lower() not in ('0', 'false')
+
+def _has_border(border):
+    return border is not None and any(
+        child.get('style') for child in border
+        if _local_name(child.tag) in ('left', 'right', 'top', 'bottom')
+    )
+
+def _has_font_style(font):
+    if font is None:
+        return False
+    name = _child(font, 'name')
+    size = _child(font, 'sz')
+    color = _child(font, 'color')
+    return (
+        _is_on(_child(font, 'b')) or _is_on(_child(font, 'i')) or
+        (name.get('val') if name is not None else None) != 'Calibri' or
+        (float(size.get('val')) if size is not None else None) != 11 or
+        # rgb가 아닌 색(테마/인덱스)은 openpyxl에서 rgb가 '00000000'이 아니므로 서식으로 봄
+        (color is not None and color.get('rgb') != '00000000')
+    )
+
+def _has_alignment(xf):
+    # openpyxl Alignment의 기본값은 None이므로 general/bottom을 명시한 경우만 '정렬 없음'
+    alignment = _child(xf, 'alignment')
+    return alignment is None or not (
+        alignment.get('horizontal') == 'general' and alignment.get('vertical') == 'bottom'
+    )
+
+def load_style_table(package):
+    """
+    styles.xml을 한 번 읽어 cellXfs 인덱스별 서식 판별 결과와 비교용 서명 목록 반환
+
+    판별 기준은 셀 단위로 openpyxl 객체를 검사하던 기존 검증과 같다.
+
+    Returns:
+        tuple: (인덱스별 STYLE_FLAGS 순서의 bool 튜플 목록, 인덱스별 서명(서식 XML 해시) 목록)
+    """
+    if 'xl/styles.xml' not in package.archive.namelist():
+        return [], []
+
+    root = ET.fromstring(package.archive.read('xl/styles.xml'))
+    sections = {_local_name(child.tag): list(child) for child in root}
+    fonts = sections.get('fonts', [])
+    fills = sections.get('fills', [])
+    borders = sections.get('borders', [])
+    num_fmts = {num_fmt.get('numFmtId'): num_fmt.get('formatCode') for num_fmt in sections.get('numFmts', [])}
+
+    def pick(items, index):
+        index = int(index or 0)
+        return items[index] if index < len(items) else None
+
+    flags = []
+    signatures = []
+    for xf in sections.get('cellXfs', []):
+        font = pick(fonts, xf.get('fontId'))
+        fill = pick(fills, xf.get('fillId'))
+        border = pick(borders, xf.get('borderId'))
+        # 색상: openpyxl은 patternType="none"을 None으로 읽으므로 기존 검사
+        # (fill_type != 'none')는 값이 있는 모든 셀을 색상 있음으로 센다. 같은 결과를 유지
+        flags.append((_has_border(border), _has_font_style(font), True, _has_alignment(xf)))
+        # 두 파일의 스타일 인덱스가 달라도 같은 서식이면 같은 서명
+        num_fmt_id = xf.get('numFmtId', '0')
+        signature = '|'.join(
+            ET.tostring(element, encoding='unicode') if element is not None else ''
+            for element in (xf, font, fill, border)
+        ) + '|' + (num_fmts.get(num_fmt_id) or num_fmt_id)
+        signatures.append(hashlib.sha1(signature.encode('utf-8')).hexdigest()[:12])
+    return flags, signatures
+
 def verify_format_preservation(file_path):
     """
     서식 보존 상태 검증
+
+    스타일 표(styles.xml)는 한 번만 읽어 인덱스별로 판별하고, 각 시트 XML은 한 번
+    스트리밍하여 값이 있는 셀의 스타일 인덱스 히스토그램만 만든다. 셀 수는
+    히스토그램과 인덱스별 판별 결과로 계산한다.
     """
     try:
-        workbook = load_workbook(file_path, data_only=False)
-        
         format_info = {
             'has_merged_cells': False,
             'has_borders': False,
@@ -95,57 +175,38 @@ def verify_format_preservation(file_path):
             'sheet_details': {}
         }
         
-        for sheet_name in workbook.sheetnames:
-            worksheet = workbook[sheet_name]
-            sheet_details = {
-                'name': sheet_name,
-                'merged_cells_count': len(worksheet.merged_cells.ranges),
-                'borders_count': 0,
-                'font_styles_count': 0,
-                'cell_colors_count': 0,
-                'alignment_count': 0,
-                'merged_ranges': [str(range_) for range_ in worksheet.merged_cells.ranges]
-            }
+        with XlsxPackage(file_path) as package:
+            style_flags, style_signatures = load_style_table(package)
+            format_info['style_signatures'] = style_signatures
+            default_flags = style_flags[0] if style_flags else (False,) * len(STYLE_FLAGS)
             
-            # 병합 셀 확인
-            if len(worksheet.merged_cells.ranges) > 0:
-                format_info['has_merged_cells'] = True
-            
-            # 각 셀의 서식 확인
-            for row in worksheet.iter_rows():
-                for cell in row:
-                    if cell.value is not None:  # 값이 있는 셀만 검사
-                        # 테두리 확인
-                        if cell.border and any([
-                            cell.border.left.style, cell.border.right.style,
-                            cell.border.top.style, cell.border.bottom.style
-                        ]):
-                            format_info['has_borders'] = True
-                            sheet_details['borders_count'] += 1
-                        
-                        # 폰트 스타일 확인
-                        if cell.font and (
-                            cell.font.bold or cell.font.italic or 
-                            cell.font.name != 'Calibri' or cell.font.size != 11 or
-                            cell.font.color.rgb != '00000000'
-                        ):
-                            format_info['has_font_styles'] = True
-                            sheet_details['font_styles_count'] += 1
-                        
-                        # 셀 색상 확인
-                        if cell.fill and cell.fill.fill_type != 'none':
-                            format_info['has_cell_colors'] = True
-                            sheet_details['cell_colors_count'] += 1
-                        
-                        # 정렬 확인
-                        if cell.alignment and (
-                            cell.alignment.horizontal != 'general' or
-                            cell.alignment.vertical != 'bottom'
-                        ):
-                            format_info['has_alignment'] = True
-                            sheet_details['alignment_count'] += 1
-            
-            format_info['sheet_details'][sheet_name] = sheet_details
+            for sheet_name in package.sheet_names:
+                merged_ranges = package.merged_ranges(sheet_name)
+                histogram = package.style_histogram(sheet_name)
+                sheet_details = {
+                    'name': sheet_name,
+                    'merged_cells_count': len(merged_ranges),
+                    'borders_count': 0,
+                    'font_styles_count': 0,
+                    'cell_colors_count': 0,
+                    'alignment_count': 0,
+                    'merged_ranges': merged_ranges,
+                    'style_histogram': {str(index): count for index, count in sorted(histogram.items())}
+                }
+                
+                # 병합 셀 확인
+                if merged_ranges:
+                    format_info['has_merged_cells'] = True
+                
+                # 스타일 인덱스별 판별 결과 × 셀 수
+                for style_index, count in histogram.items():
+                    flags = style_flags[style_index] if style_index < len(style_flags) else default_flags
+                    for flag, present in zip(STYLE_FLAGS, flags):
+                        if present:
+                            format_info[flag] = True
+                            sheet_details[STYLE_COUNT_KEYS[flag]] += count
+                
+                format_info['sheet_details'][sheet_name] = sheet_details
         
         print(f"🔍 서식 검증 결과:")
         print(f"  병합셀: {format_info['has_merged_cells']}")
@@ -168,15 +229,158 @@ def verify_format_preservation(file_path):
             'error': str(e)
         }
 
-def compare_formats(original_path, processed_path):
+def _signature_histogram(sheet_details, format_info):
+    """스타일 인덱스 히스토그램을 서식 서명 기준으로 변환 (두 파일의 인덱스 번호가 달라도 비교 가능)"""
+    signatures = format_info.get('style_signatures', [])
+    histogram = {}
+    for index, count in sheet_details.get('style_histogram', {}).items():
+        index = int(index)
+        key = signatures[index] if index < len(signatures) else index
+        histogram[key] = histogram.get(key, 0) + count
+    return histogram
+
+# 파트 비교 시 XML로 다시 읽는 파트
+XML_PART_SUFFIXES = ('.xml', '.rels', '.vml')
+# 파트 하나에서 보고할 최대 XML 차이 수
+MAX_XML_CHANGES = 20
+
+def _xml_changes(original_xml, processed_xml, limit=MAX_XML_CHANGES):
+    """
+    두 XML의 의미 차이 목록 (속성 순서, 네임스페이스 접두사, 태그 사이 공백은 무시)
+
+    같은 위치의 자식 요소를 태그 이름별로 맞춰 비교하며, 개수가 다른 태그는
+    개수 변화만 보고한다.
+    """
+    changes = []
+
+    def walk(original, processed, path):
+        if len(changes) >= limit:
+            return
+        if original.attrib != processed.attrib:
+            for name in sorted(set(original.attrib) | set(processed.attrib)):
+                if original.get(name) != processed.get(name):
+                    changes.append(f"{path}@{_local_name(name)}: {original.get(name)} → {processed.get(name)}")
+        if (original.text or '').strip() != (processed.text or '').strip():
+            changes.append(f"{path} 텍스트 변경")
+
+        original_children = {}
+        processed_children = {}
+        for child in original:
+            original_children.setdefault(_local_name(child.tag), []).append(child)
+        for child in processed:
+            processed_children.setdefault(_local_name(child.tag), []).append(child)
+
+        for tag in list(original_children) + [tag for tag in processed_children if tag not in original_children]:
+            original_list = original_children.get(tag, [])
+            processed_list = processed_children.get(tag, [])
+            if len(original_list) != len(processed_list):
+                changes.append(f"{path}/{tag}: {len(original_list)}개 → {len(processed_list)}개")
+                continue
+            for index, (original_child, processed_child) in enumerate(zip(original_list, processed_list)):
+                child_path = f"{path}/{tag}" if len(original_list) == 1 else f"{path}/{tag}[{index + 1}]"
+                walk(original_child, processed_child, child_path)
+
+    original_root = ET.fromstring(original_xml)
+    processed_root = ET.fromstring(processed_xml)
+    if _local_name(original_root.tag) != _local_name(processed_root.tag):
+        return [f"루트 요소 변경: {_local_name(original_root.tag)} → {_local_name(processed_root.tag)}"]
+    walk(original_root, processed_root, _local_name(original_root.tag))
+    return changes[:limit]
+
+def _rels_path(part):
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, '_rels', name + '.rels')
+
+def compare_packages(original_path, processed_path):
+    """
+    두 .xlsx 패키지를 파트(zip 멤버) 단위로 비교
+
+    zip 목록의 CRC와 크기만으로 같은 파트를 걸러내고, 내용이 다른 XML 파트만
+    다시 읽어 의미 차이를 구한다. 시트 파트는 파트 경로 대신 시트 이름으로 짝지어
+    (다시 저장하면서 sheetN.xml 번호가 바뀌어도) 비교한다.
+
+    Returns:
+        Dict: {"added_parts", "removed_parts", "modified_parts": {파트: {"sheet", "equivalent", "changes"}},
+               "unchanged_parts": 개수, "changed_sheets": [...], "styles_changed": bool}
+    """
+    with XlsxPackage(original_path) as original_package, XlsxPackage(processed_path) as processed_package:
+        original = original_package.archive
+        processed = processed_package.archive
+        original_infos = {info.filename: info for info in original.infolist()}
+        processed_infos = {info.filename: info for info in processed.infolist()}
+        original_sheets = {path: name for name, path in original_package.sheet_paths.items()}
+        processed_sheets = {path: name for name, path in processed_package.sheet_paths.items()}
+
+        # 시트 파트와 그 관계 파일은 시트 이름으로 짝지음 (처리 후 파트 경로 → 원본 파트 경로)
+        original_by_sheet = {name: path for path, name in original_sheets.items()}
+        counterparts = {}
+        for path, name in processed_sheets.items():
+            if name in original_by_sheet:
+                counterparts[path] = original_by_sheet[name]
+                processed_rels = _rels_path(path)
+                original_rels = _rels_path(original_by_sheet[name])
+                if processed_rels in processed_infos and original_rels in original_infos:
+                    counterparts[processed_rels] = original_rels
+        matched_originals = set(counterparts.values())
+        for path in processed_infos:
+            if path not in counterparts and path in original_infos and path not in matched_originals:
+                counterparts[path] = path
+
+        added_parts = sorted(path for path in processed_infos if path not in counterparts)
+        removed_parts = sorted(path for path in original_infos if path not in set(counterparts.values()))
+        modified_parts = {}
+        unchanged_parts = 0
+
+        for processed_part, original_part in sorted(counterparts.items()):
+            original_info = original_infos[original_part]
+            processed_info = processed_infos[processed_part]
+            if (original_info.CRC == processed_info.CRC and
+                    original_info.file_size == processed_info.file_size):
+                unchanged_parts += 1
+                continue
+
+            entry = {'sheet': processed_sheets.get(processed_part), 'equivalent': False, 'changes': []}
+            if original_part != processed_part:
+                entry['original_part'] = original_part
+            if processed_part.lower().endswith(XML_PART_SUFFIXES):
+                changes = _xml_changes(original.read(original_part), processed.read(processed_part))
+                entry['equivalent'] = not changes
+                entry['changes'] = changes
+            modified_parts[processed_part] = entry
+
+    changed_sheets = [entry['sheet'] for entry in modified_parts.values()
+                      if entry['sheet'] and not entry['equivalent']]
+    styles_entry = modified_parts.get('xl/styles.xml')
+    return {
+        'added_parts': added_parts,
+        'removed_parts': removed_parts,
+        'modified_parts': modified_parts,
+        'unchanged_parts': unchanged_parts,
+        'changed_sheets': changed_sheets,
+        'styles_changed': bool(styles_entry) and not styles_entry['equivalent']
+    }
+
+def compare_formats(original_path, processed_path, original_format=None, processed_format=None,
+                    diff_mode='styles'):
     """
     두 파일의 서식 비교
+
+    diff_mode='styles'(기본): 서식 요소 유무와 함께, 두 파일에 모두 있는 시트의 병합 범위와
+    스타일 히스토그램을 비교한다. 이미 검증한 결과를 original_format/processed_format으로
+    넘기면 다시 읽지 않는다.
+    diff_mode='parts': 셀을 읽지 않고 compare_packages로 바뀐 파트만 비교한다. 남은 시트
+    파트와 styles.xml에 의미 차이가 없으면 보존된 것으로 본다.
     """
+    if diff_mode == 'parts':
+        return _compare_parts(original_path, processed_path)
+    
     try:
         print(f"🔄 서식 비교 시작: {original_path} vs {processed_path}")
         
-        original_format = verify_format_preservation(original_path)
-        processed_format = verify_format_preservation(processed_path)
+        if original_format is None:
+            original_format = verify_format_preservation(original_path)
+        if processed_format is None:
+            processed_format = verify_format_preservation(processed_path)
         
         differences = []
         
@@ -187,6 +391,18 @@ def compare_formats(original_path, processed_path):
             if original_format.get(element, False) != processed_format.get(element, False):
                 differences.append(f"{element} 불일치")
         
+        # 남은 시트(갑지/을지 등)는 셀 서식 분포와 병합 범위가 원본과 같아야 함
+        original_sheets = original_format.get('sheet_details', {})
+        for sheet_name, processed_sheet in processed_format.get('sheet_details', {}).items():
+            original_sheet = original_sheets.get(sheet_name)
+            if original_sheet is None:
+                continue
+            if original_sheet.get('merged_ranges') != processed_sheet.get('merged_ranges'):
+                differences.append(f"{sheet_name} 병합셀 불일치")
+            if (_signature_histogram(original_sheet, original_format) !=
+                    _signature_histogram(processed_sheet, processed_format)):
+                differences.append(f"{sheet_name} 셀 서식 불일치")
+        
         format_preserved = len(differences) == 0
         
         result = {
@@ -214,6 +430,44 @@ def compare_formats(original_path, processed_path):
             'error': str(e)
         }
 
+def _compare_parts(original_path, processed_path):
+    """compare_formats의 파트 비교 모드"""
+    try:
+        print(f"🔄 파트 비교 시작: {original_path} vs {processed_path}")
+        
+        package_diff = compare_packages(original_path, processed_path)
+        
+        differences = [f"{sheet} 시트 변경" for sheet in package_diff['changed_sheets']]
+        if package_diff['styles_changed']:
+            differences.append("styles.xml 변경")
+        
+        format_preserved = len(differences) == 0
+        
+        result = {
+            'format_preserved': format_preserved,
+            'differences': differences,
+            'diff_mode': 'parts',
+            **package_diff
+        }
+        
+        print(f"📊 파트 비교 결과:")
+        print(f"  보존됨: {format_preserved}")
+        print(f"  추가 {len(package_diff['added_parts'])}개, 삭제 {len(package_diff['removed_parts'])}개, "
+              f"변경 {len(package_diff['modified_parts'])}개, 동일 {package_diff['unchanged_parts']}개")
+        if differences:
+            print(f"  상세: {', '.join(differences)}")
+        
+        return result
+        
+    except Exception as e:
+        print(f"❌ 파트 비교 실패: {str(e)}")
+        return {
+            'format_preserved': False,
+            'differences': ['비교 처리 실패'],
+            'diff_mode': 'parts',
+            'error': str(e)
+        }
+
 def main():
     """
     CLI 인터페이스
@@ -223,6 +477,8 @@ def main():
     parser.add_argument('target', help='결과 엑셀 파일 경로')
     parser.add_argument('--input-sheet', default='Input', help='제거할 시트명 (기본: Input)')
     parser.add_argument('--compare', action='store_true', help='처리 전후 서식 비교')
+    parser.add_argument('--diff-mode', choices=['styles', 'parts'], default='styles',
+                        help='비교 방식: 스타일 히스토그램(styles) 또는 패키지 파트 단위(parts)')
     parser.add_argument('--verify', action='store_true', help='결과 파일 서식 검증')
     parser.add_argument('--json', action='store_true', help='JSON 형태로 결과 출력')
     
@@ -231,12 +487,14 @@ def main():
     # 메인 처리
     result = remove_input_sheet_preserve_format(args.source, args.target, args.input_sheet)
     
-    # 추가 검증
+    # 추가 검증 (결과 파일 검증은 처리 단계에서 이미 수행했으므로 재사용)
     if args.verify and result['success']:
-        result['verification'] = verify_format_preservation(args.target)
+        result['verification'] = result['format_verification']
     
     if args.compare and result['success']:
-        result['comparison'] = compare_formats(args.source, args.target)
+        result['comparison'] = compare_formats(args.source, args.target,
+                                               processed_format=result['format_verification'],
+                                               diff_mode=args.diff_mode)
     
     # 결과 출력
     if args.json:
@@ -1,11 +1,11 @@
 /**
  * 최소한의 처리로 Input 시트만 삭제하는 모듈
- * 원본 파일을 복사한 후 Input 시트만 삭제하여 서식 완전 보존
+ * zip 수준에서 Input 시트만 삭제하여 서식 완전 보존 (binary 방식은 minimal의 별칭)
+ *
+ * 요청마다 python3를 띄우지 않고 상주 워커 풀(python-worker-pool)의 remove-sheet 명령을 사용한다.
  */
 
-import { spawn } from 'child_process';
-import fs from 'fs';
-import path from 'path';
+import { runPythonCommand } from '../python-worker-pool';
 
 export interface MinimalProcessingResult {
   success: boolean;
@@ -17,6 +17,57 @@ export interface MinimalProcessingResult {
   method: string;
 }
 
+/**
+ * 워커의 remove-sheet 명령 실행 후 결과 변환
+ */
+async function runRemoveSheet(
+  workerMethod: 'minimal' | 'binary',
+  resultMethod: string,
+  logPrefix: string,
+  sourcePath: string,
+  targetPath: string,
+  inputSheetName: string
+): Promise<MinimalProcessingResult> {
+  const failure = (error: string): MinimalProcessingResult => ({
+    success: false,
+    removedSheet: false,
+    remainingSheets: [],
+    originalFormat: false,
+    method: resultMethod,
+    error
+  });
+
+  try {
+    const response = await runPythonCommand('remove-sheet', {
+      source: sourcePath,
+      target: targetPath,
+      sheet: inputSheetName,
+      method: workerMethod
+    });
+    console.log(`${logPrefix} 처리 시간: ${response.elapsedMs}ms`);
+
+    if (!response.success || !response.result) {
+      console.error(`❌ ${resultMethod} 처리 실패:`, response.error);
+      return failure(`워커 처리 실패: ${response.error}`);
+    }
+
+    const result = response.result;
+    console.log(`✅ ${resultMethod} 처리 성공:`, result);
+    return {
+      success: result.success,
+      removedSheet: result.removed_sheet,
+      remainingSheets: result.remaining_sheets,
+      originalFormat: result.original_format,
+      processedFilePath: targetPath,
+      method: resultMethod,
+      error: result.error
+    };
+  } catch (error) {
+    console.error(`❌ ${resultMethod} 워커 호출 실패:`, error);
+    return failure(`워커 에러: ${error instanceof Error ? error.message : 'Unknown error'}`);
+  }
+}
+
 /**
  * 최소한의 처리로 Input 시트만 제거
  */
@@ -25,102 +76,8 @@ export async function removeInputSheetMinimal(
   targetPath: string,
   inputSheetName: string = 'Input'
 ): Promise<MinimalProcessingResult> {
-  return new Promise((resolve) => {
-    try {
-      console.log(`📋 최소한의 처리 시작: ${sourcePath} -> ${targetPath}`);
-      
-      const scriptPath = path.join(__dirname, 'excel-minimal-processing.py');
-      const pythonProcess = spawn('python3', [scriptPath, 'minimal', sourcePath, targetPath, inputSheetName], {
-        stdio: ['pipe', 'pipe', 'pipe']
-      });
-      
-      let stdout = '';
-      let stderr = '';
-      
-      pythonProcess.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-      
-      pythonProcess.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
-      
-      pythonProcess.on('close', (code) => {
-        console.log(`📋 최소한의 처리 종료 코드: ${code}`);
-        
-        if (stderr) {
-          console.log(`📋 최소한의 처리 로그:\n${stderr}`);
-        }
-        
-        if (code === 0) {
-          try {
-            const result = JSON.parse(stdout);
-            console.log(`✅ 최소한의 처리 성공:`, result);
-            
-            resolve({
-              success: result.success,
-              removedSheet: result.removed_sheet,
-              remainingSheets: result.remaining_sheets,
-              originalFormat: result.original_format,
-              processedFilePath: targetPath,
-              method: 'minimal_processing',
-              error: result.error
-            });
-          } catch (parseError) {
-            console.error(`❌ 최소한의 처리 출력 파싱 실패:`, parseError);
-            console.log(`stdout:`, stdout);
-            
-            resolve({
-              success: false,
-              removedSheet: false,
-              remainingSheets: [],
-              originalFormat: false,
-              method: 'minimal_processing',
-              error: `출력 파싱 실패: ${parseError}`
-            });
-          }
-        } else {
-          console.error(`❌ 최소한의 처리 실패 (코드: ${code})`);
-          console.log(`stdout:`, stdout);
-          console.log(`stderr:`, stderr);
-          
-          resolve({
-            success: false,
-            removedSheet: false,
-            remainingSheets: [],
-            originalFormat: false,
-            method: 'minimal_processing',
-            error: `프로세스 실패 (코드: ${code}): ${stderr}`
-          });
-        }
-      });
-      
-      pythonProcess.on('error', (error) => {
-        console.error(`❌ 최소한의 처리 프로세스 에러:`, error);
-        
-        resolve({
-          success: false,
-          removedSheet: false,
-          remainingSheets: [],
-          originalFormat: false,
-          method: 'minimal_processing',
-          error: `프로세스 에러: ${error.message}`
-        });
-      });
-      
-    } catch (error) {
-      console.error(`❌ 최소한의 처리 호출 실패:`, error);
-      
-      resolve({
-        success: false,
-        removedSheet: false,
-        remainingSheets: [],
-        originalFormat: false,
-        method: 'minimal_processing',
-        error: error instanceof Error ? error.message : 'Unknown error'
-      });
-    }
-  });
+  console.log(`📋 최소한의 처리 시작: ${sourcePath} -> ${targetPath}`);
+  return runRemoveSheet('minimal', 'minimal_processing', '📋', sourcePath, targetPath, inputSheetName);
 }
 
 /**
@@ -131,100 +88,6 @@ export async function removeInputSheetBinaryCopy(
   targetPath: string,
   inputSheetName: string = 'Input'
 ): Promise<MinimalProcessingResult> {
-  return new Promise((resolve) => {
-    try {
-      console.log(`🔧 바이너리 복사 후 처리 시작: ${sourcePath} -> ${targetPath}`);
-      
-      const scriptPath = path.join(__dirname, 'excel-minimal-processing.py');
-      const pythonProcess = spawn('python3', [scriptPath, 'binary', sourcePath, targetPath, inputSheetName], {
-        stdio: ['pipe', 'pipe', 'pipe']
-      });
-      
-      let stdout = '';
-      let stderr = '';
-      
-      pythonProcess.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-      
-      pythonProcess.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
-      
-      pythonProcess.on('close', (code) => {
-        console.log(`🔧 바이너리 복사 후 처리 종료 코드: ${code}`);
-        
-        if (stderr) {
-          console.log(`🔧 바이너리 복사 후 처리 로그:\n${stderr}`);
-        }
-        
-        if (code === 0) {
-          try {
-            const result = JSON.parse(stdout);
-            console.log(`✅ 바이너리 복사 후 처리 성공:`, result);
-            
-            resolve({
-              success: result.success,
-              removedSheet: result.removed_sheet,
-              remainingSheets: result.remaining_sheets,
-              originalFormat: result.original_format,
-              processedFilePath: targetPath,
-              method: 'binary_copy',
-              error: result.error
-            });
-          } catch (parseError) {
-            console.error(`❌ 바이너리 복사 후 처리 출력 파싱 실패:`, parseError);
-            console.log(`stdout:`, stdout);
-            
-            resolve({
-              success: false,
-              removedSheet: false,
-              remainingSheets: [],
-              originalFormat: false,
-              method: 'binary_copy',
-              error: `출력 파싱 실패: ${parseError}`
-            });
-          }
-        } else {
-          console.error(`❌ 바이너리 복사 후 처리 실패 (코드: ${code})`);
-          console.log(`stdout:`, stdout);
-          console.log(`stderr:`, stderr);
-          
-          resolve({
-            success: false,
-            removedSheet: false,
-            remainingSheets: [],
-            originalFormat: false,
-            method: 'binary_copy',
-            error: `프로세스 실패 (코드: ${code}): ${stderr}`
-          });
-        }
-      });
-      
-      pythonProcess.on('error', (error) => {
-        console.error(`❌ 바이너리 복사 후 처리 프로세스 에러:`, error);
-        
-        resolve({
-          success: false,
-          removedSheet: false,
-          remainingSheets: [],
-          originalFormat: false,
-          method: 'binary_copy',
-          error: `프로세스 에러: ${error.message}`
-        });
-      });
-      
-    } catch (error) {
-      console.error(`❌ 바이너리 복사 후 처리 호출 실패:`, error);
-      
-      resolve({
-        success: false,
-        removedSheet: false,
-        remainingSheets: [],
-        originalFormat: false,
-        method: 'binary_copy',
-        error: error instanceof Error ? error.message : 'Unknown error'
-      });
-    }
-  });
-}
\ No newline at end of file
+  console.log(`🔧 바이너리 복사 후 처리 시작: ${sourcePath} -> ${targetPath}`);
+  return runRemoveSheet('binary', 'binary_copy', '🔧', sourcePath, targetPath, inputSheetName);
+}
@@ -1,14 +1,14 @@
 /**
- * Python openpyxl 스크립트를 호출하여 완벽한 서식 보존 처리
+ * Python 엑셀 처리로 완벽한 서식 보존 처리
  * ExcelJS보다 더 강력한 서식 보존 능력 제공
+ *
+ * 요청마다 python3를 띄우지 않고 상주 워커 풀(python-worker-pool)의 명령을 사용한다.
+ * - 시트 제거: remove-sheet (excel_format_preserving.py와 같은 zip 수준 remove_sheet_from_xlsx)
+ * - 서식 검증/비교: verify (excel_format_preserving.verify_format_preservation / compare_formats)
  */
 
-import { spawn, exec } from 'child_process';
-import { promisify } from 'util';
 import fs from 'fs';
-import path from 'path';
-
-const execAsync = promisify(exec);
+import { PythonWorkerCommand, runPythonCommand } from '../python-worker-pool';
 
 export interface PythonExcelResult {
   success: boolean;
@@ -22,51 +22,35 @@ export interface PythonExcelResult {
 }
 
 export class PythonExcelProcessor {
-  
-  private static readonly PYTHON_SCRIPT_PATH = path.join(__dirname, '../../scripts/excel_format_preserving.py');
 
   /**
-   * Python 환경 확인 및 openpyxl 설치 상태 검증
+   * Python 워커 기동 및 openpyxl 설치 상태 검증
    */
   static async checkPythonEnvironment(): Promise<{ available: boolean; error?: string; details?: any }> {
     try {
-      // Python 버전 확인
-      const { stdout: pythonVersion } = await execAsync('python3 --version');
-      console.log(`🐍 Python 버전: ${pythonVersion.trim()}`);
-
-      // openpyxl 모듈 확인
-      const { stdout: openpyxlCheck } = await execAsync('python3 -c "import openpyxl; print(openpyxl.__version__)"');
-      console.log(`📦 openpyxl 버전: ${openpyxlCheck.trim()}`);
+      const result = await PythonExcelProcessor.runWorkerCommand('ping');
+      console.log(`🐍 Python 버전: ${result.python}`);
+      console.log(`📦 openpyxl 설치 여부: ${result.openpyxl}`);
 
       return {
         available: true,
         details: {
-          pythonVersion: pythonVersion.trim(),
-          openpyxlVersion: openpyxlCheck.trim()
+          pythonVersion: result.python,
+          openpyxlAvailable: result.openpyxl
         }
       };
 
     } catch (error) {
       console.log(`⚠️ Python 환경 확인 실패: ${error}`);
-      
-      // openpyxl 자동 설치 시도
-      try {
-        console.log(`📦 openpyxl 설치 시도 중...`);
-        await execAsync('python3 -m pip install openpyxl');
-        console.log(`✅ openpyxl 설치 완료`);
-        
-        return await PythonExcelProcessor.checkPythonEnvironment();
-      } catch (installError) {
-        return {
-          available: false,
-          error: `Python 또는 openpyxl을 사용할 수 없습니다: ${installError}`
-        };
-      }
+      return {
+        available: false,
+        error: `Python 워커를 사용할 수 없습니다: ${error instanceof Error ? error.message : error}`
+      };
     }
   }
 
   /**
-   * Python 스크립트를 사용하여 Input 시트 제거 및 서식 보존
+   * 워커 풀로 Input 시트 제거 및 서식 보존
    */
   static async removeInputSheetWithPython(
     sourcePath: string,
@@ -78,42 +62,31 @@ export class PythonExcelProcessor {
     } = {}
   ): Promise<PythonExcelResult> {
     try {
-      console.log(`🐍 Python openpyxl 처리 시작: ${sourcePath} -> ${targetPath}`);
-
-      // Python 환경 확인
-      const envCheck = await PythonExcelProcessor.checkPythonEnvironment();
-      if (!envCheck.available) {
-        throw new Error(envCheck.error || 'Python 환경을 사용할 수 없습니다');
-      }
+      console.log(`🐍 Python 워커 처리 시작: ${sourcePath} -> ${targetPath}`);
 
       // 소스 파일 존재 확인
       if (!fs.existsSync(sourcePath)) {
         throw new Error(`소스 파일을 찾을 수 없습니다: ${sourcePath}`);
       }
 
-      // Python 스크립트 존재 확인
-      if (!fs.existsSync(PythonExcelProcessor.PYTHON_SCRIPT_PATH)) {
-        throw new Error(`Python 스크립트를 찾을 수 없습니다: ${PythonExcelProcessor.PYTHON_SCRIPT_PATH}`);
-      }
-
-      // Python 스크립트 실행
-      const args = [
-        PythonExcelProcessor.PYTHON_SCRIPT_PATH,
-        sourcePath,
-        targetPath,
-        '--input-sheet', inputSheetName,
-        '--json'
-      ];
-
-      if (options.verify) args.push('--verify');
-      if (options.compare) args.push('--compare');
-
-      const result = await PythonExcelProcessor.executePythonScript(args);
+      const result = await PythonExcelProcessor.runWorkerCommand('remove-sheet', {
+        source: sourcePath,
+        target: targetPath,
+        sheet: inputSheetName,
+        method: 'minimal'
+      });
 
       if (!result.success) {
-        throw new Error(result.error || 'Python 스크립트 실행 실패');
+        throw new Error(result.error || 'Python 시트 제거 실패');
       }
 
+      const formatVerification = options.verify
+        ? await PythonExcelProcessor.runWorkerCommand('verify', { file: targetPath })
+        : undefined;
+      const comparison = options.compare
+        ? await PythonExcelProcessor.runWorkerCommand('verify', { original: sourcePath, processed: targetPath })
+        : undefined;
+
       console.log(`✅ Python 처리 완료: ${result.remaining_sheets?.length || 0}개 시트 보존`);
 
       return {
@@ -122,8 +95,8 @@ export class PythonExcelProcessor {
         remainingSheets: result.remaining_sheets || [],
         originalFormat: result.original_format || false,
         processedFilePath: targetPath,
-        formatVerification: result.verification,
-        comparison: result.comparison
+        formatVerification,
+        comparison
       };
 
     } catch (error) {
@@ -139,51 +112,16 @@ export class PythonExcelProcessor {
   }
 
   /**
-   * Python 스크립트 실행 헬퍼
+   * 워커 명령 실행 헬퍼 (실패 응답은 예외로 변환)
    */
-  private static async executePythonScript(args: string[]): Promise<any> {
-    return new Promise((resolve, reject) => {
-      const pythonProcess = spawn('python3', args);
-      
-      let stdout = '';
-      let stderr = '';
-
-      pythonProcess.stdout.on('data', (data) => {
-        stdout += data.toString();
-      });
-
-      pythonProcess.stderr.on('data', (data) => {
-        stderr += data.toString();
-      });
+  private static async runWorkerCommand(command: PythonWorkerCommand, args: Record<string, unknown> = {}): Promise<any> {
+    const response = await runPythonCommand(command, args);
+    console.log(`🐍 Python 워커 ${command} 처리 시간: ${response.elapsedMs}ms`);
 
-      pythonProcess.on('close', (code) => {
-        console.log(`🐍 Python 스크립트 종료 코드: ${code}`);
-        
-        if (code === 0) {
-          try {
-            // JSON 출력 파싱
-            const lines = stdout.trim().split('\n');
-            const jsonLine = lines.find(line => line.startsWith('{'));
-            
-            if (jsonLine) {
-              const result = JSON.parse(jsonLine);
-              resolve(result);
-            } else {
-              resolve({ success: true, output: stdout });
-            }
-          } catch (parseError) {
-            console.log(`📄 Python 출력 (비JSON):`, stdout);
-            resolve({ success: true, output: stdout });
-          }
-        } else {
-          reject(new Error(`Python 스크립트 실행 실패 (코드 ${code}): ${stderr || stdout}`));
-        }
-      });
-
-      pythonProcess.on('error', (error) => {
-        reject(new Error(`Python 프로세스 오류: ${error.message}`));
-      });
-    });
+    if (!response.success) {
+      throw new Error(`Python 워커 ${command} 실패: ${response.error}`);
+    }
+    return response.result;
   }
 
   /**
@@ -199,17 +137,12 @@ export class PythonExcelProcessor {
     processedFormat: any;
   }> {
     try {
-      const args = [
-        PythonExcelProcessor.PYTHON_SCRIPT_PATH,
-        originalPath,
-        processedPath,
-        '--compare',
-        '--json'
-      ];
-
-      const result = await PythonExcelProcessor.executePythonScript(args);
+      const comparison = await PythonExcelProcessor.runWorkerCommand('verify', {
+        original: originalPath,
+        processed: processedPath
+      });
       
-      return result.comparison || {
+      return comparison || {
         formatPreserved: false,
         differences: ['비교 실패'],
         originalFormat: {},
@@ -1,22 +1,31 @@
 #!/usr/bin/env python3
 """
 최소한의 처리로 Input 시트만 삭제하는 스크립트
-원본 파일을 복사한 후 Input 시트만 삭제하여 서식 완전 보존
+워크북을 로드하거나 원본을 복사하지 않고, zip 수준에서 Input 시트 파트와 목록 항목만 빼고
+나머지 파트는 원본 바이트 그대로 새 파일에 써서 서식 완전 보존 (xlsx_sheet_remover)
+
+minimal과 binary는 같은 처리이며, binary는 기존 호출을 위한 별칭이다 (결과 method만 다름).
 """
 
 import sys
 import os
 import json
-import shutil
-from openpyxl import load_workbook
-from openpyxl.utils.exceptions import InvalidFileException
+import time
+import zipfile
+import argparse
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")))
+
+from xlsx_sheet_remover import remove_sheet_from_xlsx
 
 def remove_input_sheet_minimal(source_path, target_path, input_sheet_name='Input'):
     """
     최소한의 처리로 Input 시트만 삭제
-    1. 원본 파일을 타겟 경로로 복사
-    2. 복사된 파일에서 Input 시트만 삭제
-    3. 저장 (다른 시트들은 전혀 건드리지 않음)
+    워크북을 로드하지 않고 zip 수준에서 Input 시트 파트와 목록 항목만 제거하며,
+    다른 시트 파트는 원본 바이트 그대로 복사 (xlsx_sheet_remover)
+    원본은 한 번만 읽고 결과는 임시 파일 + rename으로 게시하므로 실패해도 타겟에
+    쓰다 만 파일이 남지 않는다
     """
     result = {
         'success': False,
@@ -34,44 +43,17 @@ def remove_input_sheet_minimal(source_path, target_path, input_sheet_name='Input
         if not os.path.exists(source_path):
             raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {source_path}")
         
-        # 1단계: 원본 파일을 타겟 경로로 완전 복사
-        shutil.copy2(source_path, target_path)
-        print(f"✅ 원본 파일 완전 복사 완료", file=sys.stderr)
+        # zip 수준에서 Input 시트만 삭제하여 타겟 경로에 저장
+        removal = remove_sheet_from_xlsx(source_path, target_path, input_sheet_name)
+        removed_sheet = removal['removed_sheet']
+        remaining_sheets = removal['remaining_sheets']
         
-        # 2단계: 복사된 파일에서 Input 시트만 삭제
-        workbook = load_workbook(
-            target_path,
-            read_only=False,
-            keep_vba=True,
-            keep_links=True,
-            data_only=False
-        )
-        
-        # 원본 시트 목록
-        original_sheets = workbook.sheetnames.copy()
-        print(f"📋 원본 시트 목록: {', '.join(original_sheets)}", file=sys.stderr)
-        
-        # Input 시트 찾기 및 삭제
-        removed_sheet = False
-        if input_sheet_name in workbook.sheetnames:
-            # Input 시트만 삭제 (다른 시트는 전혀 건드리지 않음)
-            workbook.remove(workbook[input_sheet_name])
-            removed_sheet = True
+        if removed_sheet:
             print(f"🗑️ '{input_sheet_name}' 시트만 삭제됨", file=sys.stderr)
         else:
             print(f"⚠️ '{input_sheet_name}' 시트를 찾을 수 없습니다.", file=sys.stderr)
-        
-        # 남은 시트 목록
-        remaining_sheets = workbook.sheetnames.copy()
         print(f"📋 남은 시트 목록: {', '.join(remaining_sheets)}", file=sys.stderr)
         
-        if len(remaining_sheets) == 0:
-            raise ValueError("모든 시트가 제거되어 빈 엑셀 파일이 됩니다.")
-        
-        # 3단계: 최소한의 저장 (원본 서식 유지)
-        workbook.save(target_path)
-        workbook.close()
-        
         print(f"✅ 최소한의 처리 완료 (원본 서식 완전 보존)", file=sys.stderr)
         
         result.update({
@@ -81,7 +63,7 @@ def remove_input_sheet_minimal(source_path, target_path, input_sheet_name='Input
             'original_format': True
         })
         
-    except InvalidFileException as e:
+    except zipfile.BadZipFile as e:
         error_msg = f"올바른 엑셀 파일이 아닙니다: {str(e)}"
         print(f"❌ {error_msg}", file=sys.stderr)
         result.update({
@@ -104,98 +86,131 @@ def remove_input_sheet_minimal(source_path, target_path, input_sheet_name='Input
             'success': False,
             'error': error_msg
         })
-        
-        # 실패 시 타겟 파일 삭제
-        if os.path.exists(target_path):
-            os.remove(target_path)
-            print(f"🗑️ 실패한 타겟 파일 삭제: {target_path}", file=sys.stderr)
     
     return result
 
 def copy_file_and_remove_sheet_binary(source_path, target_path, input_sheet_name='Input'):
     """
-    바이너리 레벨에서 파일 복사 후 Input 시트만 제거
+    remove_input_sheet_minimal의 별칭 (binary 명령/기존 호출 호환)
+    두 방식 모두 zip 수준 시트 제거로 같아졌으므로 결과의 method만 'binary_copy'로 표시
     """
-    result = {
-        'success': False,
-        'removed_sheet': False,
-        'remaining_sheets': [],
-        'original_format': True,
-        'error': None,
-        'method': 'binary_copy'
-    }
-    
-    try:
-        print(f"🔧 바이너리 복사 후 처리 시작: {source_path} -> {target_path}", file=sys.stderr)
-        
-        # 소스 파일 존재 확인
-        if not os.path.exists(source_path):
-            raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {source_path}")
-        
-        # 1단계: 바이너리 레벨에서 완전 복사
-        with open(source_path, 'rb') as src_file:
-            with open(target_path, 'wb') as dst_file:
-                shutil.copyfileobj(src_file, dst_file)
-        
-        print(f"✅ 바이너리 복사 완료", file=sys.stderr)
-        
-        # 2단계: 복사된 파일에서 Input 시트만 삭제
-        workbook = load_workbook(
-            target_path,
-            read_only=False,
-            keep_vba=True,
-            keep_links=True,
-            data_only=False
-        )
-        
-        # 원본 시트 목록
-        original_sheets = workbook.sheetnames.copy()
-        print(f"📋 시트 목록: {', '.join(original_sheets)}", file=sys.stderr)
-        
-        # Input 시트 찾기 및 삭제
-        removed_sheet = False
-        if input_sheet_name in workbook.sheetnames:
-            workbook.remove(workbook[input_sheet_name])
-            removed_sheet = True
-            print(f"🗑️ '{input_sheet_name}' 시트만 삭제됨", file=sys.stderr)
-        else:
-            print(f"⚠️ '{input_sheet_name}' 시트를 찾을 수 없습니다.", file=sys.stderr)
-        
-        # 남은 시트 목록
-        remaining_sheets = workbook.sheetnames.copy()
-        print(f"📋 남은 시트 목록: {', '.join(remaining_sheets)}", file=sys.stderr)
-        
-        if len(remaining_sheets) == 0:
-            raise ValueError("모든 시트가 제거되어 빈 엑셀 파일이 됩니다.")
-        
-        # 3단계: 저장
-        workbook.save(target_path)
-        workbook.close()
-        
-        print(f"✅ 바이너리 복사 후 처리 완료", file=sys.stderr)
-        
-        result.update({
-            'success': True,
-            'removed_sheet': removed_sheet,
-            'remaining_sheets': remaining_sheets,
-            'original_format': True
-        })
-        
-    except Exception as e:
-        error_msg = f"바이너리 복사 후 처리 실패: {str(e)}"
-        print(f"❌ {error_msg}", file=sys.stderr)
-        result.update({
-            'success': False,
-            'error': error_msg
-        })
-        
-        # 실패 시 타겟 파일 삭제
-        if os.path.exists(target_path):
-            os.remove(target_path)
-            print(f"🗑️ 실패한 타겟 파일 삭제: {target_path}", file=sys.stderr)
-    
+    result = remove_input_sheet_minimal(source_path, target_path, input_sheet_name)
+    result['method'] = 'binary_copy'
     return result
 
+BATCH_METHODS = {
+    'minimal': remove_input_sheet_minimal,
+    'binary': copy_file_and_remove_sheet_binary
+}
+
+def iter_manifest(lines):
+    """
+    매니페스트(JSON Lines)의 작업 항목을 (줄 번호, 항목 또는 오류 메시지)로 yield
+    빈 줄은 건너뛴다
+    """
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+            if not isinstance(entry, dict) or not entry.get('source') or not entry.get('target'):
+                raise ValueError("source와 target이 필요합니다")
+            yield line_number, entry
+        except ValueError as e:
+            yield line_number, f"잘못된 매니페스트 항목: {str(e)}"
+
+def _run_batch_entry(line_number, entry, default_method):
+    """매니페스트 항목 하나 처리 (결과에 줄 번호, 경로, 소요 시간 추가)"""
+    started = time.perf_counter()
+    method = entry.get('method', default_method)
+    remove = BATCH_METHODS.get(method)
+    if remove is None:
+        result = {'success': False, 'error': f"지원하지 않는 처리 방식입니다: {method}"}
+    else:
+        result = remove(entry['source'], entry['target'], entry.get('sheet', 'Input'))
+    result.update({
+        'line': line_number,
+        'source': entry['source'],
+        'target': entry['target'],
+        'elapsedMs': round((time.perf_counter() - started) * 1000, 1)
+    })
+    return result
+
+def iter_batch_results(lines, max_workers=None, default_method='minimal'):
+    """
+    매니페스트 항목들을 스레드 풀에서 처리하고 끝나는 순서대로 결과를 yield
+
+    시트 제거는 파일 읽기/쓰기가 대부분이라 스레드로 충분하며, 동시에 진행 중인 작업은
+    워커 수의 두 배로 제한하므로 매니페스트가 커도 메모리 사용량이 일정하다.
+
+    Args:
+        lines: 매니페스트 줄 (파일 객체 등)
+        max_workers: 동시 처리 수 (기본: CPU 코어 수 x 2, 최대 16)
+        default_method: 항목에 method가 없을 때 사용할 처리 방식
+    """
+    workers = max_workers or min(16, (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for line_number, entry in iter_manifest(lines):
+            if isinstance(entry, str):
+                yield {'success': False, 'line': line_number, 'error': entry}
+                continue
+            pending.add(executor.submit(_run_batch_entry, line_number, entry, default_method))
+            if len(pending) >= workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+def run_batch(argv):
+    """
+    batch 명령: 매니페스트의 시트 제거를 병렬 실행하고 결과를 JSON Lines로 출력
+    마지막 줄은 {"summary": {...}} (처리량 포함)
+    """
+    parser = argparse.ArgumentParser(prog='excel-minimal-processing.py batch',
+                                     description='매니페스트(JSON Lines)의 Input 시트 제거 일괄 처리')
+    parser.add_argument('manifest', help='매니페스트 파일 경로 ("-"이면 stdin). 한 줄에 '
+                        '{"source": ..., "target": ..., "sheet": "Input", "method": "minimal"}')
+    parser.add_argument('--workers', type=int, default=None, help='동시 처리 수 (기본: CPU 코어 수 x 2, 최대 16)')
+    parser.add_argument('--method', choices=sorted(BATCH_METHODS), default='minimal',
+                        help='항목에 method가 없을 때의 처리 방식')
+    args = parser.parse_args(argv)
+
+    manifest = sys.stdin if args.manifest == '-' else open(args.manifest, encoding='utf-8')
+    started = time.perf_counter()
+    succeeded = failed = 0
+    bytes_written = 0
+    try:
+        for result in iter_batch_results(manifest, max_workers=args.workers, default_method=args.method):
+            if result['success']:
+                succeeded += 1
+                bytes_written += os.path.getsize(result['target'])
+            else:
+                failed += 1
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+    finally:
+        if manifest is not sys.stdin:
+            manifest.close()
+
+    elapsed = time.perf_counter() - started
+    total = succeeded + failed
+    summary = {
+        'totalFiles': total,
+        'succeeded': succeeded,
+        'failed': failed,
+        'bytesWritten': bytes_written,
+        'elapsedSeconds': round(elapsed, 3),
+        'filesPerSecond': round(total / elapsed, 2) if elapsed > 0 else None,
+        'megabytesPerSecond': round(bytes_written / elapsed / 1024 / 1024, 2) if elapsed > 0 else None
+    }
+    print(json.dumps({'summary': summary}, ensure_ascii=False), flush=True)
+    print(f"✅ 일괄 처리 완료: 성공 {succeeded} / 실패 {failed}", file=sys.stderr)
+    return 0 if failed == 0 else 1
+
 def main():
     """
     메인 함수 - 커맨드라인 인자 처리
@@ -203,40 +218,23 @@ def main():
     if len(sys.argv) < 2:
         print("사용법: python excel-minimal-processing.py <command> [args...]", file=sys.stderr)
         print("  minimal <source> <target> [sheet_name]: 최소한의 처리로 Input 시트 제거", file=sys.stderr)
-        print("  binary <source> <target> [sheet_name]: 바이너리 복사 후 Input 시트 제거", file=sys.stderr)
+        print("  binary <source> <target> [sheet_name]: minimal의 별칭", file=sys.stderr)
+        print("  batch <manifest.jsonl|-> [--workers N] [--method minimal|binary]: 매니페스트 일괄 처리", file=sys.stderr)
         sys.exit(1)
     
     command = sys.argv[1]
     
-    if command == 'minimal':
+    if command in ('minimal', 'binary'):
         if len(sys.argv) != 5:
-            print("사용법: python excel-minimal-processing.py minimal <source_path> <target_path> <input_sheet_name>", file=sys.stderr)
+            print(f"사용법: python excel-minimal-processing.py {command} <source_path> <target_path> <input_sheet_name>", file=sys.stderr)
             sys.exit(1)
         
         source_path = sys.argv[2]
         target_path = sys.argv[3]
         input_sheet_name = sys.argv[4]
         
-        # 최소한의 처리 실행
-        result = remove_input_sheet_minimal(source_path, target_path, input_sheet_name)
-        
-        # 결과를 JSON으로 출력
-        print(json.dumps(result, ensure_ascii=False, indent=2))
-        
-        # 성공/실패에 따른 exit code
-        sys.exit(0 if result['success'] else 1)
-        
-    elif command == 'binary':
-        if len(sys.argv) != 5:
-            print("사용법: python excel-minimal-processing.py binary <source_path> <target_path> <input_sheet_name>", file=sys.stderr)
-            sys.exit(1)
-        
-        source_path = sys.argv[2]
-        target_path = sys.argv[3]
-        input_sheet_name = sys.argv[4]
-        
-        # 바이너리 복사 후 처리 실행
-        result = copy_file_and_remove_sheet_binary(source_path, target_path, input_sheet_name)
+        # 최소한의 처리 실행 (binary는 별칭)
+        result = BATCH_METHODS[command](source_path, target_path, input_sheet_name)
         
         # 결과를 JSON으로 출력
         print(json.dumps(result, ensure_ascii=False, indent=2))
@@ -244,6 +242,9 @@ def main():
         # 성공/실패에 따른 exit code
         sys.exit(0 if result['success'] else 1)
     
+    elif command == 'batch':
+        sys.exit(run_batch(sys.argv[2:]))
+    
     else:
         print(f"알 수 없는 명령: {command}", file=sys.stderr)
         sys.exit(1)
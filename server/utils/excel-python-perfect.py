@@ -7,13 +7,17 @@ Python openpyxl을 사용한 완벽한 엑셀 서식 보존 처리
 import sys
 import os
 import json
-import shutil
-from openpyxl import load_workbook
-from openpyxl.utils.exceptions import InvalidFileException
+import zipfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")))
+
+from xlsx_sheet_remover import remove_sheet_from_xlsx
 
 def remove_input_sheet_perfect(source_path, target_path, input_sheet_name='Input'):
     """
-    openpyxl을 사용하여 Input 시트만 제거하고 모든 서식 보존
+    Input 시트만 제거하고 모든 서식 보존
+    워크북을 로드/재저장하지 않고 zip 수준에서 시트를 제거하므로 openpyxl이
+    다루지 않는 요소까지 원본 그대로 유지된다 (xlsx_sheet_remover)
     """
     result = {
         'success': False,
@@ -24,53 +28,24 @@ def remove_input_sheet_perfect(source_path, target_path, input_sheet_name='Input
     }
     
     try:
-        print(f"🐍 Python openpyxl 처리 시작: {source_path} -> {target_path}", file=sys.stderr)
+        print(f"🐍 Python 처리 시작: {source_path} -> {target_path}", file=sys.stderr)
         
         # 소스 파일 존재 확인
         if not os.path.exists(source_path):
             raise FileNotFoundError(f"소스 파일을 찾을 수 없습니다: {source_path}")
         
-        # 1단계: 원본 파일을 타겟 경로로 복사
-        shutil.copy2(source_path, target_path)
-        print(f"✅ 원본 파일 복사 완료", file=sys.stderr)
-        
-        # 2단계: 복사된 파일을 openpyxl로 로드
-        # keep_vba=True, keep_links=True로 모든 정보 보존
-        workbook = load_workbook(
-            target_path,
-            read_only=False,
-            keep_vba=True,
-            keep_links=True,
-            data_only=False
-        )
-        
-        # 원본 시트 목록
-        original_sheets = workbook.sheetnames.copy()
-        print(f"📋 원본 시트 목록: {', '.join(original_sheets)}", file=sys.stderr)
+        # zip 수준에서 Input 시트만 제거하여 타겟 경로에 저장
+        removal = remove_sheet_from_xlsx(source_path, target_path, input_sheet_name)
+        removed_sheet = removal['removed_sheet']
+        remaining_sheets = removal['remaining_sheets']
         
-        # Input 시트 찾기 및 제거
-        removed_sheet = False
-        if input_sheet_name in workbook.sheetnames:
-            # Input 시트 제거
-            workbook.remove(workbook[input_sheet_name])
-            removed_sheet = True
+        if removed_sheet:
             print(f"🗑️ '{input_sheet_name}' 시트가 제거되었습니다.", file=sys.stderr)
         else:
             print(f"⚠️ '{input_sheet_name}' 시트를 찾을 수 없습니다.", file=sys.stderr)
-        
-        # 남은 시트 목록
-        remaining_sheets = workbook.sheetnames.copy()
         print(f"📋 남은 시트 목록: {', '.join(remaining_sheets)}", file=sys.stderr)
         
-        if len(remaining_sheets) == 0:
-            raise ValueError("모든 시트가 제거되어 빈 엑셀 파일이 됩니다.")
-        
-        # 3단계: 수정된 파일 저장
-        # 모든 서식과 스타일 정보 보존
-        workbook.save(target_path)
-        workbook.close()
-        
-        print(f"✅ Python openpyxl 처리 완료 (완벽한 서식 보존)", file=sys.stderr)
+        print(f"✅ 시트 제거 완료 (완벽한 서식 보존)", file=sys.stderr)
         
         result.update({
             'success': True,
@@ -79,7 +54,7 @@ def remove_input_sheet_perfect(source_path, target_path, input_sheet_name='Input
             'original_format': True
         })
         
-    except InvalidFileException as e:
+    except zipfile.BadZipFile as e:
         error_msg = f"올바른 엑셀 파일이 아닙니다: {str(e)}"
         print(f"❌ {error_msg}", file=sys.stderr)
         result.update({
@@ -102,11 +77,6 @@ def remove_input_sheet_perfect(source_path, target_path, input_sheet_name='Input
             'success': False,
             'error': error_msg
         })
-        
-        # 실패 시 타겟 파일 삭제
-        if os.path.exists(target_path):
-            os.remove(target_path)
-            print(f"🗑️ 실패한 타겟 파일 삭제: {target_path}", file=sys.stderr)
     
     return result
 
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+상주형 엑셀 처리 워커 (JSON Lines over stdin/stdout)
+
+요청마다 python3 프로세스를 새로 띄우면 인터프리터 기동과 openpyxl/pandas
+import 비용을 매번 치르게 된다. 이 워커는 한 번 기동해 모듈을 미리 불러 둔 뒤
+stdin으로 들어오는 명령을 한 줄씩 처리하고 stdout으로 결과를 한 줄씩 돌려준다.
+
+요청 (한 줄에 하나):
+    {"id": "1", "command": "parse", "args": {"file": "a.xlsx"}}
+
+응답 (한 줄에 하나):
+    {"id": "1", "success": true, "result": {...}, "elapsedMs": 12.3}
+    {"id": "1", "success": false, "error": "...", "elapsedMs": 0.4}
+
+args에 "stream": true를 준 스트리밍 명령(po_cli.STREAM_COMMANDS, 현재 parse)은 최종 응답
+전에 항목을 하나씩 보낸다:
+    {"id": "1", "event": "item", "item": {...발주서...}}
+parse에 "stream"을 주지 않으면 STREAMING_THRESHOLD_BYTES 이상인 파일은 스트림으로 처리한다
+(po_cli._wants_stream). 전체 orders 결과가 필요하면 "stream": false를 준다.
+
+명령 (parse/remove-sheet/extract-sheets/verify는 po_cli.COMMANDS와 동일):
+    parse           {"file", "engine"?, "streaming"?, "stream": false} → parse_po_template_input
+                    {"file", "engine"?, "stream": true}     → 발주서 item 스트림 + 요약
+    remove-sheet    {"source", "target", "sheet"?, "method"?} → excel-minimal-processing
+    extract-sheets  {"file", "sheets"?}                     → extract_sheets_for_email
+    verify          {"file"} 또는 {"original", "processed"}  → 서식 검증 / 비교
+    ping            {}                                      → {"pid", "python", "openpyxl"}
+    shutdown        {}                                      → 응답 후 종료
+
+기동이 끝나면 {"event": "ready", "pid": ...} 한 줄을 먼저 출력한다.
+처리 함수들의 로그는 모두 stderr로 보내며 stdout에는 응답 JSON만 쓴다.
+
+사용법:
+    python3 excel-python-worker.py
+"""
+
+import importlib.util
+import json
+import os
+import platform
+import sys
+import time
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.abspath(os.path.join(SCRIPT_DIR, "..", "..")))
+
+from po_cli import preload_modules, run_command
+
+
+def handle_ping(args):
+    # openpyxl은 불러오지 않고 설치 여부만 확인
+    return {
+        "pid": os.getpid(),
+        "python": platform.python_version(),
+        "openpyxl": importlib.util.find_spec("openpyxl") is not None,
+    }
+
+
+def handle_shutdown(args):
+    return {"pid": os.getpid(), "shutdown": True}
+
+
+# po_cli 명령에 더해 워커 전용 명령
+WORKER_COMMANDS = {
+    "ping": handle_ping,
+    "shutdown": handle_shutdown,
+}
+
+
+def handle_request(line, output=None):
+    """
+    요청 한 줄을 처리하여 응답 dict 반환
+
+    Args:
+        line: JSON 요청 문자열
+        output: 스트리밍 항목({"id", "event": "item", "item"})을 쓸 스트림
+
+    Returns:
+        Dict: {"id", "success", "result" 또는 "error", "elapsedMs"}
+    """
+    started = time.perf_counter()
+    request_id = None
+    try:
+        request = json.loads(line)
+        request_id = request.get("id")
+        command = request.get("command")
+        args = request.get("args") or {}
+        if command in WORKER_COMMANDS:
+            result = WORKER_COMMANDS[command](args)
+        else:
+            emit = None
+            if output is not None:
+                def emit(item):
+                    output.write(json.dumps({"id": request_id, "event": "item", "item": item},
+                                            ensure_ascii=False, default=str) + "\n")
+                    output.flush()
+            result = run_command(command, args, emit)
+        response = {"id": request_id, "success": True, "result": result}
+    except Exception as e:
+        print(f"❌ 워커 요청 처리 실패: {str(e)}", file=sys.stderr)
+        response = {"id": request_id, "success": False, "error": str(e)}
+
+    response["elapsedMs"] = round((time.perf_counter() - started) * 1000, 1)
+    return response
+
+
+def main():
+    # 요청 처리 중에 import 비용이 들지 않도록 모든 명령의 모듈을 미리 로드
+    preload_modules()
+
+    output = sys.stdout
+    output.write(json.dumps({"event": "ready", "pid": os.getpid()}) + "\n")
+    output.flush()
+    print(f"🚀 엑셀 워커 준비 완료 (pid {os.getpid()})", file=sys.stderr)
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        response = handle_request(line, output)
+        output.write(json.dumps(response, ensure_ascii=False, default=str) + "\n")
+        output.flush()
+
+        if response["success"] and response["result"].get("shutdown"):
+            break
+
+    print(f"👋 엑셀 워커 종료 (pid {os.getpid()})", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,334 @@
+/**
+ * 상주형 Python 엑셀 워커 풀
+ * 요청마다 python3를 새로 띄우지 않고, 미리 기동해 둔 excel-python-worker.py 프로세스들에
+ * JSON Lines 명령을 보내 인터프리터 기동/모듈 import 비용을 없앤다.
+ *
+ * 풀 크기: options.size > PYTHON_WORKER_POOL_SIZE 환경변수 > 2
+ *
+ * 스트리밍 명령(args.stream = true, 예: parse)은 최종 응답 전에
+ * {"id", "event": "item", "item"} 줄을 보내며, 항목마다 onItem이 호출되고 응답 시간 제한이 다시 시작된다.
+ * 워커는 stream을 지정하지 않은 parse를 큰 파일이면 스트림으로 처리하므로, onItem 없이 보내는
+ * 요청에는 stream: false를 넣어 전체 결과를 받는다.
+ *
+ * 기동 실패 처리:
+ * - 대기열의 요청은 queueTimeoutMs 안에 워커에 배정되지 않으면 실패 처리
+ * - 실행 파일이 없는 등 spawn 자체가 실패하거나 준비(ready) 전에 워커가 종료되면
+ *   준비된 워커가 하나도 없는 동안 대기 중인 요청을 모두 실패 처리
+ * - 준비 전에 종료된 워커는 지수 백오프(RESTART_BASE_DELAY_MS × 2^n, 최대 RESTART_MAX_DELAY_MS)로 재시작
+ */
+
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+import path from 'path';
+import readline from 'readline';
+import { fileURLToPath } from 'url';
+
+const __filename = fileURLToPath(import.meta.url);
+const __dirname = path.dirname(__filename);
+
+export type PythonWorkerCommand =
+  'parse' | 'remove-sheet' | 'extract-sheets' | 'pipeline' | 'generate-po' | 'export-input' | 'validate' | 'rollup' | 'match-names' | 'read-records' | 'category-tree' | 'verify' | 'cache-stats' | 'ping';
+
+export interface PythonWorkerResponse<T = any> {
+  id: string;
+  success: boolean;
+  result?: T;
+  error?: string;
+  elapsedMs: number;
+}
+
+export interface PythonWorkerRunOptions {
+  onItem?: (item: any) => void;
+}
+
+export interface PythonWorkerPoolOptions {
+  size?: number;
+  pythonPath?: string;
+  scriptPath?: string;
+  requestTimeoutMs?: number;
+  queueTimeoutMs?: number;
+}
+
+interface PendingRequest {
+  id: string;
+  line: string;
+  resolve: (response: PythonWorkerResponse) => void;
+  reject: (error: Error) => void;
+  onItem?: (item: any) => void;
+  timer?: NodeJS.Timeout;
+}
+
+interface PythonWorker {
+  process: ChildProcessWithoutNullStreams;
+  ready: boolean;
+  exited: boolean;
+  current: PendingRequest | null;
+}
+
+const DEFAULT_POOL_SIZE = 2;
+const DEFAULT_REQUEST_TIMEOUT_MS = 60 * 1000;
+const RESTART_BASE_DELAY_MS = 500;
+const RESTART_MAX_DELAY_MS = 30 * 1000;
+
+export class PythonWorkerPool {
+  private readonly size: number;
+  private readonly pythonPath: string;
+  private readonly scriptPath: string;
+  private readonly requestTimeoutMs: number;
+  private readonly queueTimeoutMs: number;
+  private workers: PythonWorker[] = [];
+  private queue: PendingRequest[] = [];
+  private restartTimers = new Set<NodeJS.Timeout>();
+  private startupFailures = 0;
+  private nextId = 1;
+  private closed = false;
+
+  constructor(options: PythonWorkerPoolOptions = {}) {
+    const envSize = parseInt(process.env.PYTHON_WORKER_POOL_SIZE || '', 10);
+    this.size = Math.max(1, options.size ?? (Number.isNaN(envSize) ? DEFAULT_POOL_SIZE : envSize));
+    this.pythonPath = options.pythonPath ?? 'python3';
+    this.scriptPath = options.scriptPath ?? path.join(__dirname, 'excel-python-worker.py');
+    this.requestTimeoutMs = options.requestTimeoutMs ?? DEFAULT_REQUEST_TIMEOUT_MS;
+    this.queueTimeoutMs = options.queueTimeoutMs ?? this.requestTimeoutMs;
+
+    for (let i = 0; i < this.size; i++) {
+      this.workers.push(this.startWorker());
+    }
+  }
+
+  /**
+   * 명령 하나를 유휴 워커에 보내고 응답을 기다림
+   */
+  run<T = any>(
+    command: PythonWorkerCommand,
+    args: Record<string, unknown> = {},
+    options: PythonWorkerRunOptions = {}
+  ): Promise<PythonWorkerResponse<T>> {
+    if (this.closed) {
+      return Promise.reject(new Error('Python 워커 풀이 종료되었습니다.'));
+    }
+
+    const id = String(this.nextId++);
+    // 항목을 받을 곳이 없으면 워커의 큰 파일 자동 스트림을 끔
+    const requestArgs = options.onItem || args.stream !== undefined ? args : { ...args, stream: false };
+    const line = JSON.stringify({ id, command, args: requestArgs }) + '\n';
+
+    return new Promise((resolve, reject) => {
+      const request: PendingRequest = { id, line, resolve, reject, onItem: options.onItem };
+      // 워커에 배정되기 전까지의 대기 시간 제한 (배정되면 응답 시간 제한으로 바뀜)
+      request.timer = setTimeout(() => {
+        const index = this.queue.indexOf(request);
+        if (index !== -1) {
+          this.queue.splice(index, 1);
+          reject(new Error(`Python 워커 대기 시간 초과 (${this.queueTimeoutMs}ms, 준비된 워커 없음)`));
+        }
+      }, this.queueTimeoutMs);
+      this.queue.push(request);
+      this.dispatch();
+    });
+  }
+
+  /**
+   * 모든 워커 종료 (대기 중인 요청은 실패 처리)
+   */
+  async close(): Promise<void> {
+    this.closed = true;
+    for (const timer of this.restartTimers) {
+      clearTimeout(timer);
+    }
+    this.restartTimers.clear();
+    this.rejectQueue(new Error('Python 워커 풀이 종료되었습니다.'));
+    await Promise.all(this.workers.map((worker) => new Promise<void>((resolve) => {
+      if (worker.exited || worker.process.exitCode !== null) {
+        resolve();
+        return;
+      }
+      worker.process.once('exit', () => resolve());
+      worker.process.stdin.end(JSON.stringify({ id: 'shutdown', command: 'shutdown' }) + '\n');
+    })));
+  }
+
+  getStats() {
+    return {
+      size: this.size,
+      ready: this.workers.filter((worker) => worker.ready).length,
+      busy: this.workers.filter((worker) => worker.current !== null).length,
+      queued: this.queue.length,
+      startupFailures: this.startupFailures,
+    };
+  }
+
+  private startWorker(): PythonWorker {
+    const child = spawn(this.pythonPath, [this.scriptPath], { stdio: ['pipe', 'pipe', 'pipe'] });
+    const worker: PythonWorker = { process: child, ready: false, exited: false, current: null };
+
+    readline.createInterface({ input: child.stdout }).on('line', (line) => {
+      this.handleLine(worker, line);
+    });
+
+    child.stderr.on('data', (data) => {
+      console.log(`🐍 [worker ${child.pid}] ${data.toString().trimEnd()}`);
+    });
+
+    // stdin이 닫힌 워커에 쓰다가 나는 EPIPE는 exit 처리로 충분
+    child.stdin.on('error', () => {});
+
+    child.on('exit', (code) => {
+      this.handleWorkerExit(worker, `code ${code}`);
+    });
+
+    child.on('error', (error) => {
+      // spawn 실패(ENOENT 등)는 exit 없이 error만 올 수 있음
+      console.error(`❌ Python 워커 실행 실패:`, error);
+      this.handleWorkerExit(worker, error.message);
+    });
+
+    return worker;
+  }
+
+  private handleWorkerExit(worker: PythonWorker, reason: string) {
+    if (worker.exited) {
+      return;
+    }
+    worker.exited = true;
+    const wasReady = worker.ready;
+    worker.ready = false;
+
+    if (worker.current) {
+      this.finish(worker, new Error(`Python 워커가 비정상 종료되었습니다 (${reason})`));
+    }
+    if (this.closed) {
+      return;
+    }
+
+    let delay = 0;
+    if (!wasReady) {
+      // 기동 실패: 준비된 워커가 없으면 대기 요청이 풀릴 수 없으므로 바로 실패 처리
+      this.startupFailures++;
+      delay = Math.min(RESTART_BASE_DELAY_MS * 2 ** (this.startupFailures - 1), RESTART_MAX_DELAY_MS);
+      if (!this.workers.some((other) => other.ready)) {
+        this.rejectQueue(new Error(`Python 워커 기동 실패 (${reason})`));
+      }
+    }
+
+    console.warn(`⚠️ Python 워커 재시작 (pid ${worker.process.pid}, ${reason}, ${delay}ms 후)`);
+    const timer = setTimeout(() => {
+      this.restartTimers.delete(timer);
+      const index = this.workers.indexOf(worker);
+      if (!this.closed && index !== -1) {
+        this.workers[index] = this.startWorker();
+      }
+    }, delay);
+    this.restartTimers.add(timer);
+  }
+
+  private rejectQueue(error: Error) {
+    for (const request of this.queue.splice(0)) {
+      clearTimeout(request.timer);
+      request.reject(error);
+    }
+  }
+
+  private handleLine(worker: PythonWorker, line: string) {
+    let message: any;
+    try {
+      message = JSON.parse(line);
+    } catch {
+      console.warn(`⚠️ Python 워커 출력 파싱 실패: ${line}`);
+      return;
+    }
+
+    if (message.event === 'ready') {
+      worker.ready = true;
+      this.startupFailures = 0;
+      this.dispatch();
+      return;
+    }
+
+    if (worker.current && message.id === worker.current.id) {
+      if (message.event === 'item') {
+        // 스트리밍 항목: 진행 중이므로 응답 시간 제한을 다시 시작
+        this.armTimeout(worker, worker.current);
+        try {
+          worker.current.onItem?.(message.item);
+        } catch (error) {
+          console.error('❌ Python 워커 스트림 항목 처리 실패:', error);
+        }
+        return;
+      }
+      this.finish(worker, null, message as PythonWorkerResponse);
+      this.dispatch();
+    }
+  }
+
+  private dispatch() {
+    for (const worker of this.workers) {
+      if (this.queue.length === 0) {
+        return;
+      }
+      if (!worker.ready || worker.current) {
+        continue;
+      }
+
+      const request = this.queue.shift()!;
+      worker.current = request;
+      this.armTimeout(worker, request);
+      worker.process.stdin.write(request.line);
+    }
+  }
+
+  private armTimeout(worker: PythonWorker, request: PendingRequest) {
+    clearTimeout(request.timer);
+    request.timer = setTimeout(() => {
+      // 응답이 없는 워커는 종료하고 exit 핸들러에서 새 워커로 교체
+      this.finish(worker, new Error(`Python 워커 응답 시간 초과 (${this.requestTimeoutMs}ms)`));
+      worker.process.kill();
+    }, this.requestTimeoutMs);
+  }
+
+  private finish(worker: PythonWorker, error: Error | null, response?: PythonWorkerResponse) {
+    const request = worker.current;
+    if (!request) {
+      return;
+    }
+    worker.current = null;
+    clearTimeout(request.timer);
+    if (error) {
+      request.reject(error);
+    } else {
+      request.resolve(response!);
+    }
+  }
+}
+
+let sharedPool: PythonWorkerPool | null = null;
+
+/**
+ * 프로세스 전체에서 공유하는 워커 풀 (첫 호출 시 기동)
+ */
+export function getPythonWorkerPool(): PythonWorkerPool {
+  if (!sharedPool) {
+    sharedPool = new PythonWorkerPool();
+  }
+  return sharedPool;
+}
+
+/**
+ * 공유 워커 풀로 명령 실행
+ */
+export function runPythonCommand<T = any>(
+  command: PythonWorkerCommand,
+  args: Record<string, unknown> = {}
+): Promise<PythonWorkerResponse<T>> {
+  return getPythonWorkerPool().run<T>(command, args);
+}
+
+/**
+ * 공유 워커 풀로 스트리밍 명령 실행 (항목마다 onItem 호출, 최종 응답은 요약)
+ */
+export function streamPythonCommand<T = any>(
+  command: PythonWorkerCommand,
+  args: Record<string, unknown>,
+  onItem: (item: any) => void
+): Promise<PythonWorkerResponse<T>> {
+  return getPythonWorkerPool().run<T>(command, { ...args, stream: true }, { onItem });
+}
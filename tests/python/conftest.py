@@ -0,0 +1,51 @@
+"""
+Python 모듈 테스트 공용 설정
+
+모듈들은 저장소 루트에 있으므로 루트를 import 경로에 넣고, 테스트용 워크북은
+po_input_exporter.write_input_workbook으로 tmp_path에 만든다.
+"""
+
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+
+def input_row(order_number, item_name, total, vendor="거래처A", site="현장A",
+              order_date="2025-01-02", due_date="2025-01-20"):
+    """Input 시트 17개 컬럼(A~Q) 행 (공급가액/세액은 총금액에서 계산)"""
+    supply = round(total / 1.1)
+    return (order_number, order_date, site, "원자재", "알루미늄", "압출", item_name, "2T",
+            1, supply, supply, total - supply, total, due_date, vendor, "납품처", "")
+
+
+def write_sheet(path, sheet_name, header, rows):
+    """헤더와 행으로 시트 하나짜리 워크북을 openpyxl로 저장하고 경로를 반환"""
+    from openpyxl import Workbook
+
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = sheet_name
+    worksheet.append(header)
+    for row in rows:
+        worksheet.append(row)
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def make_input_workbook(tmp_path):
+    """행 튜플 목록으로 Input 시트 워크북을 만들고 경로를 반환하는 함수"""
+    from po_input_exporter import write_input_workbook
+
+    def make(rows, name="input.xlsx"):
+        path = tmp_path / name
+        with open(path, "wb") as output:
+            write_input_workbook(rows, output)
+        return str(path)
+
+    return make
@@ -0,0 +1,95 @@
+import pytest
+
+from conftest import write_sheet
+from excel_parser import parse_excel_to_purchase_orders, parse_excel_with_pandas
+from excel_parser_with_categories import parse_excel_with_categories
+from po_schema_registry import SCHEMA_LAYOUTS, get_row_converter
+from po_template_parser import build_po_item_table, iter_po_template_orders, parse_po_template_input
+
+
+def standard_row(order_date, vendor, site, item_name, total):
+    return (order_date, "2025-09-30", vendor, "vendor@example.com", site, "delivery@example.com",
+            site, "원자재", "알루미늄", "압출", item_name, "2T", 1, total, total, "")
+
+
+@pytest.mark.parametrize("engine", ["xml", "openpyxl"])
+def test_standard_layout_leaves_order_numbers_to_server(tmp_path, engine):
+    path = write_sheet(tmp_path / "standard.xlsx", "Input", SCHEMA_LAYOUTS["standard"], [
+        standard_row("2025-09-10", "거래처A", "현장A", "품목1", 1100),
+        standard_row("2025-09-12", "거래처A", "현장A", "품목2", 2200),
+        standard_row("2025-09-11", "거래처B", "현장A", "품목3", 3300),
+    ])
+
+    # 발주번호를 만들지 않으므로 발주서로 묶는 경로는 실패
+    result = parse_po_template_input(path, engine=engine)
+    assert result["success"] is False
+    assert "발주번호" in result["error"]
+    with pytest.raises(ValueError, match="발주번호"):
+        list(iter_po_template_orders(path, engine=engine))
+
+    # 아이템 테이블은 발주번호를 빈 값으로 두고 읽음
+    table = build_po_item_table(path, engine=engine)
+    assert [(row["orderNumber"], row["vendorName"], row["itemName"], row["totalAmount"])
+            for row in table.to_records()] == [
+        ("", "거래처A", "품목1", 1100.0),
+        ("", "거래처A", "품목2", 2200.0),
+        ("", "거래처B", "품목3", 3300.0),
+    ]
+
+
+def test_order_form_aliases_map_by_header(tmp_path):
+    # 발주서번호/품명 헤더, 세액/합계 컬럼 없는 15개 컬럼
+    header = ["발주서번호", "발주일자", "현장명", "대분류", "중분류", "소분류", "품명", "규격", "수량",
+              "단가", "공급가액", "납기일", "거래처명", "납품처명", "비고"]
+    row = ["PO-1", "2025-01-02", "현장A", "원자재", "알루미늄", "압출", "품목1", "2T", 2,
+           100, 200, "2025-01-20", "거래처A", "납품처A", "메모"]
+    path = write_sheet(tmp_path / "aliases.xlsx", "Input", header, [row])
+
+    order = parse_po_template_input(path, engine="xml")["orders"][0]
+    assert (order["orderNumber"], order["dueDate"], order["vendorName"]) == ("PO-1", "2025-01-20", "거래처A")
+    item = order["items"][0]
+    assert (item["itemName"], item["supplyAmount"], item["taxAmount"]) == ("품목1", 200.0, 0.0)
+    assert (item["deliveryName"], item["notes"]) == ("납품처A", "메모")
+
+
+def test_text_columns_keep_zero_values():
+    converter = get_row_converter(["발주번호", "품목명", "규격", "수량"],
+                                  fields=["itemName", "specification", "quantity", "notes"])
+    assert converter.convert(("PO-1", "품목", 0, None)) == ("품목", "0", 0.0, "")
+    assert converter.convert((None, "품목", "2T", 1)) is None
+
+
+@pytest.mark.parametrize("engine", ["xml", "openpyxl"])
+def test_purchase_order_parsers_read_columns_by_header(tmp_path, engine):
+    # 등록 레이아웃과 컬럼 순서가 다른 시트
+    header = ["품목명", "발주번호", "대분류", "수량", "총금액", "발주일", "거래처명"]
+    path = write_sheet(tmp_path / "orders.xlsx", "Input Sheet", header, [
+        ["품목1", "PO-1", "원자재", "3", 3300.7, "2025-01-02", "거래처A"],
+        [None, None, None, None, None, None, None],
+        ["품목2", None, None, 1, 100, None, None],
+    ])
+
+    orders = parse_excel_to_purchase_orders(path, engine=engine)
+    assert len(orders) == 2
+    assert orders[0] == {
+        "order_number": "PO-1", "order_date": "2025-01-02", "item_name": "품목1", "specification": "",
+        "quantity": 3, "unit_price": 0, "supply_amount": 0, "tax": 0, "total_amount": 3300,
+        "due_date": "", "vendor_name": "거래처A", "delivery_name": "", "note": "",
+    }
+
+    # 카테고리 파서는 발주번호가 빈 행을 건너뜀
+    categorized = parse_excel_with_categories(path, engine=engine)
+    assert [(row["order_number"], row["category_lv1"], row["item_name"]) for row in categorized] == [
+        ("PO-1", "원자재", "품목1")
+    ]
+
+
+def test_pandas_parser_reads_columns_by_header(tmp_path):
+    header = ["품목명", "발주번호", "수량", "총금액", "발주일", "거래처명"]
+    path = write_sheet(tmp_path / "orders.xlsx", "Input Sheet", header, [
+        ["품목1", "PO-1", 3, 3300, "2025-01-02", "거래처A"],
+        [None, None, None, None, None, None],
+        ["품목2", "PO-2", 1, 100, None, None],
+    ])
+
+    assert parse_excel_with_pandas(path) == parse_excel_to_purchase_orders(path, engine="xml")
@@ -0,0 +1,58 @@
+from conftest import input_row
+from po_template_parser import parse_po_template_input
+
+
+def test_incremental_parse_returns_only_added_and_changed_orders(make_input_workbook):
+    first = make_input_workbook([
+        input_row("PO-1", "품목1", 1100),
+        input_row("PO-2", "품목2", 2200),
+        input_row("PO-3", "품목3", 3300),
+    ], name="first.xlsx")
+    previous = parse_po_template_input(first, engine="xml", fingerprints=True)
+    assert previous["fingerprints"]["totalItems"] == 3
+
+    # PO-1 그대로, PO-2 아이템 수정 + 추가, PO-3 삭제, PO-4 추가
+    second = make_input_workbook([
+        input_row("PO-1", "품목1", 1100),
+        input_row("PO-2", "품목2", 2500),
+        input_row("PO-2", "품목5", 500),
+        input_row("PO-4", "품목4", 4400),
+    ], name="second.xlsx")
+    result = parse_po_template_input(second, engine="xml", previous_fingerprints=previous["fingerprints"])
+
+    assert result["success"] is True
+    assert result["incremental"] is True
+    assert (result["totalOrders"], result["totalItems"]) == (3, 4)
+    assert [(order["orderNumber"], order["totalAmount"]) for order in result["orders"]] == [
+        ("PO-4", 4400), ("PO-2", 3000)
+    ]
+    assert result["removedOrders"] == ["PO-3"]
+    assert result["diff"] == {
+        "added": ["PO-4"],
+        "changed": ["PO-2"],
+        "removed": ["PO-3"],
+        "unchanged": 1,
+        "rowChanges": {"PO-2": [2, 1]},
+    }
+
+
+def test_header_change_marks_order_changed_without_row_changes(make_input_workbook):
+    first = make_input_workbook([input_row("PO-1", "품목1", 1100)], name="first.xlsx")
+    previous = parse_po_template_input(first, engine="xml", fingerprints=True)["fingerprints"]
+
+    second = make_input_workbook([input_row("PO-1", "품목1", 1100, vendor="거래처B")], name="second.xlsx")
+    result = parse_po_template_input(second, engine="openpyxl", previous_fingerprints=previous)
+
+    # 지문은 변환 결과로 계산하므로 엔진이 달라도 비교 가능
+    assert result["diff"]["changed"] == ["PO-1"]
+    assert result["diff"]["rowChanges"] == {"PO-1": [0, 0]}
+    assert result["orders"][0]["vendorName"] == "거래처B"
+
+
+def test_unchanged_sheet_is_not_reread(make_input_workbook):
+    path = make_input_workbook([input_row("PO-1", "품목1", 1100)])
+    previous = parse_po_template_input(path, engine="xml", fingerprints=True)["fingerprints"]
+
+    result = parse_po_template_input(path, engine="xml", previous_fingerprints=previous)
+    assert (result["orders"], result["removedOrders"], result["diff"]["unchanged"]) == ([], [], 1)
+    assert result["fingerprints"] is previous
@@ -0,0 +1,62 @@
+from datetime import date, datetime
+
+import pytest
+from openpyxl import load_workbook
+
+from conftest import input_row
+from po_input_exporter import export_orders_to_input
+from po_template_parser import parse_po_template_input
+
+# 1900-03-01 전후 (Excel의 1900-02-29 보정 경계)
+DATES = ["1900-01-01", "1900-02-28", "1900-03-01", "1900-03-02", "2025-01-02"]
+
+
+@pytest.mark.parametrize("engine", ["xml", "openpyxl"])
+def test_dates_round_trip_across_1900_leap_day(make_input_workbook, engine):
+    path = make_input_workbook([
+        input_row(f"PO-{index}", "품목", 1100, order_date=value, due_date=value)
+        for index, value in enumerate(DATES, 1)
+    ])
+
+    orders = parse_po_template_input(path, engine=engine)["orders"]
+    assert [(order["orderDate"], order["dueDate"]) for order in orders] == [(value, value) for value in DATES]
+
+
+def test_written_serials_match_excel(make_input_workbook):
+    path = make_input_workbook([
+        input_row(f"PO-{index}", "품목", 1100, order_date=value, due_date=value)
+        for index, value in enumerate(DATES, 1)
+    ])
+
+    # Excel 시리얼(1900-01-01 = 1, 1900-02-28 = 59, 1900-03-01 = 61)을 openpyxl로 읽은 값
+    sheet = load_workbook(path)["Input"]
+    assert [sheet.cell(row=row, column=2).value for row in range(2, 2 + len(DATES))] == [
+        datetime(1900, 1, 1), datetime(1900, 2, 28), datetime(1900, 3, 1),
+        datetime(1900, 3, 2), datetime(2025, 1, 2),
+    ]
+
+
+def test_export_of_parsed_orders_parses_back_identically(make_input_workbook, tmp_path):
+    path = make_input_workbook([
+        input_row("PO-1", "품목1", 1100, order_date="1900-02-28"),
+        input_row("PO-1", "품목2", 2200, order_date="1900-02-28"),
+        input_row("PO-2", "품목3", 3300, order_date="1900-03-01", due_date="2025-12-31"),
+    ])
+    orders = parse_po_template_input(path, engine="xml")["orders"]
+
+    output = str(tmp_path / "exported.xlsx")
+    assert export_orders_to_input(orders, output) == {"success": True, "path": output, "rows": 3}
+    assert parse_po_template_input(output, engine="xml")["orders"] == orders
+
+
+def test_date_objects_are_written_as_dates(tmp_path):
+    order = {
+        "orderNumber": "PO-1", "orderDate": date(1900, 2, 28), "siteName": "현장A",
+        "dueDate": datetime(1900, 3, 1), "vendorName": "거래처A",
+        "items": [{"itemName": "품목1", "quantity": 1, "totalAmount": 100}],
+    }
+    output = str(tmp_path / "dates.xlsx")
+    export_orders_to_input([order], output)
+
+    [parsed] = parse_po_template_input(output, engine="xml")["orders"]
+    assert (parsed["orderDate"], parsed["dueDate"]) == ("1900-02-28", "1900-03-01")
@@ -0,0 +1,46 @@
+import json
+import subprocess
+import sys
+
+from conftest import REPO_ROOT, input_row
+from po_rollup import rollup_order_totals
+from po_template_parser import build_po_item_table, parse_po_template_input
+
+
+def test_order_totals_match_rollup_of_item_table(make_input_workbook):
+    path = make_input_workbook([
+        input_row("PO-1", "품목1", 1100),
+        input_row("PO-2", "품목2", 2200),
+        input_row("PO-1", "품목3", 3300),
+    ])
+
+    assert rollup_order_totals(build_po_item_table(path, engine="xml")) == {
+        "PO-1": (2, 4400.0),
+        "PO-2": (1, 2200.0),
+    }
+
+    result = parse_po_template_input(path, engine="xml")
+    assert result["totalOrders"] == 2
+    assert result["totalItems"] == 3
+    assert [(order["orderNumber"], order["totalAmount"], len(order["items"]))
+            for order in result["orders"]] == [("PO-1", 4400.0, 2), ("PO-2", 2200.0, 1)]
+
+
+def test_empty_input_has_no_orders(make_input_workbook):
+    result = parse_po_template_input(make_input_workbook([]), engine="xml")
+    assert result["success"] is True
+    assert (result["totalOrders"], result["totalItems"], result["orders"]) == (0, 0, [])
+
+
+def test_xml_parse_does_not_load_numpy(make_input_workbook):
+    path = make_input_workbook([input_row("PO-1", "품목1", 1100)])
+    script = (
+        "import json, sys, po_cli\n"
+        "po_cli.main(['parse', sys.argv[1], '--engine', 'xml', '--no-cache'])\n"
+        "print(json.dumps(sorted(name for name in ('numpy', 'pandas', 'openpyxl') if name in sys.modules)))\n"
+    )
+    completed = subprocess.run([sys.executable, "-c", script, path], cwd=REPO_ROOT,
+                               capture_output=True, text=True, check=True)
+    lines = completed.stdout.strip().splitlines()
+    assert json.loads(lines[0])["totalOrders"] == 1
+    assert json.loads(lines[-1]) == []
@@ -0,0 +1,76 @@
+import itertools
+import os
+import shutil
+
+import parse_cache
+from conftest import REPO_ROOT, input_row
+from parse_cache import PARSERS, ParseCache, cached_parse
+
+
+def test_second_parse_is_a_cache_hit(make_input_workbook, tmp_path):
+    path = make_input_workbook([input_row("PO-1", "품목1", 1100), input_row("PO-2", "품목2", 2200)])
+    with ParseCache(str(tmp_path / "cache.sqlite3")) as cache:
+        first = cached_parse("po_template", path, cache=cache, engine="xml")
+        second = cached_parse("po_template", path, cache=cache, engine="xml")
+        # 옵션이 다르면 다른 항목
+        cached_parse("po_template", path, cache=cache, engine="openpyxl")
+
+        assert second == first
+        assert [order["orderNumber"] for order in second["orders"]] == ["PO-1", "PO-2"]
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+
+def test_failed_parse_is_not_cached(tmp_path):
+    path = tmp_path / "broken.xlsx"
+    path.write_bytes(b"not a workbook")
+    with ParseCache(str(tmp_path / "cache.sqlite3")) as cache:
+        assert cached_parse("po_template", str(path), cache=cache, engine="xml")["success"] is False
+        assert cached_parse("po_template", str(path), cache=cache, engine="xml")["success"] is False
+        assert cache.stats()["entries"] == 0
+
+
+def test_parser_source_change_invalidates_entries(make_input_workbook, tmp_path, monkeypatch):
+    # 파서 버전은 REPO_ROOT의 소스 해시이므로 복사본을 고쳐 코드 변경을 흉내냄
+    source_root = tmp_path / "src"
+    source_root.mkdir()
+    for file_name in PARSERS["po_template"][2]:
+        shutil.copy(os.path.join(REPO_ROOT, file_name), source_root / file_name)
+    monkeypatch.setattr(parse_cache, "REPO_ROOT", str(source_root))
+    monkeypatch.setattr(parse_cache, "_parser_versions", {})
+
+    path = make_input_workbook([input_row("PO-1", "품목1", 1100)])
+    with ParseCache(str(tmp_path / "cache.sqlite3")) as cache:
+        cached_parse("po_template", path, cache=cache, engine="xml")
+        cached_parse("po_template", path, cache=cache, engine="xml")
+        assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+        with open(source_root / "po_schema_registry.py", "a", encoding="utf-8") as source:
+            source.write("\n# changed\n")
+        # 새 프로세스처럼 버전을 다시 계산
+        monkeypatch.setattr(parse_cache, "_parser_versions", {})
+
+        cached_parse("po_template", path, cache=cache, engine="xml")
+        assert (cache.stats()["hits"], cache.stats()["misses"], cache.stats()["entries"]) == (1, 2, 2)
+
+
+def test_eviction_drops_least_recently_used_entry(tmp_path, monkeypatch):
+    clock = itertools.count(1)
+    monkeypatch.setattr(parse_cache.time, "time", lambda: float(next(clock)))
+
+    with ParseCache(str(tmp_path / "cache.sqlite3")) as cache:
+        cache.put("a", "po_template", "hash-a", {"success": True, "value": "a" * 1000})
+        entry_size = cache.stats()["totalBytes"]
+        # 같은 크기 항목 두 개까지만 들어가는 상한
+        cache.max_bytes = entry_size * 2 + entry_size // 2
+
+        cache.put("b", "po_template", "hash-b", {"success": True, "value": "b" * 1000})
+        assert cache.get("a") is not None
+        cache.put("c", "po_template", "hash-c", {"success": True, "value": "c" * 1000})
+
+        assert cache.get("b") is None
+        assert cache.get("a")["value"] == "a" * 1000
+        assert cache.get("c")["value"] == "c" * 1000
+        stats = cache.stats()
+        assert (stats["entries"], stats["evictions"]) == (2, 1)
+        assert stats["totalBytes"] <= cache.max_bytes
@@ -0,0 +1,61 @@
+import os
+
+from openpyxl import load_workbook
+
+from conftest import REPO_ROOT
+from po_document_generator import DEFAULT_LAYOUT, generate_po_documents
+
+TEMPLATE = os.path.join(REPO_ROOT, "PO_test", "old_format", "PO_Template01_Ext_20250716_2.xlsx")
+
+
+def make_order(order_number, vendor, items):
+    return {
+        "orderNumber": order_number, "orderDate": "2025-01-02", "siteName": "현장A",
+        "dueDate": "2025-01-20", "vendorName": vendor, "totalAmount": 0,
+        "items": [
+            {"itemName": name, "specification": spec, "quantity": quantity, "notes": ""}
+            for name, spec, quantity in items
+        ],
+    }
+
+
+def test_generated_document_clears_unused_item_slots(tmp_path):
+    order = make_order("PO-1", "거래처A", [("품목1", "IJ-1", 3), ("품목2", "IJ-2", 5)])
+    [result] = generate_po_documents(TEMPLATE, [order], str(tmp_path), max_workers=1)
+    assert result["success"] is True
+    assert os.path.basename(result["path"]) == "PO-1.xlsx"
+
+    workbook = load_workbook(result["path"])
+    assert workbook.sheetnames == ["갑지", "을지"]
+    cover = workbook["갑지"]
+    assert (cover["M3"].value, cover["C4"].value, cover["L10"].value) == ("PO-1", "현장A", "거래처A")
+    # 템플릿처럼 발주일은 날짜 시리얼로 저장
+    assert cover["C3"].value == 45659
+
+    sheet = workbook["을지"]
+    assert [sheet[f"{column}5"].value for column in "ABCH"] == [1, "품목1", "IJ-1", 3]
+    assert [sheet[f"{column}11"].value for column in "ABCH"] == [2, "품목2", "IJ-2", 5]
+
+    items = DEFAULT_LAYOUT["items"]
+    for index in range(items["max_items"]):
+        row = items["first_row"] + index * items["row_step"]
+        # 템플릿 예시 품목의 색상/길이/단중/여유분은 남지 않고 수식은 유지
+        assert [sheet[f"{column}{row}"].value for column in "EFGK"] == [None] * 4
+        assert sheet[f"I{row}"].value == f"=F{row}*G{row}*H{row}/1000"
+        if index >= 2:
+            assert [sheet[f"{column}{row}"].value for column in "ABCH"] == [None] * 4
+    assert sheet["I59"].value == "=SUM(I5:I58)"
+
+
+def test_vendor_grouping_writes_one_document_per_vendor(tmp_path):
+    orders = [
+        make_order("PO-1", "거래처A", [("품목1", "IJ-1", 1)]),
+        make_order("PO-2", "거래처B", [("품목2", "IJ-2", 2)]),
+        make_order("PO-3", "거래처A", [("품목3", "IJ-3", 3)]),
+    ]
+    results = list(generate_po_documents(TEMPLATE, orders, str(tmp_path), group_by="vendor", max_workers=1))
+    assert [(result["key"], result["items"]) for result in results] == [("거래처A", 2), ("거래처B", 1)]
+
+    sheet = load_workbook(results[0]["path"])["을지"]
+    assert [sheet["B5"].value, sheet["B11"].value] == ["품목1", "품목3"]
+    assert load_workbook(results[0]["path"])["갑지"]["M3"].value == "PO-1, PO-3"
@@ -0,0 +1,55 @@
+from conftest import input_row, write_sheet
+from po_validation import validate_po_amounts
+
+
+def test_consistent_rows_pass_every_rule(make_input_workbook):
+    path = make_input_workbook([input_row("PO-1", "품목1", 1100), input_row("PO-1", "품목2", 2200)])
+
+    result = validate_po_amounts(path)
+    assert result["success"] is True
+    assert result["skippedRules"] == {}
+    assert result["countsByRule"] == {"AMT001": 0, "AMT002": 0, "AMT003": 0}
+
+
+def test_wrong_total_is_reported_with_sheet_row(make_input_workbook):
+    row = list(input_row("PO-1", "품목1", 1100))
+    row[12] = 1500
+    path = make_input_workbook([input_row("PO-1", "품목0", 2200), tuple(row)])
+
+    result = validate_po_amounts(path)
+    assert result["countsByRule"] == {"AMT001": 0, "AMT002": 1, "AMT003": 0}
+    assert result["violations"] == [[3, "AMT002", "PO-1", 1100.0, 1500.0, 400.0]]
+
+
+def test_rules_reading_missing_columns_are_skipped(tmp_path):
+    # 총금액만 있고 공급가액/세액 컬럼이 없는 시트: 0으로 읽은 값으로 위반을 만들지 않음
+    header = ["발주번호", "품목명", "수량", "단가", "총금액"]
+    path = write_sheet(tmp_path / "totals.xlsx", "Input", header, [
+        ["PO-1", "품목1", 2, 500, 1100],
+        ["PO-1", "품목2", 1, 300, 330],
+    ])
+
+    result = validate_po_amounts(path)
+    assert result["success"] is True
+    assert result["checkedRows"] == 2
+    assert result["violationCount"] == 0
+    assert result["countsByRule"] == {}
+    assert result["skippedRules"] == {
+        "AMT001": ["supplyAmount"],
+        "AMT002": ["supplyAmount", "taxAmount"],
+        "AMT003": ["supplyAmount", "taxAmount"],
+    }
+
+
+def test_rules_with_all_columns_still_run_on_partial_sheet(tmp_path):
+    header = ["발주번호", "품목명", "수량", "단가", "공급가액", "총금액"]
+    path = write_sheet(tmp_path / "supply.xlsx", "Input", header, [
+        ["PO-1", "품목1", 2, 500, 1000, 1100],
+        ["PO-1", "품목2", 2, 500, 900, 990],
+    ])
+
+    result = validate_po_amounts(path)
+    assert list(result["rules"]) == ["AMT001"]
+    assert set(result["skippedRules"]) == {"AMT002", "AMT003"}
+    assert result["countsByRule"] == {"AMT001": 1}
+    assert [violation[:2] for violation in result["violations"]] == [[3, "AMT001"]]
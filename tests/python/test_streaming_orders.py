@@ -0,0 +1,110 @@
+import io
+import json
+import sys
+
+import pytest
+
+from conftest import input_row
+from po_cli import main
+from po_template_parser import iter_po_template_orders, parse_po_template_input
+
+
+def test_stream_matches_full_parse_for_contiguous_orders(make_input_workbook):
+    path = make_input_workbook([
+        input_row("PO-1", "품목1", 1100),
+        input_row("PO-1", "품목2", 2200),
+        input_row("PO-2", "품목3", 3300),
+    ])
+
+    for engine in ("xml", "openpyxl"):
+        streamed = list(iter_po_template_orders(path, engine=engine))
+        assert streamed == parse_po_template_input(path, engine=engine)["orders"]
+
+
+def test_non_contiguous_order_is_yielded_as_continuation(make_input_workbook):
+    path = make_input_workbook([
+        input_row("PO-1", "품목1", 1100),
+        input_row("PO-2", "품목2", 2200),
+        input_row("PO-1", "품목3", 3300, vendor="거래처B"),
+    ])
+
+    streamed = list(iter_po_template_orders(path, engine="xml"))
+    assert [order["orderNumber"] for order in streamed] == ["PO-1", "PO-2", "PO-1"]
+    assert "continuation" not in streamed[0]
+    assert streamed[2]["continuation"] is True
+    # 이어지는 구간의 헤더는 그 구간 첫 행 값, 합계는 구간 아이템 합
+    assert streamed[2]["vendorName"] == "거래처B"
+    assert streamed[2]["totalAmount"] == 3300
+
+    # 문서대로 이어 붙이면 전체 파싱 결과와 같음
+    merged = {}
+    for order in streamed:
+        target = merged.get(order["orderNumber"])
+        if target is None:
+            merged[order["orderNumber"]] = {k: v for k, v in order.items() if k != "continuation"}
+        else:
+            target["items"] = target["items"] + order["items"]
+            target["totalAmount"] += order["totalAmount"]
+    assert list(merged.values()) == parse_po_template_input(path, engine="xml")["orders"]
+
+
+def test_cli_stream_writes_json_lines_and_summary(make_input_workbook, monkeypatch):
+    path = make_input_workbook([
+        input_row("PO-1", "품목1", 1100),
+        input_row("PO-2", "품목2", 2200),
+        input_row("PO-1", "품목3", 3300),
+    ])
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    assert main(["parse", path, "--stream", "--engine", "xml"]) == 0
+
+    lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert [line["orderNumber"] for line in lines[:-1]] == ["PO-1", "PO-2", "PO-1"]
+    assert lines[-1] == {"success": True, "totalOrders": 2, "totalItems": 3, "streamed": 3}
+
+
+def test_cli_stream_reports_missing_file_in_summary(tmp_path, monkeypatch):
+    stdout = io.StringIO()
+    monkeypatch.setattr(sys, "stdout", stdout)
+
+    assert main(["parse", str(tmp_path / "missing.xlsx"), "--stream", "--engine", "xml"]) == 1
+    summary = json.loads(stdout.getvalue().splitlines()[-1])
+    assert summary["success"] is False
+    assert summary["streamed"] == 0
+
+
+def test_cli_streams_large_files_unless_told_otherwise(make_input_workbook, monkeypatch):
+    import po_template_parser
+
+    path = make_input_workbook([
+        input_row("PO-1", "품목1", 1100),
+        input_row("PO-2", "품목2", 2200),
+    ])
+    # 테스트 파일이 임계값 이상이 되도록 낮춤
+    monkeypatch.setattr(po_template_parser, "STREAMING_THRESHOLD_BYTES", 1)
+
+    def run(*options):
+        stdout = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", stdout)
+        assert main(["parse", path, "--engine", "xml", "--no-cache", *options]) == 0
+        return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+    streamed = run()
+    assert [line["orderNumber"] for line in streamed[:-1]] == ["PO-1", "PO-2"]
+    assert streamed[-1]["streamed"] == 2
+
+    [full] = run("--no-stream")
+    assert [order["orderNumber"] for order in full["orders"]] == ["PO-1", "PO-2"]
+
+    # 지문은 전체 결과에만 있으므로 스트림으로 바꾸지 않음
+    [with_fingerprints] = run("--fingerprints")
+    assert "fingerprints" in with_fingerprints
+
+
+def test_parser_keeps_helper_reexports():
+    import po_template_parser
+    from excel_dates import format_date
+    from po_schema_registry import safe_number
+
+    assert (po_template_parser.format_date, po_template_parser.safe_number) == (format_date, safe_number)
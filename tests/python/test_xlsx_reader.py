@@ -0,0 +1,159 @@
+import zipfile
+from datetime import datetime, time
+
+import pytest
+from openpyxl import Workbook, load_workbook
+
+from conftest import REPO_ROOT
+from xlsx_reader import XlsxPackage, iter_sheet_rows, list_sheet_names
+
+SAMPLE_DIR = f"{REPO_ROOT}/PO_test"
+
+# openpyxl은 문자열을 inlineStr로 저장하므로 공유 문자열 시트는 XML을 직접 작성
+SHARED_STRINGS_PARTS = {
+    "[Content_Types].xml": (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '<Override PartName="/xl/styles.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        '<Override PartName="/xl/sharedStrings.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Input" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+        '<Relationship Id="rId3" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" Target="sharedStrings.xml"/>'
+        '</Relationships>'
+    ),
+    # 스타일 1: 내장 날짜(14), 2: 사용자 날짜, 3: 사용자 숫자, 4: 내장 일시(22)
+    "xl/styles.xml": (
+        '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<numFmts count="2"><numFmt numFmtId="176" formatCode="yyyy\\-mm\\-dd"/>'
+        '<numFmt numFmtId="177" formatCode="#,##0&quot;원&quot;"/></numFmts>'
+        '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+        '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+        '<borders count="1"><border/></borders>'
+        '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+        '<cellXfs count="5"><xf numFmtId="0" xfId="0"/><xf numFmtId="14" xfId="0" applyNumberFormat="1"/>'
+        '<xf numFmtId="176" xfId="0" applyNumberFormat="1"/><xf numFmtId="177" xfId="0" applyNumberFormat="1"/>'
+        '<xf numFmtId="22" xfId="0" applyNumberFormat="1"/></cellXfs></styleSheet>'
+    ),
+    # 서식 있는 텍스트(r)와 윗주(rPh)가 섞인 공유 문자열
+    "xl/sharedStrings.xml": (
+        '<sst xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" count="9" uniqueCount="6">'
+        '<si><t>발주번호</t></si><si><t>품목명</t></si><si><t>발주일</t></si>'
+        '<si><r><rPr><b/></rPr><t>알루미늄 </t></r><r><t xml:space="preserve">압출</t></r></si>'
+        '<si><t>현장</t><rPh sb="0" eb="2"><t>げんば</t></rPh></si><si><t>PO-1</t></si></sst>'
+    ),
+    # 4행은 행 요소 없이 건너뛰고, 5행은 A열이 빈 셀
+    "xl/worksheets/sheet1.xml": (
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+        '<row r="1"><c r="A1" t="s"><v>0</v></c><c r="B1" t="s"><v>1</v></c><c r="C1" t="s"><v>2</v></c>'
+        '<c r="D1" t="inlineStr"><is><t>금액</t></is></c><c r="E1" t="inlineStr"><is><t>일시</t></is></c></row>'
+        '<row r="2"><c r="A2" t="s"><v>5</v></c><c r="B2" t="s"><v>3</v></c><c r="C2" s="1"><v>45659</v></c>'
+        '<c r="D2" s="3"><v>1234567</v></c><c r="E2" s="4"><v>45659.5</v></c><c r="F2" t="b"><v>1</v></c></row>'
+        '<row r="3"><c r="A3" t="s"><v>5</v></c><c r="B3" t="s"><v>4</v></c><c r="C3" s="2"><v>59</v></c>'
+        '<c r="D3"><v>0.1</v></c><c r="E3" s="4"><v>61.25</v></c>'
+        '<c r="F3" t="str"><f>A3&amp;"-1"</f><v>PO-1-1</v></c></row>'
+        '<row r="5"><c r="B5" t="s"><v>3</v></c><c r="C5" s="2"><v>61</v></c><c r="D5"><v>-42</v></c></row>'
+        '</sheetData></worksheet>'
+    ),
+}
+
+
+def trimmed_rows(rows):
+    """행 끝의 None과 시트 끝의 빈 행 제거 (openpyxl은 빈 행도 시트 폭만큼 None으로 채움)"""
+    result = []
+    for row in rows:
+        row = list(row)
+        while row and row[-1] is None:
+            row.pop()
+        result.append(tuple(row))
+    while result and not result[-1]:
+        result.pop()
+    return result
+
+
+def openpyxl_rows(path, sheet_name, read_only=True):
+    workbook = load_workbook(path, read_only=read_only, data_only=True)
+    try:
+        return trimmed_rows(workbook[sheet_name].iter_rows(values_only=True))
+    finally:
+        workbook.close()
+
+
+def write_shared_strings_workbook(path):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, text in SHARED_STRINGS_PARTS.items():
+            archive.writestr(name, '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n' + text)
+    return str(path)
+
+
+@pytest.mark.filterwarnings("ignore:Workbook contains no default style")
+@pytest.mark.parametrize("read_only", [True, False])
+def test_shared_strings_and_date_styles_match_openpyxl(tmp_path, read_only):
+    path = write_shared_strings_workbook(tmp_path / "shared.xlsx")
+    with XlsxPackage(path) as package:
+        assert package.shared_strings[3:5] == ["알루미늄 압출", "현장"]
+
+    rows = trimmed_rows(iter_sheet_rows(path, "Input"))
+    assert rows == openpyxl_rows(path, "Input", read_only=read_only)
+    assert rows[1] == ("PO-1", "알루미늄 압출", datetime(2025, 1, 2), 1234567, datetime(2025, 1, 2, 12), True)
+    # 1900-02-29(가상의 날짜) 전후 시리얼
+    assert rows[2] == ("PO-1", "현장", datetime(1900, 2, 28), 0.1, datetime(1900, 3, 1, 6), "PO-1-1")
+    assert rows[3] == ()
+    assert rows[4] == (None, "알루미늄 압출", datetime(1900, 3, 1), -42)
+
+
+def test_openpyxl_written_formats_match_openpyxl(tmp_path):
+    workbook = Workbook()
+    worksheet = workbook.active
+    worksheet.title = "Input"
+    worksheet.append(["날짜", "사용자 날짜", "시간", "일시", "숫자", "불리언", "문자"])
+    worksheet.append([datetime(2025, 1, 2), datetime(1900, 2, 28), time(13, 30),
+                      datetime(1900, 3, 1, 6), -0.000125, False, "0012"])
+    worksheet.append([])
+    worksheet.append([None, datetime(2024, 12, 31), None, None, 10 ** 12, True])
+    worksheet["B2"].number_format = 'yyyy"년" m"월" d"일"'
+    worksheet["B4"].number_format = "yyyy-mm-dd"
+    worksheet["C2"].number_format = "hh:mm"
+    path = str(tmp_path / "formats.xlsx")
+    workbook.save(path)
+
+    rows = trimmed_rows(iter_sheet_rows(path, "Input"))
+    assert rows == openpyxl_rows(path, "Input")
+    assert rows[1][:4] == (datetime(2025, 1, 2), datetime(1900, 2, 28), time(13, 30), datetime(1900, 3, 1, 6))
+
+
+@pytest.mark.parametrize("file_name", ["집행내역서_sample.xlsx", "old_format/PO_number01.xlsx"])
+def test_sample_workbooks_match_openpyxl(file_name):
+    path = f"{SAMPLE_DIR}/{file_name}"
+    with XlsxPackage(path) as package:
+        assert package.shared_strings
+
+    for sheet_name in list_sheet_names(path):
+        if sheet_name == "갑지":
+            continue  # 로캘 날짜 서식 셀 포함 (아래 테스트)
+        assert trimmed_rows(iter_sheet_rows(path, sheet_name)) == openpyxl_rows(path, sheet_name), sheet_name
+
+
+def test_locale_date_formats_read_as_dates():
+    # 갑지 C3는 한국어 로캘 내장 날짜 서식(ID 31): openpyxl은 숫자, XML 리더는 날짜로 읽음
+    path = f"{SAMPLE_DIR}/old_format/PO_Template01_Ext_20250716_2.xlsx"
+    reader_value = list(iter_sheet_rows(path, "갑지"))[2][2]
+    openpyxl_value = openpyxl_rows(path, "갑지")[2][2]
+    assert reader_value == datetime(2024, 6, 12)
+    assert openpyxl_value == 45455
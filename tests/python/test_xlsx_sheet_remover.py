@@ -0,0 +1,233 @@
+import io
+import re
+import zipfile
+
+import pytest
+
+from xlsx_sheet_remover import keep_sheets_in_bytes, remove_sheet_from_bytes
+
+REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+
+SHEET_NAMES = ["Input", "갑지", "을지"]
+
+
+def _sheet_xml(text, drawing=False):
+    drawing_element = '<drawing r:id="rId1"/>' if drawing else ""
+    return (f'<worksheet xmlns="{MAIN}" xmlns:r="{REL}"><sheetData><row r="1">'
+            f'<c r="A1" t="inlineStr"><is><t>{text}</t></is></c></row></sheetData>'
+            f'{drawing_element}</worksheet>')
+
+
+def _drawing_rels(image):
+    return (f'<Relationships xmlns="{PKG_REL}"><Relationship Id="rId1" '
+            f'Type="{REL}/image" Target="../media/{image}"/></Relationships>')
+
+
+def _parts():
+    """
+    시트 3개(Input, 갑지, 을지) 워크북 파트
+
+    - Input: 그림(drawing1 → image1 전용, shared.png 공용)과 주석(comments1)
+    - 갑지: 그림(drawing2 → shared.png)
+    - 이름 정의: Input/을지 시트 로컬 인쇄 영역, Input/갑지를 참조하는 전역 이름
+    """
+    sheets = "".join(
+        f'<sheet name="{name}" sheetId="{index + 1}" r:id="rId{index + 1}"/>'
+        for index, name in enumerate(SHEET_NAMES)
+    )
+    workbook = (
+        f'<workbook xmlns="{MAIN}" xmlns:r="{REL}">'
+        '<bookViews><workbookView activeTab="2" firstSheet="1"/></bookViews>'
+        f'<sheets>{sheets}</sheets><definedNames>'
+        '<definedName name="_xlnm.Print_Area" localSheetId="0">Input!$A$1:$Q$10</definedName>'
+        '<definedName name="_xlnm.Print_Area" localSheetId="2">\'을지\'!$A$1:$H$30</definedName>'
+        '<definedName name="InputRange">Input!$A$2:$A$100</definedName>'
+        '<definedName name="CoverTitle">갑지!$B$2</definedName>'
+        '</definedNames></workbook>'
+    )
+    workbook_rels = f'<Relationships xmlns="{PKG_REL}">' + "".join(
+        f'<Relationship Id="rId{index}" Type="{REL}/worksheet" Target="worksheets/sheet{index}.xml"/>'
+        for index in (1, 2, 3)
+    ) + (f'<Relationship Id="rId4" Type="{REL}/styles" Target="styles.xml"/>'
+         f'<Relationship Id="rId5" Type="{REL}/calcChain" Target="calcChain.xml"/>'
+         '</Relationships>')
+    overrides = "".join(
+        f'<Override PartName="/{part}" ContentType="{content_type}"/>' for part, content_type in [
+            ("xl/workbook.xml", "application/vnd.ms-excel.main+xml"),
+            ("xl/worksheets/sheet1.xml", "application/vnd.ms-excel.worksheet+xml"),
+            ("xl/worksheets/sheet2.xml", "application/vnd.ms-excel.worksheet+xml"),
+            ("xl/worksheets/sheet3.xml", "application/vnd.ms-excel.worksheet+xml"),
+            ("xl/drawings/drawing1.xml", "application/vnd.ms-excel.drawing+xml"),
+            ("xl/drawings/drawing2.xml", "application/vnd.ms-excel.drawing+xml"),
+            ("xl/comments1.xml", "application/vnd.ms-excel.comments+xml"),
+            ("xl/calcChain.xml", "application/vnd.ms-excel.calcChain+xml"),
+            ("docProps/app.xml", "application/vnd.ms-excel.extended-properties+xml"),
+        ]
+    )
+    app = (
+        '<Properties xmlns:vt="http://schemas.openxmlformats.org/officeDocument/2006/docPropsVTypes">'
+        '<HeadingPairs><vt:vector size="4" baseType="variant">'
+        '<vt:variant><vt:lpstr>Worksheets</vt:lpstr></vt:variant><vt:variant><vt:i4>3</vt:i4></vt:variant>'
+        '<vt:variant><vt:lpstr>Named Ranges</vt:lpstr></vt:variant><vt:variant><vt:i4>2</vt:i4></vt:variant>'
+        '</vt:vector></HeadingPairs>'
+        '<TitlesOfParts><vt:vector size="5" baseType="lpstr">'
+        '<vt:lpstr>Input</vt:lpstr><vt:lpstr>갑지</vt:lpstr><vt:lpstr>을지</vt:lpstr>'
+        '<vt:lpstr>Input!Print_Area</vt:lpstr><vt:lpstr>을지!Print_Area</vt:lpstr>'
+        '</vt:vector></TitlesOfParts></Properties>'
+    )
+    return {
+        "[Content_Types].xml": f'<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">{overrides}</Types>',
+        "_rels/.rels": (f'<Relationships xmlns="{PKG_REL}"><Relationship Id="rId1" '
+                        f'Type="{REL}/officeDocument" Target="xl/workbook.xml"/></Relationships>'),
+        "docProps/app.xml": app,
+        "xl/workbook.xml": workbook,
+        "xl/_rels/workbook.xml.rels": workbook_rels,
+        "xl/styles.xml": f'<styleSheet xmlns="{MAIN}"/>',
+        "xl/calcChain.xml": f'<calcChain xmlns="{MAIN}"><c r="A1" i="1"/></calcChain>',
+        "xl/worksheets/sheet1.xml": _sheet_xml("input", drawing=True),
+        "xl/worksheets/_rels/sheet1.xml.rels": (
+            f'<Relationships xmlns="{PKG_REL}">'
+            f'<Relationship Id="rId1" Type="{REL}/drawing" Target="../drawings/drawing1.xml"/>'
+            f'<Relationship Id="rId2" Type="{REL}/comments" Target="../comments1.xml"/>'
+            '</Relationships>'
+        ),
+        "xl/worksheets/sheet2.xml": _sheet_xml("cover", drawing=True),
+        "xl/worksheets/_rels/sheet2.xml.rels": (
+            f'<Relationships xmlns="{PKG_REL}">'
+            f'<Relationship Id="rId1" Type="{REL}/drawing" Target="../drawings/drawing2.xml"/>'
+            '</Relationships>'
+        ),
+        "xl/worksheets/sheet3.xml": _sheet_xml("detail"),
+        "xl/drawings/drawing1.xml": "<wsDr/>",
+        "xl/drawings/_rels/drawing1.xml.rels": (
+            f'<Relationships xmlns="{PKG_REL}">'
+            f'<Relationship Id="rId1" Type="{REL}/image" Target="../media/image1.png"/>'
+            f'<Relationship Id="rId2" Type="{REL}/image" Target="../media/shared.png"/>'
+            '</Relationships>'
+        ),
+        "xl/drawings/drawing2.xml": "<wsDr/>",
+        "xl/drawings/_rels/drawing2.xml.rels": _drawing_rels("shared.png"),
+        "xl/media/image1.png": b"\x89PNG-input-only",
+        "xl/media/shared.png": b"\x89PNG-shared",
+        "xl/comments1.xml": f'<comments xmlns="{MAIN}"/>',
+    }
+
+
+class _Unseekable(io.RawIOBase):
+    """zipfile이 데이터 디스크립터를 쓰도록 탐색할 수 없는 출력"""
+
+    def __init__(self):
+        self.buffer = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+
+def _build_workbook(data_descriptors=False):
+    output = _Unseekable() if data_descriptors else io.BytesIO()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _parts().items():
+            archive.writestr(name, content.encode("utf-8") if isinstance(content, str) else content)
+    return output.buffer.getvalue() if data_descriptors else output.getvalue()
+
+
+def _remove(data, sheet_name="Input"):
+    output = io.BytesIO()
+    plan = remove_sheet_from_bytes(data, output, sheet_name)
+    return plan, zipfile.ZipFile(io.BytesIO(output.getvalue()))
+
+
+def _text(archive, name):
+    return archive.read(name).decode("utf-8")
+
+
+def test_workbook_names_and_views_are_renumbered():
+    plan, result = _remove(_build_workbook())
+    assert plan["remaining_sheets"] == ["갑지", "을지"]
+
+    workbook = _text(result, "xl/workbook.xml")
+    assert re.findall(r'<sheet name="([^"]+)"', workbook) == ["갑지", "을지"]
+    # Input 로컬 이름과 Input 참조 전역 이름은 삭제, 을지(2 → 1) 로컬 이름은 번호 당김
+    assert re.findall(r'localSheetId="(\d+)"', workbook) == ["1"]
+    assert '<definedName name="_xlnm.Print_Area" localSheetId="1">\'을지\'!$A$1:$H$30</definedName>' in workbook
+    assert "InputRange" not in workbook
+    assert "CoverTitle" in workbook
+    assert '<workbookView activeTab="1" firstSheet="0"/>' in workbook
+
+
+def test_app_properties_counts_follow_removed_sheet():
+    _, result = _remove(_build_workbook())
+    app = _text(result, "docProps/app.xml")
+
+    assert re.findall(r"<vt:i4>(\d+)</vt:i4>", app) == ["2", "1"]
+    titles = re.search(r"<TitlesOfParts>(.*)</TitlesOfParts>", app).group(1)
+    assert 'size="3"' in titles
+    assert re.findall(r"<vt:lpstr>([^<]+)</vt:lpstr>", titles) == ["갑지", "을지", "을지!Print_Area"]
+
+
+def test_parts_only_used_by_removed_sheet_are_dropped():
+    plan, result = _remove(_build_workbook())
+    names = set(result.namelist())
+
+    for part in ["xl/worksheets/sheet1.xml", "xl/worksheets/_rels/sheet1.xml.rels",
+                 "xl/drawings/drawing1.xml", "xl/drawings/_rels/drawing1.xml.rels",
+                 "xl/media/image1.png", "xl/comments1.xml", "xl/calcChain.xml"]:
+        assert part not in names
+        assert part in plan["dropped"]
+    # 갑지 그림도 쓰는 이미지는 남음
+    assert "xl/media/shared.png" in names
+
+    content_types = _text(result, "[Content_Types].xml")
+    for part in ["sheet1.xml", "drawing1.xml", "comments1.xml", "calcChain.xml"]:
+        assert part not in content_types
+    assert "drawing2.xml" in content_types
+    assert "calcChain" not in _text(result, "xl/_rels/workbook.xml.rels")
+
+
+@pytest.mark.parametrize("data_descriptors", [False, True])
+def test_remaining_parts_are_copied_byte_for_byte(data_descriptors):
+    data = _build_workbook(data_descriptors)
+    source = zipfile.ZipFile(io.BytesIO(data))
+    if data_descriptors:
+        assert all(info.flag_bits & 0x08 for info in source.infolist())
+
+    plan, result = _remove(data)
+    assert result.testzip() is None
+    copied = [info for info in source.infolist()
+              if info.filename not in plan["dropped"] and info.filename not in plan["replaced"]]
+    assert {info.filename for info in copied} >= {
+        "xl/worksheets/sheet2.xml", "xl/worksheets/sheet3.xml", "xl/drawings/drawing2.xml",
+        "xl/media/shared.png", "xl/styles.xml",
+    }
+    for info in copied:
+        output_info = result.getinfo(info.filename)
+        assert (output_info.CRC, output_info.compress_size) == (info.CRC, info.compress_size)
+        assert result.read(info.filename) == source.read(info.filename)
+
+
+def test_keep_sheets_and_missing_sheet():
+    data = _build_workbook()
+
+    output = io.BytesIO()
+    plan = keep_sheets_in_bytes(data, output, ["갑지"])
+    assert (plan["remaining_sheets"], sorted(plan["removed_sheets"])) == (["갑지"], sorted(["Input", "을지"]))
+    workbook = _text(zipfile.ZipFile(io.BytesIO(output.getvalue())), "xl/workbook.xml")
+    assert "localSheetId" not in workbook
+    assert '<workbookView activeTab="0" firstSheet="0"/>' in workbook
+
+    # 없는 시트는 원본 그대로
+    plan, _ = _remove(data, "없는시트")
+    output = io.BytesIO()
+    remove_sheet_from_bytes(data, output, "없는시트")
+    assert plan["removed_sheet"] is False
+    assert output.getvalue() == data
+
+
+def test_removing_every_sheet_is_an_error():
+    with pytest.raises(ValueError, match="모든 시트가 제거"):
+        keep_sheets_in_bytes(_build_workbook(), io.BytesIO(), ["없는시트"])
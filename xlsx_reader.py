@@ -0,0 +1,601 @@
+"""
+openpyxl을 거치지 않고 .xlsx 파일의 시트 XML을 직접 읽는 경량 리더
+
+workbook.xml과 workbook.xml.rels로 시트 파트를 찾고, sharedStrings와
+styles(날짜 서식 판별용)만 추가로 읽은 뒤 시트 XML을 expat으로 한 행씩
+처리한다. 반환하는 행 튜플은 openpyxl의 iter_rows(values_only=True)와 같은
+값 형태(str, int, float, bool, datetime, None)를 가지므로 기존 파서의
+행 소스로 그대로 사용할 수 있다.
+"""
+
+import posixpath
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.parsers import expat
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+# 날짜/시간으로 해석되는 내장 서식 ID (27~36, 50~58은 한국어 로캘 날짜 서식)
+BUILTIN_DATE_FORMAT_IDS = frozenset(
+    list(range(14, 23)) + list(range(27, 37)) + list(range(45, 48)) + list(range(50, 59))
+)
+BUILTIN_TIME_FORMAT_IDS = frozenset([18, 19, 20, 21, 45, 46, 47])
+
+# 서식 코드에서 리터럴/색상/조건부 구간을 제거한 뒤 날짜 토큰이 있는지 확인
+_FORMAT_STRIP_RE = re.compile(r'"[^"]*"|\[[^\]]*\]|\\.|_.|\*.')
+_DATE_TOKEN_RE = re.compile(r"[dmyhs]", re.IGNORECASE)
+_CELL_REF_RE = re.compile(r"([A-Z]+)")
+_MERGE_CELLS_RE = re.compile(rb"<(?:\w+:)?mergeCells\b")
+_MERGE_CELL_REF_RE = re.compile(rb"<(?:\w+:)?mergeCell\b[^>]*?\bref=\"([^\"]+)\"")
+
+# 시트 XML을 expat에 넘기는 청크 크기
+PARSE_CHUNK_SIZE = 64 * 1024
+
+EPOCH_1900 = datetime(1899, 12, 30)
+EPOCH_1904 = datetime(1904, 1, 1)
+
+
+class _StopParsing(Exception):
+    """필요한 요소를 찾은 뒤 시트 XML 파싱을 멈추기 위한 내부 예외"""
+
+
+def _local(tag: str) -> str:
+    """네임스페이스를 제거한 태그 이름"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _column_index(cell_ref: str) -> int:
+    """셀 참조(예: 'AB12')를 0부터 시작하는 컬럼 인덱스로 변환"""
+    letters = _CELL_REF_RE.match(cell_ref).group(1)
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - 64)
+    return index - 1
+
+
+def _is_date_format_code(format_code: str) -> bool:
+    """사용자 정의 서식 코드가 날짜/시간 서식인지 판별"""
+    # 여러 구간이 있으면 첫 번째(양수) 구간만 검사
+    section = format_code.split(";", 1)[0]
+    section = _FORMAT_STRIP_RE.sub("", section)
+    return bool(_DATE_TOKEN_RE.search(section))
+
+
+def _is_time_format_code(format_code: str) -> bool:
+    """날짜 부분 없이 시간만 표시하는 서식인지 판별"""
+    section = _FORMAT_STRIP_RE.sub("", format_code.split(";", 1)[0]).lower()
+    return "d" not in section and "y" not in section and ("h" in section or "s" in section)
+
+
+def excel_serial_to_datetime(serial: float, date1904: bool = False) -> datetime:
+    """
+    Excel 시리얼 번호를 datetime으로 변환
+
+    1900 날짜 체계에서는 존재하지 않는 1900-02-29(시리얼 60) 이전 값을
+    하루 보정한다 (openpyxl.utils.datetime.from_excel과 동일).
+    """
+    if date1904:
+        return EPOCH_1904 + timedelta(days=serial)
+    if 0 < serial < 60:
+        serial += 1
+    return EPOCH_1900 + timedelta(days=serial)
+
+
+class XlsxPackage:
+    """
+    하나의 .xlsx 파일에 대한 시트 위치, 공유 문자열, 날짜 서식 정보
+
+    시트 XML은 iter_rows 호출 시점에 스트리밍으로 읽으며, 공유 문자열과
+    스타일은 처음 필요할 때 한 번만 로드한다. 경로 대신 이미 메모리에 읽은
+    바이트의 BytesIO를 넘기면 파일을 다시 열지 않는다.
+    """
+
+    def __init__(self, file_path: Union[str, BinaryIO]):
+        self.file_path = file_path
+        self.archive = zipfile.ZipFile(file_path)
+        self.date1904 = False
+        self.sheet_paths: Dict[str, str] = {}
+        self._shared_strings: Optional[List[str]] = None
+        self._date_styles: Optional[Dict[int, str]] = None
+        self._load_workbook()
+
+    def close(self) -> None:
+        self.archive.close()
+
+    def __enter__(self) -> "XlsxPackage":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def sheet_names(self) -> List[str]:
+        return list(self.sheet_paths.keys())
+
+    def _load_workbook(self) -> None:
+        """workbook.xml과 관계 파일에서 시트 이름 → 파트 경로 매핑 구성"""
+        rels_root = ET.fromstring(self.archive.read("xl/_rels/workbook.xml.rels"))
+        targets = {}
+        for rel in rels_root:
+            target = rel.get("Target", "")
+            if target.startswith("/"):
+                path = target.lstrip("/")
+            else:
+                path = posixpath.normpath(posixpath.join("xl", target))
+            targets[rel.get("Id")] = path
+
+        workbook_root = ET.fromstring(self.archive.read("xl/workbook.xml"))
+        for element in workbook_root.iter():
+            name = _local(element.tag)
+            if name == "workbookPr":
+                self.date1904 = element.get("date1904", "0").lower() in ("1", "true")
+            elif name == "sheet":
+                rel_id = element.get("{%s}id" % REL_NS)
+                if rel_id is None:
+                    # Strict OOXML 등 다른 네임스페이스의 r:id
+                    rel_id = next((v for k, v in element.attrib.items() if _local(k) == "id"), None)
+                if rel_id in targets:
+                    self.sheet_paths[element.get("name")] = targets[rel_id]
+
+    def sheet_signature(self, sheet_name: str) -> str:
+        """
+        시트 값을 결정하는 파트(시트, sharedStrings, styles)의 CRC-32와 날짜 체계로 만든 서명
+
+        zip 목록만 읽고 압축은 풀지 않으므로, 다른 시트만 고친 워크북인지 빠르게 확인할 수 있다.
+        """
+        if sheet_name not in self.sheet_paths:
+            raise ValueError(f"'{sheet_name}' 시트를 찾을 수 없습니다.")
+        crcs = []
+        for part in (self.sheet_paths[sheet_name], "xl/sharedStrings.xml", "xl/styles.xml"):
+            try:
+                crcs.append(f"{self.archive.getinfo(part).CRC:08x}")
+            except KeyError:
+                crcs.append("-")
+        crcs.append("1904" if self.date1904 else "1900")
+        return ":".join(crcs)
+
+    @property
+    def shared_strings(self) -> List[str]:
+        if self._shared_strings is None:
+            self._shared_strings = self._load_shared_strings()
+        return self._shared_strings
+
+    def _load_shared_strings(self) -> List[str]:
+        """sharedStrings.xml의 문자열 목록 (서식 run은 이어붙이고 윗주(rPh)는 제외)"""
+        if "xl/sharedStrings.xml" not in self.archive.namelist():
+            return []
+
+        strings = []
+        with self.archive.open("xl/sharedStrings.xml") as stream:
+            for _, element in ET.iterparse(stream, events=("end",)):
+                if _local(element.tag) != "si":
+                    continue
+                parts = []
+                for child in element:
+                    child_name = _local(child.tag)
+                    if child_name == "t":
+                        parts.append(child.text or "")
+                    elif child_name == "r":
+                        for run_part in child:
+                            if _local(run_part.tag) == "t":
+                                parts.append(run_part.text or "")
+                strings.append("".join(parts))
+                element.clear()
+        return strings
+
+    @property
+    def date_styles(self) -> Dict[int, str]:
+        """날짜 서식이 적용된 cellXfs 인덱스 → 'date' 또는 'time'"""
+        if self._date_styles is None:
+            self._date_styles = self._load_date_styles()
+        return self._date_styles
+
+    def _load_date_styles(self) -> Dict[int, str]:
+        if "xl/styles.xml" not in self.archive.namelist():
+            return {}
+
+        root = ET.fromstring(self.archive.read("xl/styles.xml"))
+        custom_formats = {}
+        cell_xfs = None
+        for child in root:
+            child_name = _local(child.tag)
+            if child_name == "numFmts":
+                for num_fmt in child:
+                    custom_formats[int(num_fmt.get("numFmtId"))] = num_fmt.get("formatCode", "")
+            elif child_name == "cellXfs":
+                cell_xfs = child
+
+        date_styles = {}
+        if cell_xfs is None:
+            return date_styles
+
+        for style_index, xf in enumerate(cell_xfs):
+            num_fmt_id = int(xf.get("numFmtId", "0"))
+            if num_fmt_id in custom_formats:
+                code = custom_formats[num_fmt_id]
+                if _is_date_format_code(code):
+                    date_styles[style_index] = "time" if _is_time_format_code(code) else "date"
+            elif num_fmt_id in BUILTIN_DATE_FORMAT_IDS:
+                date_styles[style_index] = "time" if num_fmt_id in BUILTIN_TIME_FORMAT_IDS else "date"
+        return date_styles
+
+    def iter_rows(self, sheet_name: str, min_row: int = 1,
+                  max_col: Optional[int] = None) -> Iterator[Tuple[Any, ...]]:
+        """
+        시트의 행을 값 튜플로 yield
+
+        시트 XML을 expat으로 청크 단위 파싱하며, 완성된 행만 잠시 버퍼에 담았다가
+        내보내므로 메모리 사용량은 행 수와 무관하게 일정하다.
+
+        Args:
+            sheet_name: 시트 이름
+            min_row: 읽기 시작할 행 번호 (1부터)
+            max_col: 지정하면 각 행을 이 컬럼 수로 자르거나 None으로 채움
+
+        Yields:
+            tuple: 행 값. 중간에 비어 있는 행은 빈 튜플(max_col 지정 시 None 튜플)로
+                   yield되어 행 번호가 유지된다.
+        """
+        if sheet_name not in self.sheet_paths:
+            raise ValueError(f"'{sheet_name}' 시트를 찾을 수 없습니다.")
+
+        shared_strings = self.shared_strings
+        date_styles = self.date_styles
+        date1904 = self.date1904
+        empty_row = (None,) * max_col if max_col else ()
+        column_cache: Dict[str, int] = {}
+
+        finished_rows: List[Tuple[int, Tuple[Any, ...]]] = []
+        row_values: List[Any] = []
+        text_parts: List[str] = []
+        # [행 번호, 다음 셀 컬럼, 셀 컬럼, 셀 타입, 셀 스타일, 셀 원시값, 텍스트 수집 중 여부]
+        state: List[Any] = [0, 0, 0, "n", None, None, False]
+
+        def start_element(name, attrs):
+            if ":" in name:
+                name = name.split(":", 1)[1]
+            if name == "c":
+                ref = attrs.get("r")
+                if ref:
+                    letters = ref.rstrip("0123456789")
+                    column = column_cache.get(letters)
+                    if column is None:
+                        column = column_cache[letters] = _column_index(letters)
+                else:
+                    column = state[1]
+                state[1] = column + 1
+                state[2] = column
+                state[3] = attrs.get("t", "n")
+                state[4] = attrs.get("s")
+                state[5] = None
+            elif name == "v" or name == "t":
+                text_parts.clear()
+                state[6] = True
+            elif name == "row":
+                state[0] = int(attrs.get("r", state[0] + 1))
+                state[1] = 0
+                row_values.clear()
+
+        def end_element(name):
+            if ":" in name:
+                name = name.split(":", 1)[1]
+            if name == "v" or name == "t":
+                # 인라인 문자열의 서식 run은 이어붙임
+                text = "".join(text_parts)
+                state[5] = text if state[5] is None or name == "v" else state[5] + text
+                state[6] = False
+            elif name == "c":
+                column = state[2]
+                raw = state[5]
+                if not raw or (max_col is not None and column >= max_col):
+                    return
+                cell_type = state[3]
+                if cell_type == "s":
+                    value = shared_strings[int(raw)]
+                elif cell_type in ("str", "inlineStr", "e"):
+                    value = raw
+                elif cell_type == "b":
+                    value = raw == "1"
+                elif cell_type == "d":
+                    value = datetime.fromisoformat(raw.rstrip("Z"))
+                else:
+                    value = float(raw) if ("." in raw or "E" in raw or "e" in raw) else int(raw)
+                    style = date_styles.get(int(state[4])) if state[4] else date_styles.get(0)
+                    if style is not None:
+                        converted = excel_serial_to_datetime(value, date1904)
+                        value = converted.time() if style == "time" and value < 1 else converted
+                if column >= len(row_values):
+                    row_values.extend([None] * (column - len(row_values) + 1))
+                row_values[column] = value
+            elif name == "row":
+                if max_col is not None and len(row_values) < max_col:
+                    row_values.extend([None] * (max_col - len(row_values)))
+                finished_rows.append((state[0], tuple(row_values)))
+
+        def character_data(data):
+            if state[6]:
+                text_parts.append(data)
+
+        parser = expat.ParserCreate()
+        parser.buffer_text = True
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+
+        next_row_number = 1
+        with self.archive.open(self.sheet_paths[sheet_name]) as stream:
+            while True:
+                chunk = stream.read(PARSE_CHUNK_SIZE)
+                parser.Parse(chunk, not chunk)
+                for row_number, values in finished_rows:
+                    if row_number >= min_row:
+                        # 누락된 행은 빈 행으로 채워 행 번호를 맞춤
+                        for _ in range(max(next_row_number, min_row), row_number):
+                            yield empty_row
+                        yield values
+                    next_row_number = row_number + 1
+                finished_rows.clear()
+                if not chunk:
+                    break
+
+    def sheet_summary(self, sheet_name: str) -> Dict[str, int]:
+        """
+        셀 값을 해석하지 않고 시트 XML만 훑어 크기와 병합 셀 수를 구함
+
+        max_row/max_column은 openpyxl의 worksheet.max_row/max_column과 같은 기준
+        (값이 없어도 <c> 요소가 있는 셀과 병합 범위를 포함, 셀이 없으면 1)이다.
+
+        Returns:
+            Dict: {"max_row", "max_column", "merged_cells"}
+        """
+        if sheet_name not in self.sheet_paths:
+            raise ValueError(f"'{sheet_name}' 시트를 찾을 수 없습니다.")
+
+        column_cache: Dict[str, int] = {}
+        # [현재 행, 다음 셀 컬럼, 최대 행, 최대 컬럼(0부터), 병합 셀 수]
+        state = [0, 0, 0, -1, 0]
+
+        def start_element(name, attrs):
+            if ":" in name:
+                name = name.split(":", 1)[1]
+            if name == "c":
+                ref = attrs.get("r")
+                if ref:
+                    letters = ref.rstrip("0123456789")
+                    column = column_cache.get(letters)
+                    if column is None:
+                        column = column_cache[letters] = _column_index(letters)
+                    row = int(ref[len(letters):]) if len(ref) > len(letters) else state[0]
+                else:
+                    column, row = state[1], state[0]
+                state[1] = column + 1
+                if row > state[2]:
+                    state[2] = row
+                if column > state[3]:
+                    state[3] = column
+            elif name == "row":
+                state[0] = int(attrs.get("r", state[0] + 1))
+                state[1] = 0
+            elif name == "mergeCell":
+                state[4] += 1
+                end_ref = attrs.get("ref", "").split(":")[-1].replace("$", "")
+                letters = end_ref.rstrip("0123456789")
+                if letters and len(end_ref) > len(letters):
+                    state[2] = max(state[2], int(end_ref[len(letters):]))
+                    state[3] = max(state[3], _column_index(letters))
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = start_element
+        with self.archive.open(self.sheet_paths[sheet_name]) as stream:
+            parser.ParseFile(stream)
+
+        return {
+            "max_row": max(state[2], 1),
+            "max_column": state[3] + 1 if state[3] >= 0 else 1,
+            "merged_cells": state[4]
+        }
+
+    def sheet_dimension(self, sheet_name: str) -> Optional[Tuple[int, int]]:
+        """
+        시트 XML 머리의 <dimension ref>에서 (마지막 행, 마지막 컬럼 수)를 읽음
+
+        sheetData 앞부분만 파싱하므로 시트 크기와 무관하다. dimension이 없으면 None.
+        """
+        if sheet_name not in self.sheet_paths:
+            raise ValueError(f"'{sheet_name}' 시트를 찾을 수 없습니다.")
+
+        found: List[str] = []
+
+        def start_element(name, attrs):
+            if ":" in name:
+                name = name.split(":", 1)[1]
+            if name == "dimension":
+                found.append(attrs.get("ref", ""))
+                raise _StopParsing()
+            if name == "sheetData":
+                raise _StopParsing()
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = start_element
+        with self.archive.open(self.sheet_paths[sheet_name]) as stream:
+            try:
+                while True:
+                    chunk = stream.read(PARSE_CHUNK_SIZE)
+                    parser.Parse(chunk, not chunk)
+                    if not chunk:
+                        break
+            except _StopParsing:
+                pass
+
+        if not found or not found[0]:
+            return None
+        end = found[0].split(":")[-1].replace("$", "")
+        letters = end.rstrip("0123456789")
+        if not letters or len(end) == len(letters):
+            return None
+        return int(end[len(letters):]), _column_index(letters) + 1
+
+    def sheet_extent(self, sheet_name: str) -> Dict[str, int]:
+        """
+        시트 XML 머리의 dimension과 mergeCells만으로 sheet_summary와 같은 형태의 정보 반환
+
+        max_row/max_column은 dimension 끝과 병합 범위 끝 중 큰 값이다. dimension이 없는
+        시트만 sheet_summary로 셀 위치를 훑는다.
+        """
+        dimension = self.sheet_dimension(sheet_name)
+        if dimension is None:
+            return self.sheet_summary(sheet_name)
+
+        max_row, max_column = dimension
+        merged_ranges = self.merged_ranges(sheet_name)
+        for merged_range in merged_ranges:
+            end = merged_range.split(":")[-1]
+            letters = end.rstrip("0123456789")
+            max_row = max(max_row, int(end[len(letters):]))
+            max_column = max(max_column, _column_index(letters) + 1)
+        return {"max_row": max_row, "max_column": max_column, "merged_cells": len(merged_ranges)}
+
+    def merged_ranges(self, sheet_name: str) -> List[str]:
+        """
+        시트의 병합 범위 참조 목록 (예: ["A1:D1"], XML 순서)
+
+        mergeCells는 sheetData 뒤에 있으므로 압축만 풀면서 위치를 찾고,
+        그 뒤 부분만 정규식으로 읽는다 (셀 XML은 파싱하지 않음).
+        """
+        if sheet_name not in self.sheet_paths:
+            raise ValueError(f"'{sheet_name}' 시트를 찾을 수 없습니다.")
+
+        tail: List[bytes] = []
+        carry = b""
+        with self.archive.open(self.sheet_paths[sheet_name]) as stream:
+            while True:
+                chunk = stream.read(PARSE_CHUNK_SIZE)
+                if not chunk:
+                    break
+                if tail:
+                    tail.append(chunk)
+                    continue
+                window = carry + chunk
+                match = _MERGE_CELLS_RE.search(window)
+                if match:
+                    tail.append(window[match.start():])
+                else:
+                    # 청크 경계에 걸친 태그를 놓치지 않도록 끝부분을 넘김
+                    carry = window[-64:]
+
+        refs = _MERGE_CELL_REF_RE.findall(b"".join(tail))
+        return [ref.decode("utf-8").replace("$", "") for ref in refs]
+
+    def style_histogram(self, sheet_name: str) -> Dict[int, int]:
+        """
+        값이 있는 셀의 스타일 인덱스(cellXfs, s 속성) → 셀 수
+
+        openpyxl의 cell.value is not None과 같은 기준으로 센다: <v> 값, 수식(<f>),
+        인라인 문자열이 있는 셀이며, 병합 범위에서 왼쪽 위가 아닌 셀은 제외한다
+        (openpyxl은 이 셀들을 값 없는 MergedCell로 바꿈). 셀 값은 해석하지 않는다.
+        """
+        # 병합 범위에 가려지는 셀: 행 → [(시작 컬럼, 끝 컬럼, 왼쪽 위 행 여부)]
+        hidden_rows: Dict[int, List[Tuple[int, int, bool]]] = {}
+        for ref in self.merged_ranges(sheet_name):
+            start, _, end = ref.partition(":")
+            end = end or start
+            start_letters = start.rstrip("0123456789")
+            end_letters = end.rstrip("0123456789")
+            min_row, max_row = int(start[len(start_letters):]), int(end[len(end_letters):])
+            min_col, max_col = _column_index(start_letters), _column_index(end_letters)
+            for row in range(min_row, max_row + 1):
+                hidden_rows.setdefault(row, []).append((min_col, max_col, row == min_row))
+
+        histogram: Counter = Counter()
+        column_cache: Dict[str, int] = {}
+        # [현재 행, 다음 셀 컬럼, 셀 행, 셀 컬럼, 셀 스타일, 값 있음, <v> 안인지]
+        state: List[Any] = [0, 0, 0, 0, 0, False, False]
+
+        def start_element(name, attrs):
+            if ":" in name:
+                name = name.split(":", 1)[1]
+            if name == "c":
+                ref = attrs.get("r")
+                if ref:
+                    letters = ref.rstrip("0123456789")
+                    column = column_cache.get(letters)
+                    if column is None:
+                        column = column_cache[letters] = _column_index(letters)
+                    state[2] = int(ref[len(letters):]) if len(ref) > len(letters) else state[0]
+                else:
+                    column = state[1]
+                    state[2] = state[0]
+                state[1] = column + 1
+                state[3] = column
+                style = attrs.get("s")
+                state[4] = int(style) if style else 0
+                state[5] = False
+            elif name == "v":
+                state[6] = True
+            elif name == "f" or name == "is":
+                state[5] = True
+            elif name == "row":
+                state[0] = int(attrs.get("r", state[0] + 1))
+                state[1] = 0
+
+        def end_element(name):
+            if ":" in name:
+                name = name.split(":", 1)[1]
+            if name == "v":
+                state[6] = False
+            elif name == "c" and state[5]:
+                hidden = hidden_rows.get(state[2])
+                if hidden:
+                    column = state[3]
+                    for min_col, max_col, anchor_row in hidden:
+                        if min_col <= column <= max_col and not (anchor_row and column == min_col):
+                            return
+                histogram[state[4]] += 1
+
+        def character_data(data):
+            if state[6] and data:
+                state[5] = True
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = character_data
+        with self.archive.open(self.sheet_paths[sheet_name]) as stream:
+            parser.ParseFile(stream)
+
+        return dict(histogram)
+
+def iter_sheet_rows(file_path: str, sheet_name: str, min_row: int = 1,
+                    max_col: Optional[int] = None) -> Iterator[Tuple[Any, ...]]:
+    """
+    .xlsx 파일의 시트를 openpyxl 없이 한 행씩 읽는 제너레이터
+
+    Args:
+        file_path: Excel 파일 경로
+        sheet_name: 읽을 시트 이름
+        min_row: 읽기 시작할 행 번호 (1부터)
+        max_col: 각 행의 컬럼 수 (지정 시 자르거나 None으로 채움)
+
+    Yields:
+        tuple: openpyxl iter_rows(values_only=True)와 같은 형태의 행 값.
+               단, 한국어 로캘 내장 날짜 서식(ID 27~36, 50~58)이 적용된 셀은
+               openpyxl과 달리 시리얼 번호가 아닌 datetime으로 반환한다.
+    """
+    with XlsxPackage(file_path) as package:
+        yield from package.iter_rows(sheet_name, min_row=min_row, max_col=max_col)
+
+
+def list_sheet_names(file_path: str) -> List[str]:
+    """workbook.xml에 정의된 순서대로 시트 이름 목록 반환"""
+    with XlsxPackage(file_path) as package:
+        return package.sheet_names
+
+
+def is_date1904(file_path: str) -> bool:
+    """워크북이 1904 날짜 체계를 사용하는지 여부 (workbook.xml의 workbookPr/@date1904)"""
+    with XlsxPackage(file_path) as package:
+        return package.date1904
@@ -0,0 +1,543 @@
+"""
+openpyxl을 거치지 않고 .xlsx 패키지(zip)에서 시트 하나를 제거
+
+워크북을 openpyxl로 읽고 다시 저장하면 셀 수에 비례하는 시간이 들고, openpyxl이
+다루지 않는 요소(도형, 조건부 서식 확장, 슬라이서 등)는 사라진다. 여기서는
+
+- xl/workbook.xml, xl/_rels/workbook.xml.rels, [Content_Types].xml, docProps/app.xml만
+  문자열 수준에서 고쳐 쓰고 (다른 네임스페이스 선언/접두사는 그대로 유지)
+- 제거할 시트 파트와 그 시트에서만 참조하던 파트(그림, 주석, 표, 인쇄 설정 등),
+  xl/calcChain.xml(제거된 시트의 셀을 가리키므로 Excel이 다시 만들도록 삭제)은 빼고
+- 나머지 zip 멤버는 압축된 바이트를 그대로 복사한다 (재압축 없음)
+
+따라서 처리 시간은 셀 수가 아니라 파일 크기에 비례하고, 남는 시트(갑지/을지 등)의
+파트는 원본과 바이트 단위로 같다. 같은 방식으로 지정한 시트만 남긴 워크북도 만든다
+(extract_sheets_to_xlsx, keep_sheets_in_bytes).
+"""
+
+import io
+import posixpath
+import re
+import struct
+import zipfile
+import zlib
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple
+from xml.sax.saxutils import unescape
+
+from atomic_write import atomic_output
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+APP_PROPERTIES_PART = "docProps/app.xml"
+CALC_CHAIN_TYPE_SUFFIX = "/calcChain"
+
+_XML_ENTITIES = {"&quot;": '"', "&apos;": "'"}
+
+_SHEET_RE = re.compile(r"<(?:\w+:)?sheet\b[^>]*?/>")
+_DEFINED_NAME_RE = re.compile(r"<((?:\w+:)?)definedName\b([^>]*)>(.*?)</\1definedName>", re.S)
+_DEFINED_NAMES_EMPTY_RE = re.compile(r"<((?:\w+:)?)definedNames\s*>\s*</\1definedNames>")
+_WORKBOOK_VIEW_RE = re.compile(r"<(?:\w+:)?workbookView\b[^>]*?/?>")
+_RELATIONSHIP_RE = re.compile(r"<(?:\w+:)?Relationship\b[^>]*?/>")
+_OVERRIDE_RE = re.compile(r"<(?:\w+:)?Override\b[^>]*?/>")
+_ATTR_RE = re.compile(r'([\w:]+)="([^"]*)"')
+
+_LOCAL_HEADER_SIGNATURE = 0x04034B50
+_DATA_DESCRIPTOR_SIGNATURE = 0x08074B50
+_LOCAL_HEADER_SIZE = 30
+_UTF8_NAME_FLAG = 0x800
+_DATA_DESCRIPTOR_FLAG = 0x08
+
+
+def _attrs(element: str) -> Dict[str, str]:
+    """요소 문자열의 속성 dict (접두사 포함 이름, 값은 XML 이스케이프 해제)"""
+    return {name: unescape(value, _XML_ENTITIES) for name, value in _ATTR_RE.findall(element)}
+
+
+def _attr_by_local_name(attrs: Dict[str, str], local_name: str) -> Optional[str]:
+    """접두사와 관계없이 로컬 이름으로 속성 값 조회 (예: r:id)"""
+    for name, value in attrs.items():
+        if name.rsplit(":", 1)[-1] == local_name and ":" in name:
+            return value
+    return None
+
+
+def _rels_path(part: str) -> str:
+    """파트의 관계(.rels) 파일 경로"""
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", name + ".rels")
+
+
+def _rels_source(rels_path: str) -> str:
+    """관계 파일이 속한 원본 파트 경로 (패키지 루트는 "")"""
+    directory, name = posixpath.split(rels_path)
+    return posixpath.join(posixpath.dirname(directory), name[:-len(".rels")])
+
+
+def _resolve_target(source_part: str, target: str) -> str:
+    """관계 Target을 패키지 내 파트 경로로 변환"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(source_part), target))
+
+
+def _parse_relationships(xml: str, source_part: str) -> List[Dict[str, str]]:
+    relationships = []
+    for element in _RELATIONSHIP_RE.findall(xml):
+        attrs = _attrs(element)
+        if attrs.get("TargetMode") == "External":
+            continue
+        relationships.append({
+            "id": attrs.get("Id", ""),
+            "type": attrs.get("Type", ""),
+            "target": _resolve_target(source_part, attrs.get("Target", "")),
+            "element": element
+        })
+    return relationships
+
+
+def _workbook_part(read_text) -> str:
+    """_rels/.rels에서 워크북 파트 경로 찾기"""
+    for relationship in _parse_relationships(read_text("_rels/.rels"), ""):
+        if relationship["type"].endswith("/officeDocument"):
+            return relationship["target"]
+    return "xl/workbook.xml"
+
+
+def _refers_to_sheet(formula: str, sheet_name: str) -> bool:
+    quoted = "'" + sheet_name.replace("'", "''") + "'!"
+    return quoted in formula or re.search(r"(?<![\w.'])" + re.escape(sheet_name) + "!", formula) is not None
+
+
+def rewrite_workbook_xml(xml: str, sheet_name: str) -> Tuple[str, Optional[str], List[str]]:
+    """
+    workbook.xml에서 시트 항목 제거
+
+    시트 로컬 이름/시트를 참조하는 이름 정의를 지우고, 뒤쪽 시트의 localSheetId와
+    workbookView의 activeTab/firstSheet를 한 칸씩 당긴다.
+
+    Returns:
+        Tuple: (수정된 XML, 제거된 시트의 관계 ID 또는 None, 남은 시트 이름 목록)
+    """
+    sheets = _SHEET_RE.findall(xml)
+    names = [_attrs(element).get("name") for element in sheets]
+    if sheet_name not in names:
+        return xml, None, names
+
+    index = names.index(sheet_name)
+    element = sheets[index]
+    relationship_id = _attr_by_local_name(_attrs(element), "id")
+    xml = xml.replace(element, "", 1)
+
+    def rewrite_defined_name(match):
+        attrs = _attrs(match.group(2))
+        local_sheet_id = attrs.get("localSheetId")
+        if local_sheet_id is not None:
+            local_sheet_id = int(local_sheet_id)
+            if local_sheet_id == index:
+                return ""
+            if local_sheet_id > index:
+                return match.group(0).replace(
+                    f'localSheetId="{local_sheet_id}"', f'localSheetId="{local_sheet_id - 1}"', 1
+                )
+        elif _refers_to_sheet(unescape(match.group(3), _XML_ENTITIES), sheet_name):
+            return ""
+        return match.group(0)
+
+    xml = _DEFINED_NAME_RE.sub(rewrite_defined_name, xml)
+    xml = _DEFINED_NAMES_EMPTY_RE.sub("", xml)
+
+    remaining_count = len(names) - 1
+
+    def rewrite_workbook_view(match):
+        view = match.group(0)
+        for attr in ("activeTab", "firstSheet"):
+            value = re.search(rf'\b{attr}="(\d+)"', view)
+            if value:
+                position = int(value.group(1))
+                if position > index or position >= remaining_count:
+                    position = max(0, position - 1)
+                view = view.replace(value.group(0), f'{attr}="{position}"', 1)
+        return view
+
+    xml = _WORKBOOK_VIEW_RE.sub(rewrite_workbook_view, xml)
+    return xml, relationship_id, names[:index] + names[index + 1:]
+
+
+def rewrite_content_types(xml: str, dropped_parts: Set[str]) -> str:
+    """[Content_Types].xml에서 삭제된 파트의 Override 제거"""
+    def keep(match):
+        part_name = _attrs(match.group(0)).get("PartName", "").lstrip("/")
+        return "" if part_name in dropped_parts else match.group(0)
+    return _OVERRIDE_RE.sub(keep, xml)
+
+
+def rewrite_app_properties(xml: str, sheet_name: str) -> str:
+    """
+    docProps/app.xml의 TitlesOfParts에서 시트 이름(과 그 시트의 이름 정의)을 빼고
+    HeadingPairs의 해당 그룹 개수를 줄인다.
+    """
+    titles_match = re.search(r"<TitlesOfParts>(.*?)</TitlesOfParts>", xml, re.S)
+    headings_match = re.search(r"<HeadingPairs>(.*?)</HeadingPairs>", xml, re.S)
+    if not titles_match or not headings_match:
+        return xml
+
+    title_re = re.compile(r"<(\w+:)?lpstr>(.*?)</\1lpstr>", re.S)
+    titles = list(title_re.finditer(titles_match.group(1)))
+    title_values = [unescape(match.group(2), _XML_ENTITIES) for match in titles]
+    removed = [
+        position for position, title in enumerate(title_values)
+        if title == sheet_name or title.startswith(sheet_name + "!")
+        or title.startswith("'" + sheet_name.replace("'", "''") + "'!")
+    ]
+    if not removed:
+        return xml
+
+    # HeadingPairs: (그룹 이름, 개수) 쌍이 TitlesOfParts를 앞에서부터 나눈다
+    headings = headings_match.group(1)
+    pair_re = re.compile(
+        r"(<(\w+:)?variant>\s*<\2lpstr>.*?</\2lpstr>\s*</\2variant>\s*"
+        r"<\2variant>\s*<\2i4>)(\d+)(</\2i4>\s*</\2variant>)", re.S
+    )
+    pairs = list(pair_re.finditer(headings))
+    counts = [int(pair.group(3)) for pair in pairs]
+    group_ends = []
+    total = 0
+    for count in counts:
+        total += count
+        group_ends.append(total)
+    for position in removed:
+        for group, end in enumerate(group_ends):
+            if position < end:
+                counts[group] -= 1
+                break
+
+    new_headings = headings
+    removed_pairs = 0
+    for pair, count in reversed(list(zip(pairs, counts))):
+        replacement = "" if count <= 0 else pair.group(1) + str(count) + pair.group(4)
+        removed_pairs += 1 if count <= 0 else 0
+        new_headings = new_headings[:pair.start()] + replacement + new_headings[pair.end():]
+    new_headings = _shrink_vector_size(new_headings, removed_pairs * 2)
+
+    new_titles = titles_match.group(1)
+    for position in reversed(removed):
+        match = titles[position]
+        new_titles = new_titles[:match.start()] + new_titles[match.end():]
+    new_titles = _shrink_vector_size(new_titles, len(removed))
+
+    xml = (xml[:headings_match.start(1)] + new_headings + xml[headings_match.end(1):titles_match.start(1)]
+           + new_titles + xml[titles_match.end(1):])
+    return xml
+
+
+def _shrink_vector_size(xml: str, amount: int) -> str:
+    if amount == 0:
+        return xml
+    return re.sub(r'(<(?:\w+:)?vector\b[^>]*\bsize=")(\d+)(")',
+                  lambda m: f"{m.group(1)}{int(m.group(2)) - amount}{m.group(3)}", xml, count=1)
+
+
+def plan_sheet_removal(archive: zipfile.ZipFile, sheet_name: str) -> Dict[str, Any]:
+    """
+    시트 제거에 필요한 파트 변경 내용 계산
+
+    Returns:
+        Dict: {"removed_sheet", "remaining_sheets", "replaced": {파트: bytes}, "dropped": set}
+    """
+    return _plan_removal(archive, [sheet_name])
+
+
+def plan_sheet_subset(archive: zipfile.ZipFile, keep_sheets: List[str]) -> Dict[str, Any]:
+    """
+    keep_sheets만 남기고 나머지 시트를 모두 제거하는 파트 변경 내용 계산
+
+    워크북에 없는 이름은 무시하며, 남는 시트가 없으면 ValueError.
+
+    Returns:
+        Dict: plan_sheet_removal과 같은 형태
+    """
+    workbook_part = _workbook_part(lambda name: archive.read(name).decode("utf-8"))
+    sheet_names = [
+        _attrs(element).get("name")
+        for element in _SHEET_RE.findall(archive.read(workbook_part).decode("utf-8"))
+    ]
+    keep = set(keep_sheets)
+    return _plan_removal(archive, [name for name in sheet_names if name not in keep])
+
+
+def _plan_removal(archive: zipfile.ZipFile, sheet_names: List[str]) -> Dict[str, Any]:
+    member_names = set(archive.namelist())
+
+    def read_text(name):
+        return archive.read(name).decode("utf-8")
+
+    workbook_part = _workbook_part(read_text)
+    workbook_rels_part = _rels_path(workbook_part)
+    workbook_xml = read_text(workbook_part)
+    relationship_ids = {}
+    remaining_sheets = [_attrs(element).get("name") for element in _SHEET_RE.findall(workbook_xml)]
+    for sheet_name in sheet_names:
+        workbook_xml, relationship_id, remaining_sheets = rewrite_workbook_xml(workbook_xml, sheet_name)
+        if relationship_id is not None:
+            relationship_ids[relationship_id] = sheet_name
+    if not relationship_ids:
+        return {"removed_sheet": False, "removed_sheets": [], "remaining_sheets": remaining_sheets,
+                "replaced": {}, "dropped": set()}
+    if not remaining_sheets:
+        raise ValueError("모든 시트가 제거되어 빈 엑셀 파일이 됩니다.")
+
+    # 모든 관계 파일의 (원본 파트 → 대상 파트) 수집
+    relationships_by_source = {}
+    for name in member_names:
+        if name.endswith(".rels"):
+            source = _rels_source(name)
+            relationships_by_source[source] = _parse_relationships(read_text(name), source)
+
+    workbook_rels_xml = read_text(workbook_rels_part)
+    sheet_parts = {}
+    calc_chain_parts = set()
+    for relationship in relationships_by_source.get(workbook_part, []):
+        if relationship["id"] in relationship_ids:
+            sheet_parts[relationship_ids[relationship["id"]]] = relationship["target"]
+            workbook_rels_xml = workbook_rels_xml.replace(relationship["element"], "", 1)
+        elif relationship["type"].endswith(CALC_CHAIN_TYPE_SUFFIX):
+            calc_chain_parts.add(relationship["target"])
+            workbook_rels_xml = workbook_rels_xml.replace(relationship["element"], "", 1)
+    for sheet_name in relationship_ids.values():
+        if sheet_name not in sheet_parts:
+            raise ValueError(f"시트 파트를 찾을 수 없습니다: {sheet_name}")
+
+    # 시트와, 삭제된 파트에서만 참조하던 파트를 차례로 삭제 대상에 추가
+    dropped = set(sheet_parts.values()) | calc_chain_parts
+    queue = list(sheet_parts.values())
+    while queue:
+        part = queue.pop(0)
+        for relationship in relationships_by_source.get(part, []):
+            target = relationship["target"]
+            if target in dropped or target not in member_names:
+                continue
+            still_referenced = any(
+                source not in dropped and any(r["target"] == target for r in relationships)
+                for source, relationships in relationships_by_source.items()
+            )
+            if not still_referenced:
+                dropped.add(target)
+                queue.append(target)
+    dropped |= {_rels_path(part) for part in dropped if _rels_path(part) in member_names}
+
+    replaced = {
+        workbook_part: workbook_xml.encode("utf-8"),
+        workbook_rels_part: workbook_rels_xml.encode("utf-8"),
+        CONTENT_TYPES_PART: rewrite_content_types(read_text(CONTENT_TYPES_PART), dropped).encode("utf-8"),
+    }
+    if APP_PROPERTIES_PART in member_names:
+        app_xml = read_text(APP_PROPERTIES_PART)
+        for sheet_name in relationship_ids.values():
+            app_xml = rewrite_app_properties(app_xml, sheet_name)
+        replaced[APP_PROPERTIES_PART] = app_xml.encode("utf-8")
+
+    return {
+        "removed_sheet": True,
+        "removed_sheets": list(relationship_ids.values()),
+        "remaining_sheets": remaining_sheets,
+        "replaced": replaced,
+        "dropped": dropped
+    }
+
+
+class _RawZipWriter:
+    """멤버를 원본 압축 바이트 그대로 복사하거나 새로 압축해 쓰는 최소 zip 작성기"""
+
+    def __init__(self, output: BinaryIO):
+        self.output = output
+        self.central_directory = []
+
+    def copy_raw(self, source: memoryview, info: zipfile.ZipInfo) -> None:
+        """원본 zip 바이트에서 로컬 헤더 + 압축 데이터(+ 데이터 디스크립터)를 그대로 복사"""
+        start = info.header_offset
+        header = source[start:start + _LOCAL_HEADER_SIZE]
+        signature, *_, name_length, extra_length = struct.unpack("<IHHHHHIIIHH", header)
+        if signature != _LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(f"잘못된 로컬 헤더: {info.filename}")
+
+        end = start + _LOCAL_HEADER_SIZE + name_length + extra_length + info.compress_size
+        if info.flag_bits & _DATA_DESCRIPTOR_FLAG:
+            descriptor_signature = struct.unpack("<I", source[end:end + 4])[0]
+            end += 16 if descriptor_signature == _DATA_DESCRIPTOR_SIGNATURE else 12
+        if end > len(source):
+            raise zipfile.BadZipFile(f"멤버 데이터가 잘렸습니다: {info.filename}")
+
+        offset = self.output.tell()
+        self.output.write(source[start:end])
+        self._add_central_entry(info, offset, info.flag_bits, info.compress_type,
+                                info.CRC, info.compress_size, info.file_size)
+
+    def write(self, info: zipfile.ZipInfo, data: bytes) -> None:
+        """새 내용으로 멤버 작성 (deflate)"""
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+        self.write_compressed(info, compressed, zlib.crc32(data) & 0xFFFFFFFF, len(data))
+
+    def write_compressed(self, info: zipfile.ZipInfo, compressed: bytes, crc: int, file_size: int) -> None:
+        """이미 raw deflate로 압축한 내용으로 멤버 작성"""
+        name = info.filename.encode("utf-8")
+        flags = _UTF8_NAME_FLAG if not info.filename.isascii() else 0
+        dos_time, dos_date = _dos_datetime(info.date_time)
+
+        offset = self.output.tell()
+        self.output.write(struct.pack(
+            "<IHHHHHIIIHH", _LOCAL_HEADER_SIGNATURE, 20, flags, zipfile.ZIP_DEFLATED,
+            dos_time, dos_date, crc, len(compressed), file_size, len(name), 0
+        ))
+        self.output.write(name)
+        self.output.write(compressed)
+        self._add_central_entry(info, offset, flags, zipfile.ZIP_DEFLATED,
+                                crc, len(compressed), file_size, extra=b"")
+
+    def _add_central_entry(self, info, offset, flags, compress_type, crc, compress_size, file_size,
+                           extra=None):
+        if offset > 0xFFFFFFFF or compress_size > 0xFFFFFFFF or file_size > 0xFFFFFFFF:
+            raise ValueError("ZIP64 크기의 워크북은 지원하지 않습니다.")
+        if flags & _UTF8_NAME_FLAG:
+            name = info.filename.encode("utf-8")
+        else:
+            name = info.filename.encode("cp437")
+        extra = info.extra if extra is None else extra
+        dos_time, dos_date = _dos_datetime(info.date_time)
+        self.central_directory.append(struct.pack(
+            "<IHHHHHHIIIHHHHHII", 0x02014B50,
+            info.create_version | (info.create_system << 8), max(info.extract_version, 20),
+            flags, compress_type, dos_time, dos_date, crc, compress_size, file_size,
+            len(name), len(extra), len(info.comment), 0, info.internal_attr, info.external_attr, offset
+        ) + name + extra + info.comment)
+
+    def close(self, comment: bytes = b"") -> None:
+        start = self.output.tell()
+        for entry in self.central_directory:
+            self.output.write(entry)
+        size = self.output.tell() - start
+        count = len(self.central_directory)
+        self.output.write(struct.pack(
+            "<IHHHHIIH", 0x06054B50, 0, 0, count, count, size, start, len(comment)
+        ) + comment)
+
+
+def _dos_datetime(date_time: Tuple[int, ...]) -> Tuple[int, int]:
+    year, month, day, hour, minute, second = date_time
+    dos_date = (max(year, 1980) - 1980) << 9 | month << 5 | day
+    dos_time = hour << 11 | minute << 5 | second // 2
+    return dos_time, dos_date
+
+
+def remove_sheet_from_bytes(data: bytes, output: BinaryIO, sheet_name: str = "Input",
+                            archive: Optional[zipfile.ZipFile] = None) -> Dict[str, Any]:
+    """
+    메모리에 읽어 둔 .xlsx 바이트에서 시트 하나를 제거하여 output에 기록
+
+    시트가 없으면 원본 바이트를 그대로 기록한다.
+
+    Args:
+        data: 원본 .xlsx 바이트
+        output: 결과를 쓸 바이너리 파일 객체
+        sheet_name: 제거할 시트명
+        archive: data를 이미 열어 둔 ZipFile (지정 시 zip 목록을 다시 읽지 않음)
+
+    Returns:
+        Dict: plan_sheet_removal 결과
+    """
+    if archive is None:
+        with zipfile.ZipFile(io.BytesIO(data)) as own_archive:
+            return remove_sheet_from_bytes(data, output, sheet_name, own_archive)
+
+    plan = plan_sheet_removal(archive, sheet_name)
+    _write_plan(data, archive, plan, output)
+    return plan
+
+
+def keep_sheets_in_bytes(data: bytes, output: BinaryIO, sheet_names: List[str],
+                         archive: Optional[zipfile.ZipFile] = None) -> Dict[str, Any]:
+    """
+    메모리에 읽어 둔 .xlsx 바이트에서 sheet_names만 남긴 워크북을 output에 기록
+
+    남는 시트의 파트와 그 시트가 참조하는 파트(그림, 주석 등), 공용 파트(styles, theme,
+    sharedStrings)는 압축된 바이트 그대로 복사한다. 같은 원본에서 여러 첨부 파일을
+    만들 때는 archive를 한 번 열어 넘기면 zip 목록을 다시 읽지 않는다.
+
+    Returns:
+        Dict: plan_sheet_subset 결과
+    """
+    if archive is None:
+        with zipfile.ZipFile(io.BytesIO(data)) as own_archive:
+            return keep_sheets_in_bytes(data, output, sheet_names, own_archive)
+
+    plan = plan_sheet_subset(archive, sheet_names)
+    _write_plan(data, archive, plan, output)
+    return plan
+
+
+def _write_plan(data: bytes, archive: zipfile.ZipFile, plan: Dict[str, Any], output: BinaryIO) -> None:
+    """계획대로 파트를 빼거나 바꾸고 나머지는 원본 바이트 그대로 복사"""
+    if not plan["removed_sheet"]:
+        output.write(data)
+        return
+
+    source = memoryview(data)
+    writer = _RawZipWriter(output)
+    for info in archive.infolist():
+        if info.filename in plan["dropped"]:
+            continue
+        if info.filename in plan["replaced"]:
+            writer.write(info, plan["replaced"][info.filename])
+        else:
+            writer.copy_raw(source, info)
+    writer.close(archive.comment)
+
+
+def remove_sheet_from_xlsx(source_path: str, target_path: str, sheet_name: str = "Input") -> Dict[str, Any]:
+    """
+    .xlsx 파일에서 시트 하나를 zip 수준에서 제거하여 target_path에 저장
+
+    원본을 한 번 읽어 메모리에서 처리하고, 결과는 임시 파일에 쓴 뒤 원자적으로
+    target_path를 교체한다 (실패 시 target_path는 그대로). 시트가 없으면 원본과
+    같은 내용을 저장한다.
+
+    Args:
+        source_path: 원본 엑셀 파일 경로
+        target_path: 결과 파일 경로
+        sheet_name: 제거할 시트명
+
+    Returns:
+        Dict: {"removed_sheet": bool, "remaining_sheets": [...], "dropped_parts": [...]}
+    """
+    # 원본은 한 번만 읽고, 결과는 임시 파일에 한 번 쓴 뒤 rename으로 게시
+    # (원본과 결과 경로가 같아도 안전)
+    with open(source_path, "rb") as source:
+        data = source.read()
+
+    with atomic_output(target_path) as output:
+        plan = remove_sheet_from_bytes(data, output, sheet_name)
+
+    return {
+        "removed_sheet": plan["removed_sheet"],
+        "remaining_sheets": plan["remaining_sheets"],
+        "dropped_parts": sorted(plan["dropped"])
+    }
+
+
+def extract_sheets_to_xlsx(source_path: str, target_path: str, sheet_names: List[str]) -> Dict[str, Any]:
+    """
+    .xlsx 파일에서 sheet_names만 남긴 워크북을 target_path에 저장 (원자적 교체)
+
+    Returns:
+        Dict: {"kept_sheets": [...], "removed_sheets": [...], "dropped_parts": [...]}
+    """
+    with open(source_path, "rb") as source:
+        data = source.read()
+
+    with atomic_output(target_path) as output:
+        plan = keep_sheets_in_bytes(data, output, sheet_names)
+
+    return {
+        "kept_sheets": plan["remaining_sheets"],
+        "removed_sheets": plan["removed_sheets"],
+        "dropped_parts": sorted(plan["dropped"])
+    }